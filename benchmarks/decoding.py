@@ -0,0 +1,72 @@
+"""
+Compare the decoding of a 10k records listing page with the previous stdlib path, both sides building UserData
+models with parsed dates
+
+    python -m benchmarks.decoding [records] [repeat]
+"""
+import json
+import sys
+import timeit
+from datetime import datetime
+from functools import partial
+from typing import Any
+
+import httpx
+
+from ctfdpy.ctfdpy.decoder import get_decoder
+from ctfdpy.ctfdpy.http import HTTPClient
+from ctfdpy.ctfdpy.models.data import UserData, decode_models
+
+
+def page(records: int) -> bytes:
+    return json.dumps({
+        "meta": {"pagination": {"page": 1, "next": None, "prev": None, "pages": 1, "per_page": records, "total": records}},
+        "success": True,
+        "data": [
+            {
+                "id": i,
+                "name": f"user{i}",
+                "email": f"user{i}@ctfd.io",
+                "country": "FR",
+                "affiliation": "CTFd",
+                "bracket_id": None,
+                "hidden": False,
+                "banned": False,
+                "verified": True,
+                "team_id": i // 4,
+                "created": "2024-03-20T12:34:56.123456+00:00",
+                "fields": [],
+            }
+            for i in range(records)
+        ],
+    }).encode()
+
+
+def legacy(response: httpx.Response) -> list[Any]:
+    # The previous path, parsing the dates as well so that both sides build the same models
+    data = response.json()
+    return [UserData(**{**user, "created": datetime.fromisoformat(user["created"])}) for user in data["data"]]
+
+
+def decode(http: HTTPClient, response: httpx.Response) -> list[UserData]:
+    return decode_models(UserData, http._parse_ctfd_response(response)["data"])
+
+
+def main(records: int = 10_000, repeat: int = 5) -> dict[str, float]:
+    response = httpx.Response(200, content=page(records), request=httpx.Request("GET", "http://localhost/users"))
+    results: dict[str, float] = {"legacy": min(timeit.repeat(lambda: legacy(response), number=1, repeat=repeat))}
+
+    for name in ("json", "orjson", "msgspec"):
+        try:
+            http = HTTPClient("http://localhost", "token", decoder=get_decoder(name))
+        except ImportError:
+            continue
+        results[name] = min(timeit.repeat(partial(decode, http, response), number=1, repeat=repeat))
+
+    for name, seconds in results.items():
+        print(f"{name:<8} {seconds * 1000:8.2f} ms")
+    return results
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,139 @@
+"""
+In-memory stand-in for the CTFd API served through httpx.MockTransport, with injectable latency, pagination and faults
+It backs both the benchmarks and the tests
+"""
+import asyncio
+import itertools
+import json
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+import httpx
+
+BASE_URL = "http://ctfd.local/api/v1"
+
+# Called with every request and its JSON body before it is answered, returning a response (or raising) to override it
+Fault = Callable[[httpx.Request, dict[str, Any]], httpx.Response | None]
+
+
+class MockCTFd:
+    def __init__(
+        self,
+        users: int = 0,
+        teams: int = 0,
+        per_page: int = 50,
+        latency: float = 0.0,
+        fault: Fault | None = None,
+    ) -> None:
+        """
+        Args:
+            users (int, optional): The number of users created up front. Defaults to 0.
+            teams (int, optional): The number of teams created up front. Defaults to 0.
+            per_page (int, optional): The default size of the listing pages. Defaults to 50.
+            latency (float, optional): The delay in seconds added to every response. Defaults to 0.0.
+            fault (Fault | None, optional): The hook overriding the answer of some requests (e.g. errors). Defaults to None.
+        """
+        self.per_page = per_page
+        self.latency = latency
+        self.fault = fault
+        self.requests = 0
+        self.log: list[tuple[str, str, dict[str, Any]]] = []
+        self.resources: dict[str, dict[int, dict[str, Any]]] = {"users": {}, "teams": {}}
+        self._ids = {resource: itertools.count(1) for resource in self.resources}
+        self._lock = threading.Lock()
+
+        created = "2024-03-20T12:34:56+00:00"
+        for i in range(users):
+            self.create("users", {"name": f"user{i}", "email": f"user{i}@ctfd.io", "country": "FR", "score": i % 500, "created": created})
+        for i in range(teams):
+            self.create("teams", {"name": f"team{i}", "score": i % 500, "created": created})
+
+    def create(self, resource: str, payload: dict[str, Any]) -> dict[str, Any]:
+        """Store an entity like a POST would, keeping its id when it has one"""
+        entities = self.resources[resource]
+        if "id" in payload:
+            entity = dict(payload)
+        else:
+            while (id := next(self._ids[resource])) in entities:
+                pass
+            entity = {"id": id, **payload}
+        if resource == "teams":
+            entity.setdefault("members", [])
+        entities[entity["id"]] = entity
+        return entity
+
+    def writes(self) -> list[tuple[str, str]]:
+        """The method and path of the requests that were not GET, in order"""
+        return [(method, path) for method, path, _ in self.log if method != "GET"]
+
+    def _list(self, resource: str, page: int, per_page: int) -> dict[str, Any]:
+        entities = list(self.resources[resource].values())
+        pages = max(1, -(-len(entities) // per_page))
+        return {
+            "success": True,
+            "data": entities[(page - 1) * per_page:page * per_page],
+            "meta": {"pagination": {
+                "page": page,
+                "next": page + 1 if page < pages else None,
+                "prev": page - 1 if page > 1 else None,
+                "pages": pages,
+                "per_page": per_page,
+                "total": len(entities),
+            }},
+        }
+
+    def route(self, request: httpx.Request) -> httpx.Response:
+        """Answer a request the way the CTFd API does, without any latency"""
+        path = request.url.path.removeprefix("/api/v1/").strip("/").split("/")
+        payload = json.loads(request.content) if request.content else {}
+        with self._lock:
+            self.requests += 1
+            self.log.append((request.method, "/".join(path), payload))
+        if self.fault is not None and (response := self.fault(request, payload)) is not None:
+            return response
+
+        resource = path[0]
+        if resource not in self.resources:
+            return httpx.Response(404, json={"message": "Not found"})
+
+        with self._lock:
+            entities = self.resources[resource]
+            if len(path) == 1 and request.method == "GET":
+                params = request.url.params
+                return httpx.Response(200, json=self._list(resource, int(params.get("page", 1)), int(params.get("per_page", self.per_page))))
+            if len(path) == 1 and request.method == "POST":
+                if any(entity["name"] == payload.get("name") for entity in entities.values()):
+                    return httpx.Response(400, json={"success": False, "errors": {"name": ["Name already taken"]}})
+                return httpx.Response(200, json={"success": True, "data": self.create(resource, payload)})
+
+            entity = entities.get(int(path[1]))
+            if entity is None:
+                return httpx.Response(404, json={"message": "Not found"})
+            if len(path) == 3 and path[2] == "members" and request.method == "POST":
+                entity["members"].append(payload["user_id"])
+                self.resources["users"][payload["user_id"]]["team_id"] = entity["id"]
+                return httpx.Response(200, json={"success": True, "data": entity["members"]})
+            if request.method == "PATCH":
+                entity.update(payload)
+            elif request.method == "DELETE":
+                del entities[entity["id"]]
+                return httpx.Response(200, json={"success": True})
+            return httpx.Response(200, json={"success": True, "data": entity})
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        if self.latency:
+            time.sleep(self.latency)
+        return self.route(request)
+
+    async def handle_async(self, request: httpx.Request) -> httpx.Response:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return self.route(request)
+
+    def transport(self) -> httpx.MockTransport:
+        return httpx.MockTransport(self.handle)
+
+    def async_transport(self) -> httpx.MockTransport:
+        return httpx.MockTransport(self.handle_async)
@@ -0,0 +1,114 @@
+"""
+Compare the memory held by the slotted models with the previous __dict__ based dataclasses, and the teams whose nested
+members are decoded up front with the ones decoded on first read
+
+    python -m benchmarks.models_memory [count]
+"""
+import sys
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime as dt
+from typing import Any
+
+from ctfdpy.ctfdpy.models.data import TeamData, UserData
+
+
+@dataclass
+class LegacyUserData:
+    id: int = 0
+    oauth_id: int = 0
+    name: str = ""
+    password: str = ""
+    email: str = ""
+    type: str = ""
+    secret: str = ""
+    website: str = ""
+    affiliation: str = ""
+    country: str = ""
+    bracket_id: int = 0
+    hidden: bool = True
+    banned: bool = False
+    verified: bool = True
+    language: str = ""
+    created: dt | None = None
+    fields: list = field(default_factory=list)
+    team_id: int = 0
+    place: int = 0
+    score: int = 0
+
+
+@dataclass
+class LegacyTeamData:
+    id: int = 0
+    oauth_id: int = 0
+    name: str = ""
+    password: str = ""
+    email: str = ""
+    secret: str = ""
+    members: list = field(default_factory=list)
+    website: str = ""
+    affiliation: str = ""
+    country: str = ""
+    bracket_id: int = 0
+    hidden: bool = True
+    banned: bool = False
+    captain_id: int = 0
+    captain: LegacyUserData = field(default_factory=LegacyUserData)
+    field_entries: list = field(default_factory=list)
+    fields: list = field(default_factory=list)
+    created: dt | None = None
+    place: int = 0
+    score: int = 0
+
+
+def user_payload(i: int) -> dict[str, Any]:
+    return {"id": i, "name": f"user{i}", "email": f"user{i}@ctfd.io", "country": "FR", "team_id": i // 4, "score": i % 500}
+
+
+def team_payload(i: int) -> dict[str, Any]:
+    return {"id": i, "name": f"team{i}", "members": [i * 4 + j for j in range(4)], "captain_id": i * 4, "score": i % 500}
+
+
+def nested_team_payload(i: int) -> dict[str, Any]:
+    members = [user_payload(i * 4 + j) for j in range(4)]
+    return {"id": i, "name": f"team{i}", "members": members, "captain_id": i * 4, "captain": members[0], "score": i % 500}
+
+
+def hydrated_team(payload: dict[str, Any]) -> TeamData:
+    team = TeamData.from_dict(payload)
+    team.get_members()
+    team.get_captain()
+    return team
+
+
+def measure(build: Callable[[dict[str, Any]], Any], payloads: list[dict[str, Any]]) -> int:
+    tracemalloc.start()
+    objects = [build(payload) for payload in payloads]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return size
+
+
+def main(count: int = 50_000) -> dict[str, int]:
+    users = [user_payload(i) for i in range(count)]
+    teams = [team_payload(i) for i in range(count // 4)]
+    nested_teams = [nested_team_payload(i) for i in range(count // 4)]
+
+    results = {
+        "legacy_users": measure(lambda payload: LegacyUserData(**payload), users),
+        "users": measure(lambda payload: UserData(**payload), users),
+        "legacy_teams": measure(lambda payload: LegacyTeamData(**payload), teams),
+        "teams": measure(lambda payload: TeamData(**payload), teams),
+        # Teams received with their member and captain payloads: decoded up front vs on first read
+        "nested_eager": measure(hydrated_team, nested_teams),
+        "nested_lazy": measure(TeamData.from_dict, nested_teams),
+    }
+    for name, size in results.items():
+        print(f"{name:<14} {size / 1024 / 1024:8.2f} MiB")
+    return results
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
@@ -0,0 +1,141 @@
+"""
+Offline benchmark suite run against the in-memory CTFd of benchmarks.mock_ctfd
+
+    python -m benchmarks.run [--latency 0.01] [--results benchmarks/results.jsonl] [--check 0.2]
+
+Every run is appended to the results file and compared with the previous one,
+--check makes the command fail when a benchmark got slower than the given ratio
+"""
+import argparse
+import asyncio
+import json
+import platform
+import subprocess
+import sys
+import time
+from collections.abc import Callable, Iterator
+from datetime import datetime, timezone
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+from ctfdpy.ctfdpy import CTFDClient, UserInput
+from ctfdpy.ctfdpy_async import AsyncCTFDClient
+
+from . import decoding, startup
+from .mock_ctfd import BASE_URL, MockCTFd
+
+
+def timed(func: Callable[[], Any], repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def bench_pagination(latency: float) -> dict[str, float]:
+    server = MockCTFd(users=2_000, per_page=50, latency=latency)
+    results: dict[str, float] = {}
+    for concurrency in (1, 8):
+        with CTFDClient(BASE_URL, "token", transport=server.transport(), concurrency=concurrency) as client:
+            results[f"get_items[concurrency={concurrency}]"] = timed(client.users.get_users)
+    return results
+
+
+def bench_async_pagination(latency: float) -> dict[str, float]:
+    server = MockCTFd(users=2_000, per_page=50, latency=latency)
+
+    async def get_users() -> None:
+        async with AsyncCTFDClient(BASE_URL, "token", transport=server.async_transport(), concurrency=8) as client:
+            await client.users.get_users()
+
+    return {"async_get_items[concurrency=8]": timed(lambda: asyncio.run(get_users()))}
+
+
+def create_team(client: CTFDClient, counter: Iterator[int], concurrency: int) -> None:
+    i = next(counter)
+    client.create_full_team(
+        f"team{i}",
+        "password",
+        [UserInput(f"user{i}-{j}", f"user{i}-{j}@ctfd.io", "password") for j in range(4)],
+        concurrency=concurrency,
+    )
+
+
+def bench_create_full_team(latency: float) -> dict[str, float]:
+    results: dict[str, float] = {}
+    for concurrency in (1, 8):
+        server = MockCTFd(latency=latency)
+        with CTFDClient(BASE_URL, "token", transport=server.transport()) as client:
+            results[f"create_full_team[concurrency={concurrency}]"] = timed(partial(create_team, client, iter(range(10**6)), concurrency))
+    return results
+
+
+def bench_decoding() -> dict[str, float]:
+    return {f"decode_10k[{name}]": seconds for name, seconds in decoding.main(10_000, 3).items()}
+
+
+def bench_startup() -> dict[str, float]:
+    return {f"startup[{name}]": seconds for name, seconds in startup.main(3).items()}
+
+
+def git_revision() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def previous_run(path: Path) -> dict[str, float]:
+    if not path.exists():
+        return {}
+    lines = path.read_text().splitlines()
+    return json.loads(lines[-1])["results"] if lines else {}
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--latency", type=float, default=0.005, help="latency in seconds added to every mocked response")
+    parser.add_argument("--results", type=Path, default=Path(__file__).with_name("results.jsonl"))
+    parser.add_argument("--check", type=float, default=None, help="fail when a benchmark is slower than the previous run by this ratio")
+    args = parser.parse_args(argv)
+
+    results: dict[str, float] = {}
+    results |= bench_pagination(args.latency)
+    results |= bench_async_pagination(args.latency)
+    results |= bench_create_full_team(args.latency)
+    results |= bench_decoding()
+    results |= bench_startup()
+
+    previous = previous_run(args.results)
+    regressions: list[str] = []
+    for name, seconds in results.items():
+        line = f"{name:<40} {seconds * 1000:10.2f} ms"
+        if (before := previous.get(name)) is not None:
+            ratio = seconds / before - 1
+            line += f" {ratio:+8.1%}"
+            if args.check is not None and ratio > args.check:
+                regressions.append(name)
+        print(line)
+
+    with args.results.open("a") as results_file:
+        results_file.write(json.dumps({
+            "date": datetime.now(timezone.utc).isoformat(),
+            "revision": git_revision(),
+            "python": platform.python_version(),
+            "latency": args.latency,
+            "results": results,
+        }) + "\n")
+
+    if regressions:
+        print(f"Regressions: {', '.join(regressions)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
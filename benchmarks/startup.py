@@ -0,0 +1,47 @@
+"""
+Measure the cold start of a one-shot script: importing ctfdpy, building the client and fetching a single user,
+every sample running in a fresh interpreter
+
+    python -m benchmarks.startup [repeat]
+"""
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+STAGES = {
+    "import": "import ctfdpy.ctfdpy",
+    "client": "from ctfdpy.ctfdpy import CTFDClient\nCTFDClient('http://ctfd.local/api/v1', 'token')",
+    "get_user": (
+        "from benchmarks.mock_ctfd import BASE_URL, MockCTFd\n"
+        "from ctfdpy.ctfdpy import CTFDClient\n"
+        "server = MockCTFd(users=1)\n"
+        "CTFDClient(BASE_URL, 'token', transport=server.transport()).users.get_user(1)"
+    ),
+}
+
+TEMPLATE = """\
+import time
+started = time.perf_counter()
+{code}
+print(time.perf_counter() - started)
+"""
+
+
+def sample(code: str) -> float:
+    output = subprocess.run(
+        [sys.executable, "-c", TEMPLATE.format(code=code)], cwd=ROOT, capture_output=True, text=True, check=True
+    ).stdout
+    return float(output.split()[-1])
+
+
+def main(repeat: int = 5) -> dict[str, float]:
+    results = {name: min(sample(code) for _ in range(repeat)) for name, code in STAGES.items()}
+    for name, seconds in results.items():
+        print(f"{name:<10} {seconds * 1000:8.2f} ms")
+    return results
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
@@ -0,0 +1,192 @@
+"""
+Columnar view of the users and teams listings, built straight from the page payloads for fast aggregations
+
+The integer columns are stored in NumPy arrays when NumPy is installed and in `array.array` otherwise,
+the text columns in lists
+"""
+import heapq
+from array import array
+from collections import Counter, defaultdict
+from collections.abc import Hashable, Iterable, Sequence
+from types import ModuleType
+from typing import Any
+
+INTEGER_FIELDS = frozenset(("id", "score", "place", "bracket_id", "team_id", "captain_id"))
+USER_FIELDS = ("id", "name", "score", "place", "country", "affiliation", "bracket_id", "team_id")
+TEAM_FIELDS = ("id", "name", "score", "place", "country", "affiliation", "bracket_id", "captain_id")
+
+
+def _numpy() -> ModuleType:
+    import numpy
+    return numpy
+
+
+BACKENDS = ("numpy", "array")
+
+
+def get_backend(backend: str | None = None) -> str:
+    """
+    Resolve the storage of the integer columns
+
+    Args:
+        backend (str | None, optional): "numpy", "array" or None to use NumPy when it is installed. Defaults to None.
+
+    Raises:
+        ValueError: The given backend is unknown
+        ImportError: NumPy was asked for but is not installed
+
+    Returns:
+        str: The name of the backend
+    """
+    if backend is not None:
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown columns backend {backend!r}, expected one of {', '.join(BACKENDS)}")
+        if backend == "numpy":
+            _numpy()
+        return backend
+    try:
+        _numpy()
+    except ImportError:
+        return "array"
+    return "numpy"
+
+
+class Columns:
+    """
+    One column per field of a listing, a missing or null value being stored as 0 or "" like in the models
+
+    The group-by helpers return plain dicts and `top_k` a new Columns holding the selected rows
+    """
+
+    def __init__(self, columns: dict[str, Any], backend: str) -> None:
+        self.columns = columns
+        self.backend = backend
+
+    @classmethod
+    def from_payloads(cls, payloads: list[dict[str, Any]], fields: Sequence[str] = USER_FIELDS, backend: str | None = None) -> "Columns":
+        """
+        Build the columns of a listing without building any model
+
+        Args:
+            payloads (list[dict[str, Any]]): The items of the listing
+            fields (Sequence[str], optional): The fields to keep. Defaults to USER_FIELDS.
+            backend (str | None, optional): The storage of the integer columns, see get_backend. Defaults to None.
+
+        Returns:
+            Columns: The columns of the listing
+        """
+        backend = get_backend(backend)
+        columns: dict[str, Any] = {}
+        for name in fields:
+            if name in INTEGER_FIELDS:
+                values = (payload.get(name) or 0 for payload in payloads)
+                if backend == "numpy":
+                    columns[name] = _numpy().fromiter(values, dtype="int64", count=len(payloads))
+                else:
+                    columns[name] = array("q", values)
+            else:
+                columns[name] = [payload.get(name) or "" for payload in payloads]
+        return cls(columns, backend)
+
+    def __len__(self) -> int:
+        return len(next(iter(self.columns.values()), ()))
+
+    def __getitem__(self, name: str) -> Any:
+        return self.columns[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.columns
+
+    def rows(self) -> Iterable[dict[str, Any]]:
+        """Iterate over the rows as dicts, mostly for display"""
+        names = list(self.columns)
+        for values in zip(*(self.columns[name] for name in names)):
+            yield {name: value.item() if hasattr(value, "item") else value for name, value in zip(names, values)}
+
+    def take(self, indices: Sequence[int]) -> "Columns":
+        """Return the given rows, in the given order"""
+        columns: dict[str, Any] = {}
+        for name, column in self.columns.items():
+            if self.backend == "numpy" and name in INTEGER_FIELDS:
+                columns[name] = column[_numpy().asarray(indices, dtype="int64")]
+            elif isinstance(column, array):
+                columns[name] = array("q", (column[index] for index in indices))
+            else:
+                columns[name] = [column[index] for index in indices]
+        return Columns(columns, self.backend)
+
+    def count_by(self, key: str) -> dict[Hashable, int]:
+        """
+        Count the rows of each value of a column (e.g. participants per country or bracket, team sizes with team_id)
+
+        Returns:
+            dict[Hashable, int]: The number of rows of each value, the most frequent first
+        """
+        column = self.columns[key]
+        if self.backend == "numpy" and key in INTEGER_FIELDS:
+            np = _numpy()
+            values, counts = np.unique(column, return_counts=True)
+            order = np.argsort(-counts, kind="stable")
+            return dict(zip(values[order].tolist(), counts[order].tolist()))
+        return dict(Counter(column).most_common())
+
+    def sum_by(self, key: str, value: str = "score") -> dict[Hashable, int]:
+        """Sum an integer column per value of another column (e.g. total score per country)"""
+        keys, values = self.columns[key], self.columns[value]
+        if self.backend == "numpy":
+            np = _numpy()
+            groups, inverse = np.unique(keys if key in INTEGER_FIELDS else np.asarray(keys, dtype=object), return_inverse=True)
+            weighted = np.bincount(inverse, weights=values, minlength=len(groups))
+            return dict(zip(groups.tolist(), weighted.astype("int64").tolist()))
+        totals: defaultdict[Hashable, int] = defaultdict(int)
+        for group, amount in zip(keys, values):
+            totals[group] += amount
+        return dict(totals)
+
+    def mean_by(self, key: str, value: str = "score") -> dict[Hashable, float]:
+        """Average an integer column per value of another column (e.g. mean score per bracket)"""
+        counts = self.count_by(key)
+        return {group: total / counts[group] for group, total in self.sum_by(key, value).items()}
+
+    def top_k(self, k: int, by: str = "score") -> "Columns":
+        """
+        Select the k rows with the highest values of an integer column, in decreasing order
+
+        Args:
+            k (int): The number of rows to keep
+            by (str, optional): The integer column to rank on. Defaults to "score".
+
+        Returns:
+            Columns: The selected rows
+        """
+        column = self.columns[by]
+        k = max(min(k, len(column)), 0)
+        if self.backend == "numpy":
+            np = _numpy()
+            if k == 0:
+                return self.take([])
+            candidates = np.argpartition(-column, k - 1)[:k]
+            indices = candidates[np.argsort(-column[candidates], kind="stable")]
+            return self.take(indices.tolist())
+        return self.take(heapq.nlargest(k, range(len(column)), key=column.__getitem__))
+
+    def histogram(self, value: str = "score", bins: int = 10) -> list[tuple[float, float, int]]:
+        """
+        Distribution of an integer column in equal-width bins
+
+        Returns:
+            list[tuple[float, float, int]]: The lower bound, the upper bound and the number of rows of each bin
+        """
+        column = self.columns[value]
+        if not len(column):
+            return []
+        low, high = (int(column.min()), int(column.max())) if self.backend == "numpy" else (min(column), max(column))
+        width = (high - low) / bins or 1
+        if self.backend == "numpy":
+            np = _numpy()
+            counts, edges = np.histogram(column, bins=bins, range=(low, low + width * bins))
+            return [(float(edges[i]), float(edges[i + 1]), int(counts[i])) for i in range(bins)]
+        counts = [0] * bins
+        for amount in column:
+            counts[min(int((amount - low) / width), bins - 1)] += 1
+        return [(low + width * i, low + width * (i + 1), counts[i]) for i in range(bins)]
@@ -0,0 +1,71 @@
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def collect_results(
+    futures: Iterable["Future[R]"],
+    raise_errors: bool = True,
+) -> tuple[list[R | None], list[Exception]]:
+    """
+    Wait for the given futures and gather their results in the order they were given
+
+    Args:
+        futures (Iterable[Future[R]]): The futures to wait for
+        raise_errors (bool, optional): Defines if the first error should be raised (If false will skip and returns them). Defaults to True.
+
+    Returns:
+        tuple[list[R | None], list[Exception]]: The result of each future (None for failed ones) and the list of all errors catched
+    """
+    results: list[R | None] = []
+    errors: list[Exception] = []
+    for future in futures:
+        try:
+            results.append(future.result())
+        except Exception as e:
+            if raise_errors:
+                raise
+            results.append(None)
+            errors.append(e)
+    return results, errors
+
+
+def run_batch(
+    func: Callable[[T], R | None],
+    items: Iterable[T],
+    concurrency: int = 1,
+    raise_errors: bool = True,
+) -> tuple[list[R | None], list[Exception]]:
+    """
+    Apply a blocking function to every item with a bounded pool of workers
+
+    Args:
+        func (Callable[[T], R | None]): The function to apply
+        items (Iterable[T]): The items to process
+        concurrency (int, optional): The maximum number of items processed at the same time. Defaults to 1.
+        raise_errors (bool, optional): Defines if the first error should be raised, cancelling the pending items (If false will skip and returns them). Defaults to True.
+
+    Returns:
+        tuple[list[R | None], list[Exception]]: The result of each item in input order (None for failed ones) and the list of all errors catched
+    """
+    if concurrency <= 1:
+        results: list[R | None] = []
+        errors: list[Exception] = []
+        for item in items:
+            try:
+                results.append(func(item))
+            except Exception as e:
+                if raise_errors:
+                    raise
+                results.append(None)
+                errors.append(e)
+        return results, errors
+
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+    try:
+        return collect_results([executor.submit(func, item) for item in items], raise_errors)
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
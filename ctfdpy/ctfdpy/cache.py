@@ -0,0 +1,179 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+
+class ResponseCache:
+    """
+    Size bounded LRU cache of parsed responses with a time to live per endpoint
+    Cached values are shared between callers and must be treated as read-only
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: float = 30.0,
+        ttls: dict[str, float] | None = None,
+    ) -> None:
+        """
+        Args:
+            maxsize (int, optional): The maximum number of responses kept, the least recently used ones being evicted first. Defaults to 1024.
+            ttl (float, optional): The default time to live of a response in seconds. Defaults to 30.0.
+            ttls (dict[str, float] | None, optional): The time to live of the responses of specific resources (e.g. {"users": 60}). Defaults to None.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.ttls = ttls or {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def resource(endpoint: str) -> str:
+        return endpoint.strip("/").split("/", 1)[0]
+
+    @staticmethod
+    def key(endpoint: str, params: dict[str, Any] | None = None) -> str:
+        endpoint = endpoint.strip("/")
+        if not params:
+            return endpoint
+        return endpoint + "?" + "&".join(f"{name}={value}" for name, value in sorted(params.items()))
+
+    def ttl_for(self, endpoint: str) -> float:
+        endpoint = endpoint.strip("/")
+        return self.ttls.get(endpoint, self.ttls.get(self.resource(endpoint), self.ttl))
+
+    def get(self, endpoint: str, params: dict[str, Any] | None = None) -> Any | None:
+        key = self.key(endpoint, params)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, endpoint: str, value: Any, params: dict[str, Any] | None = None) -> None:
+        if value is None:
+            return
+        ttl = self.ttl_for(endpoint)
+        if ttl <= 0:
+            return
+        key = self.key(endpoint, params)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, endpoint: str, json: dict[str, Any] | None = None) -> None:
+        """
+        Drop every cached response of the resource the endpoint belongs to (e.g. "teams/1/members" drops "teams" and "teams/1")
+        A membership change also drops the user it moved and the users listings, their team_id being modified
+
+        Args:
+            endpoint (str): The endpoint that was modified
+            json (dict[str, Any] | None, optional): The body of the request that modified it. Defaults to None.
+        """
+        endpoint = endpoint.strip("/")
+        resource = self.resource(endpoint)
+        users: set[str] = set()
+        if resource == "teams" and endpoint.endswith("/members") and (user_id := (json or {}).get("user_id")) is not None:
+            users = {"users", f"users/{user_id}"}
+        with self._lock:
+            for key in list(self._entries):
+                path = key.split("?", 1)[0]
+                if self.resource(path) == resource or path in users:
+                    del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions, "size": len(self._entries)}
+
+
+class ValidatorCache:
+    """
+    Size bounded LRU store of the ETag/Last-Modified validators of GET responses along with their parsed payload
+    It lets the HTTP clients send conditional requests and reuse the payload when the server answers 304 Not Modified
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        """
+        Args:
+            maxsize (int, optional): The maximum number of responses kept, the least recently used ones being evicted first. Defaults to 1024.
+        """
+        self.maxsize = maxsize
+        self.revalidated = 0
+        self.modified = 0
+        self._entries: OrderedDict[str, tuple[str | None, str | None, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def headers(self, endpoint: str, params: dict[str, Any] | None = None) -> dict[str, str] | None:
+        """
+        Build the conditional headers of a request from the validators of its last response
+
+        Returns:
+            dict[str, str] | None: The If-None-Match/If-Modified-Since headers, None if no validator is known
+        """
+        with self._lock:
+            entry = self._entries.get(ResponseCache.key(endpoint, params))
+        if entry is None:
+            return None
+
+        etag, last_modified, _ = entry
+        headers: dict[str, str] = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        return headers
+
+    def get(self, endpoint: str, params: dict[str, Any] | None = None) -> Any | None:
+        key = ResponseCache.key(endpoint, params)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            self.revalidated += 1
+            return entry[2]
+
+    def set(
+        self,
+        endpoint: str,
+        value: Any,
+        etag: str | None,
+        last_modified: str | None,
+        params: dict[str, Any] | None = None,
+    ) -> None:
+        key = ResponseCache.key(endpoint, params)
+        with self._lock:
+            self.modified += 1
+            if value is None or not (etag or last_modified):
+                self._entries.pop(key, None)
+                return
+            self._entries[key] = (etag, last_modified, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {"revalidated": self.revalidated, "modified": self.modified, "size": len(self._entries)}
@@ -1,20 +1,124 @@
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from .batch import collect_results
+from .challenges import Challenges
+from .exceptions import CreationError
 from .http import HTTPClient
-from .users import Users
+from .models.data import TeamData, UserData
+from .models.index import EntityIndex, TeamIndex
+from .models.inputs import TeamInput, UserInput
+from .reconcile import optional_fields
+from .scoreboard import Scoreboard
+from .submissions import Submissions
 from .teams import Teams
-from .models.inputs import UserInput
-from .models.data import TeamData
-from typing import Any
-from .exceptions import CreationError
+from .users import Users
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
 
 
 class CTFDClient:
-    def __init__(self, url: str, token: str) -> None:
-        self.http = HTTPClient(url, token)
-        self._generate_packages()
+    def __init__(self, url: str, token: str, **http_options: Any) -> None:
+        """
+        Args:
+            url (str): The base URL of the CTFd API
+            token (str): The admin token used to authenticate
+            http_options (Any): Additional options given to the HTTPClient (e.g. concurrency, http2, timeout, transport, client)
+        """
+        self.http = HTTPClient(url, token, **http_options)
+
+    @cached_property
+    def users(self) -> Users:
+        return Users(self.http)
+
+    @cached_property
+    def teams(self) -> Teams:
+        return Teams(self.http)
+
+    @cached_property
+    def challenges(self) -> Challenges:
+        return Challenges(self.http)
+
+    @cached_property
+    def submissions(self) -> Submissions:
+        return Submissions(self.http)
+
+    @cached_property
+    def scoreboard(self) -> Scoreboard:
+        return Scoreboard(self.http)
+
+    def __enter__(self) -> "Self":
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.http.close()
+
+    def _existing_entities(self) -> tuple[EntityIndex[UserData], TeamIndex]:
+        return self.users.get_users() or EntityIndex(), self.teams.get_teams() or TeamIndex()
+
+    def _update_team(self, id: int, fields: dict[str, Any]) -> TeamData | None:
+        team_data = self.http.patch_item("teams", id, fields)
+        return TeamData.from_dict(team_data) if team_data else None
+
+    def _submit_full_team(
+        self,
+        executor: Executor,
+        name: str,
+        password: str,
+        members: list[UserInput],
+        raise_errors: bool,
+        existing: tuple[EntityIndex[UserData], TeamIndex] | None = None,
+        fields: dict[str, Any] | None = None,
+    ) -> "Future[tuple[TeamData | None, list[Exception]]]":
+        """
+        Schedule the creation of a team, then of each of its members and their attachment, on the given executor
+        Every step only waits for the steps it depends on so the members of a team are provisioned concurrently
+
+        With the `existing` users and teams, the team and the users already on CTFd are reused instead of created
+        and the members already in the team are skipped. The optional `fields` of the team are sent along its creation,
+        or as an update of the existing team when they differ from it
+
+        Returns:
+            Future[tuple[TeamData | None, list[Exception]]]: The future of the final team data and of the errors catched for its members
+        """
+        users, teams = existing or (EntityIndex(), TeamIndex())
+        if (found := teams.by_name(name)) is not None:
+            diff = {key: value for key, value in (fields or {}).items() if getattr(found, key, None) != value}
+            if diff:
+                team_future = executor.submit(self._update_team, found.id, diff)
+            else:
+                team_future = Future()
+                team_future.set_result(found)
+        else:
+            team_future = executor.submit(self.teams.create_team, name, password, **(fields or {}))
+
+        def add_member(member: UserInput) -> None:
+            if team_future.exception() is not None or not (team := team_future.result()):
+                return
+            user = users.by_name(member.name) or users.by_email(member.email)
+            if user is not None and user.team_id == team.id:
+                return
+            if user is None:
+                user = self.users.create_user(member.name, member.email, member.password, **optional_fields(member))
+            if not user:
+                raise CreationError("No entity got returned", "user", member.name)
+            self.teams.attach_member(team.id, user.id)
+
+        member_futures = [executor.submit(add_member, member) for member in members]
+
+        def finalize() -> tuple[TeamData | None, list[Exception]]:
+            team = team_future.result()
+            if not team:
+                raise CreationError("No entity got returned", "team", name)
+            _, errors = collect_results(member_futures, raise_errors)
+            return self.teams.get_team(team.id), errors
 
-    def _generate_packages(self):
-        self.users = Users(self.http)
-        self.teams = Teams(self.http)
+        return executor.submit(finalize)
 
 
     def create_full_team(
@@ -23,7 +127,9 @@ class CTFDClient:
         password: str,
         members: list[UserInput],
         raise_errors: bool = False,
-        **kwargs: dict[str, Any]
+        concurrency: int | None = None,
+        reconcile: bool = False,
+        **kwargs: Any
     )-> tuple[TeamData | None, list[Exception]]:
         """
         Generate a complete team with the given parameters and its members already attached
@@ -33,7 +139,9 @@ class CTFDClient:
             password (str): The password of the team
             members (UserInput): A tuple of the users to attach to the team
             raise_errors (bool, optional): Defines if ctfdpy should raise errors (If false will skip and returns them). Defaults to False.
-            kwargs (dict[str, Any]): Additional parameters to pass to the team
+            concurrency (int | None, optional): The maximum number of requests sent at the same time. Defaults to the client concurrency.
+            reconcile (bool, optional): Defines if the existing team and users should be reused, only the missing ones being created and attached. Defaults to False.
+            kwargs (Any): Additional fields of the team (e.g. email, website, country, bracket_id)
 
         Raises:
             CreationError: The team could not be created
@@ -41,25 +149,48 @@ class CTFDClient:
         Returns:
             tuple[TeamData | None, list[Exception]]: The full data of the created team and the list of all errors catched during the process (only if raise_errors is set to False)
         """
-        team = self.teams.create_team(name, password)
-        if not team:
-            raise CreationError("No entity got returned", "team", name)
-
-        errors: list[Exception] = []
-        for member in members:
-            try:
-                new_member = self.users.create_user(member.name, member.email, member.password)
-                if not new_member:
-                    error = CreationError("No entity got returned", "user", member.name)
-                    if raise_errors:
-                        raise error
-                    errors.append(error)
-                    continue
+        executor = ThreadPoolExecutor(max_workers=max(concurrency or self.http.concurrency, 1))
+        try:
+            existing = self._existing_entities() if reconcile else None
+            return self._submit_full_team(executor, name, password, members, raise_errors, existing, kwargs).result()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def create_full_teams(
+        self,
+        *teams: tuple[TeamInput, list[UserInput]],
+        raise_errors: bool = False,
+        concurrency: int | None = None,
+        reconcile: bool = False,
+    ) -> list[tuple[TeamData | None, list[Exception]]]:
+        """
+        Generate several complete teams at once, every team and member being provisioned by a shared pool of workers
 
-                self.teams.attach_member(team.id, new_member.id)
-            except Exception as e:
-                if raise_errors:
-                    raise e
-                errors.append(e)
+        Args:
+            teams (tuple[TeamInput, list[UserInput]]): The teams to create along with their members
+            raise_errors (bool, optional): Defines if ctfdpy should raise errors (If false will skip and returns them). Defaults to False.
+            concurrency (int | None, optional): The maximum number of requests sent at the same time. Defaults to the client concurrency.
+            reconcile (bool, optional): Defines if the existing teams and users should be reused, only the missing ones being created and attached.
+                The users and teams are listed once for the whole job. Defaults to False.
 
-        return self.teams.get_team(team.id), errors
\ No newline at end of file
+        Returns:
+            list[tuple[TeamData | None, list[Exception]]]: For each team in input order, its full data and the list of all errors catched during its creation
+        """
+        executor = ThreadPoolExecutor(max_workers=max(concurrency or self.http.concurrency, 1))
+        try:
+            existing = self._existing_entities() if reconcile else None
+            futures = [
+                self._submit_full_team(executor, team.name, team.password, members, raise_errors, existing, optional_fields(team))
+                for team, members in teams
+            ]
+            results: list[tuple[TeamData | None, list[Exception]]] = []
+            for future in futures:
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    if raise_errors:
+                        raise
+                    results.append((None, [e]))
+            return results
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
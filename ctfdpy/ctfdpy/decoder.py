@@ -0,0 +1,56 @@
+import json
+from collections.abc import Callable
+from typing import Any
+
+JSONDecoder = Callable[[bytes], Any]
+
+
+def _stdlib_decoder() -> JSONDecoder:
+    return json.loads
+
+
+def _orjson_decoder() -> JSONDecoder:
+    import orjson  # type: ignore[import-not-found]
+    return orjson.loads
+
+
+def _msgspec_decoder() -> JSONDecoder:
+    import msgspec  # type: ignore[import-not-found]
+    return msgspec.json.Decoder().decode
+
+
+DECODERS: dict[str, Callable[[], JSONDecoder]] = {
+    "orjson": _orjson_decoder,
+    "msgspec": _msgspec_decoder,
+    "json": _stdlib_decoder,
+}
+
+
+def get_decoder(decoder: str | JSONDecoder | None = None) -> JSONDecoder:
+    """
+    Resolve the function used to decode the JSON body of the responses
+
+    Args:
+        decoder (str | JSONDecoder | None, optional): A decoding function, the name of a backend ("orjson", "msgspec" or "json") or None to use the fastest installed one. Defaults to None.
+
+    Raises:
+        ValueError: The given backend is unknown
+        ImportError: The given backend is not installed
+
+    Returns:
+        JSONDecoder: A function decoding raw bytes into Python objects, raising a ValueError on invalid documents
+    """
+    if callable(decoder):
+        return decoder
+
+    if decoder is not None:
+        if decoder not in DECODERS:
+            raise ValueError(f"Unknown JSON decoder {decoder!r}, expected one of {', '.join(DECODERS)}")
+        return DECODERS[decoder]()
+
+    for factory in DECODERS.values():
+        try:
+            return factory()
+        except ImportError:
+            continue
+    return _stdlib_decoder()
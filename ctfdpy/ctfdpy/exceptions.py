@@ -25,4 +25,15 @@ class CreationError(RequestError):
         self.name = name
 
     def __str__(self) -> str:
-        return f"Creation error raised for {self.entity} : {self.name}:\n{super().__str__()}"
\ No newline at end of file
+        return f"Creation error raised for {self.entity} : {self.name}:\n{super().__str__()}"
+
+class PaginationError(RequestError):
+    """Exception class to handle exceptions thrown for any page of a listing that could not be fetched"""
+    def __init__(self, message: str, failed_pages: dict[int, Exception], items: list) -> None:
+        super().__init__(message)
+        self.failed_pages = failed_pages
+        self.items = items
+
+    def __str__(self) -> str:
+        pages = ", ".join(str(page) for page in sorted(self.failed_pages))
+        return f"Pagination error raised for pages {pages}:\n{super().__str__()}"
\ No newline at end of file
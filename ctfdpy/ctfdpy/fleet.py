@@ -0,0 +1,163 @@
+"""
+Operate several CTFd instances at once: every instance has its own client (connection pool, cache, rate limiter)
+and an operation is fanned out to all of them concurrently, the failure of an instance not affecting the others
+"""
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+from .ctfd import CTFDClient
+from .models.data import TeamData, UserData
+from .models.inputs import UserInput
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+R = TypeVar("R")
+
+# Stateful options that would be shared between the instances if given as fleet defaults
+PER_INSTANCE_OPTIONS = ("cache", "validators", "rate_limiter", "client", "transport")
+
+
+@dataclass
+class FleetResult(Generic[R]):
+    """
+    Results of an operation fanned out to a fleet
+
+    Attributes:
+        results (dict[str, R]): The result of each instance that succeeded, by instance name
+        errors (dict[str, Exception]): The error of each instance that failed, by instance name
+    """
+    results: dict[str, R] = field(default_factory=dict)
+    errors: dict[str, Exception] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+    def __getitem__(self, name: str) -> R:
+        """Return the result of an instance, raising its error if it failed"""
+        if name in self.errors:
+            raise self.errors[name]
+        return self.results[name]
+
+
+def check_defaults(http_options: dict[str, Any]) -> None:
+    if shared := [name for name in PER_INSTANCE_OPTIONS if name in http_options]:
+        raise ValueError(f"{', '.join(shared)} must be given per instance so that the instances stay isolated")
+
+
+class Fleet:
+    def __init__(self, instances: dict[str, tuple[str, str]] | None = None, concurrency: int | None = None, **http_options: Any) -> None:
+        """
+        Args:
+            instances (dict[str, tuple[str, str]] | None, optional): The URL and admin token of each instance, by name. Defaults to None.
+            concurrency (int | None, optional): The maximum number of instances operated at the same time. Defaults to all of them.
+            http_options (Any): The options given to the client of every instance (e.g. timeout, retry, concurrency),
+                the stateful ones (cache, validators, rate_limiter, client, transport) having to be given per instance with `add`
+
+        Raises:
+            ValueError: A stateful option was given as a fleet default
+        """
+        check_defaults(http_options)
+        self.concurrency = concurrency
+        self.http_options = http_options
+        self.clients: dict[str, CTFDClient] = {}
+        for name, (url, token) in (instances or {}).items():
+            self.add(name, url, token)
+
+    def add(self, name: str, url: str, token: str, **http_options: Any) -> CTFDClient:
+        """
+        Add an instance to the fleet
+
+        Args:
+            name (str): The name of the instance, used as the key of the results
+            url (str): The base URL of its CTFd API
+            token (str): Its admin token
+            http_options (Any): The options of its client, overriding the fleet defaults
+
+        Raises:
+            ValueError: An instance with the same name is already in the fleet
+
+        Returns:
+            CTFDClient: The client of the instance
+        """
+        if name in self.clients:
+            raise ValueError(f"The fleet already has an instance named {name!r}")
+        client = self.clients[name] = CTFDClient(url, token, **(self.http_options | http_options))
+        return client
+
+    def remove(self, name: str) -> None:
+        self.clients.pop(name).close()
+
+    def __getitem__(self, name: str) -> CTFDClient:
+        return self.clients[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.clients)
+
+    def __len__(self) -> int:
+        return len(self.clients)
+
+    def __enter__(self) -> "Self":
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        for client in self.clients.values():
+            client.close()
+
+    def run(self, operation: Callable[[CTFDClient], R], names: Iterable[str] | None = None) -> FleetResult[R]:
+        """
+        Run an operation on every instance concurrently
+
+        Args:
+            operation (Callable[[CTFDClient], R]): The operation, called with the client of each instance
+            names (Iterable[str] | None, optional): The instances to run the operation on. Defaults to all of them.
+
+        Returns:
+            FleetResult[R]: The result or the error of each instance
+        """
+        clients = {name: self.clients[name] for name in (self.clients if names is None else names)}
+        result: FleetResult[R] = FleetResult()
+        if not clients:
+            return result
+
+        with ThreadPoolExecutor(max_workers=max(min(self.concurrency or len(clients), len(clients)), 1)) as executor:
+            futures = {name: executor.submit(operation, client) for name, client in clients.items()}
+            for name, future in futures.items():
+                try:
+                    result.results[name] = future.result()
+                except Exception as e:
+                    result.errors[name] = e
+        return result
+
+    def get_users(self, **filters: Any) -> FleetResult[Any]:
+        """Fetch the users of every instance, see Users.get_users"""
+        return self.run(lambda client: client.users.get_users(**filters))
+
+    def create_full_team(self, name: str, password: str, members: list[UserInput], **kwargs: Any) -> FleetResult[tuple[TeamData | None, list[Exception]]]:
+        """Provision the same team on every instance, see CTFDClient.create_full_team"""
+        return self.run(lambda client: client.create_full_team(name, password, members, **kwargs))
+
+    def ban_user(self, name: str) -> FleetResult[UserData | None]:
+        """
+        Ban the user with the given name on every instance, the instances without such a user returning None
+
+        Args:
+            name (str): The name of the user
+
+        Returns:
+            FleetResult[UserData | None]: The banned user of each instance
+        """
+        def ban(client: CTFDClient) -> UserData | None:
+            users = client.users.get_users(field="name", q=name)
+            user = next((user for user in users or [] if user.name == name), None)
+            if user is None:
+                return None
+            return client.users.update_user(user.id, banned=True)
+
+        return self.run(ban)
@@ -0,0 +1,197 @@
+import re
+import threading
+from bisect import bisect_left
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+_ID_SEGMENT = re.compile(r"(?<=/)\d+(?=/|$)")
+
+
+def endpoint_template(endpoint: str) -> str:
+    """Replace the ids of an endpoint by a placeholder so that the metrics of "teams/1" and "teams/2" are grouped"""
+    return _ID_SEGMENT.sub("{id}", endpoint.strip("/"))
+
+
+@dataclass(slots=True)
+class RequestEvent:
+    """Information about one attempt of a request, given to the hooks"""
+    method: str
+    endpoint: str
+    template: str
+    params: dict[str, Any] | None = None
+    attempt: int = 0
+    status_code: int | None = None
+    elapsed: float = 0.0
+    size: int = 0
+    error: Exception | None = None
+
+
+Hook = Callable[[RequestEvent], None]
+
+
+class Hooks:
+    """
+    Callbacks called by the HTTP clients around each request attempt
+    Exceptions raised by a callback are not catched and abort the request
+    """
+
+    def __init__(self) -> None:
+        self.on_request: list[Hook] = []
+        self.on_response: list[Hook] = []
+        self.on_error: list[Hook] = []
+
+    def add(self, collector: Any) -> Any:
+        """
+        Register every on_request/on_response/on_error method of the given object
+
+        Returns:
+            Any: The given collector
+        """
+        for name in ("on_request", "on_response", "on_error"):
+            if callable(callback := getattr(collector, name, None)):
+                getattr(self, name).append(callback)
+        return collector
+
+    def request(self, event: RequestEvent) -> None:
+        for hook in self.on_request:
+            hook(event)
+
+    def response(self, event: RequestEvent) -> None:
+        for hook in self.on_response:
+            hook(event)
+
+    def error(self, event: RequestEvent) -> None:
+        for hook in self.on_error:
+            hook(event)
+
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+@dataclass
+class EndpointStats:
+    buckets: tuple[float, ...]
+    count: int = 0
+    errors: int = 0
+    total_time: float = 0.0
+    max_time: float = 0.0
+    bytes: int = 0
+    statuses: dict[int, int] = field(default_factory=dict)
+    bucket_counts: list[int] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        self.bucket_counts = [0] * (len(self.buckets) + 1)
+
+    def quantile(self, q: float) -> float:
+        """Estimate a quantile of the latency as the upper bound of the bucket it falls in"""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.buckets, self.bucket_counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return self.max_time
+
+
+class LatencyCollector:
+    """In-memory latency histograms, payload sizes and status codes per method and endpoint template"""
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        self.buckets = buckets
+        self.stats: dict[tuple[str, str], EndpointStats] = {}
+        self._lock = threading.Lock()
+
+    def _stats(self, event: RequestEvent) -> EndpointStats:
+        key = (event.method, event.template)
+        if (stats := self.stats.get(key)) is None:
+            stats = self.stats[key] = EndpointStats(self.buckets)
+        return stats
+
+    def on_response(self, event: RequestEvent) -> None:
+        with self._lock:
+            stats = self._stats(event)
+            stats.count += 1
+            stats.total_time += event.elapsed
+            stats.max_time = max(stats.max_time, event.elapsed)
+            stats.bytes += event.size
+            stats.bucket_counts[bisect_left(self.buckets, event.elapsed)] += 1
+            if event.status_code is not None:
+                stats.statuses[event.status_code] = stats.statuses.get(event.status_code, 0) + 1
+
+    def on_error(self, event: RequestEvent) -> None:
+        with self._lock:
+            self._stats(event).errors += 1
+
+    def summary(self) -> dict[str, dict[str, Any]]:
+        """
+        Summarize the collected metrics, slowest endpoints first
+
+        Returns:
+            dict[str, dict[str, Any]]: The count, errors, mean/p50/p95/max latency and bytes of each "METHOD template"
+        """
+        with self._lock:
+            items = sorted(self.stats.items(), key=lambda item: item[1].total_time, reverse=True)
+            return {
+                f"{method} {template}": {
+                    "count": stats.count,
+                    "errors": stats.errors,
+                    "mean": stats.total_time / stats.count if stats.count else 0.0,
+                    "p50": stats.quantile(0.5),
+                    "p95": stats.quantile(0.95),
+                    "max": stats.max_time,
+                    "bytes": stats.bytes,
+                    "statuses": dict(stats.statuses),
+                }
+                for (method, template), stats in items
+            }
+
+
+class PrometheusCollector:
+    """Export the request metrics to prometheus_client, which has to be installed"""
+
+    def __init__(self, registry: Any = None, namespace: str = "ctfdpy") -> None:
+        from prometheus_client import REGISTRY, Counter, Histogram  # type: ignore[import-not-found]
+
+        registry = registry or REGISTRY
+        labels = ("method", "endpoint", "status")
+        self.latency = Histogram(
+            "request_duration_seconds", "Duration of the CTFd API requests", labels, namespace=namespace, registry=registry
+        )
+        self.size = Counter(
+            "response_bytes", "Bytes received from the CTFd API", labels, namespace=namespace, registry=registry
+        )
+        self.errors = Counter(
+            "request_errors", "CTFd API requests that failed without response", ("method", "endpoint"), namespace=namespace, registry=registry
+        )
+
+    def on_response(self, event: RequestEvent) -> None:
+        labels = (event.method, event.template, str(event.status_code))
+        self.latency.labels(*labels).observe(event.elapsed)
+        self.size.labels(*labels).inc(event.size)
+
+    def on_error(self, event: RequestEvent) -> None:
+        self.errors.labels(event.method, event.template).inc()
+
+
+class OpenTelemetryCollector:
+    """Export the request metrics to an OpenTelemetry meter, opentelemetry-api has to be installed"""
+
+    def __init__(self, meter: Any = None) -> None:
+        if meter is None:
+            from opentelemetry import metrics  # type: ignore[import-not-found]
+            meter = metrics.get_meter("ctfdpy")
+
+        self.latency = meter.create_histogram("ctfdpy.request.duration", unit="s", description="Duration of the CTFd API requests")
+        self.size = meter.create_counter("ctfdpy.response.size", unit="By", description="Bytes received from the CTFd API")
+        self.errors = meter.create_counter("ctfdpy.request.errors", description="CTFd API requests that failed without response")
+
+    def on_response(self, event: RequestEvent) -> None:
+        attributes = {"http.method": event.method, "ctfd.endpoint": event.template, "http.status_code": event.status_code or 0}
+        self.latency.record(event.elapsed, attributes)
+        self.size.add(event.size, attributes)
+
+    def on_error(self, event: RequestEvent) -> None:
+        self.errors.add(1, {"http.method": event.method, "ctfd.endpoint": event.template})
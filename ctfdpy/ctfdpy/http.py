@@ -1,12 +1,30 @@
-from enum import Enum
-from json import JSONDecodeError
-from typing import Any
-
-import httpx
+from __future__ import annotations
 
-from httpx import Response
-
-from .exceptions import RequestError, HTTPError, ParseRequestError
+import threading
+import time
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
+from typing import TYPE_CHECKING, Any
+
+from .cache import ResponseCache, ValidatorCache
+from .decoder import JSONDecoder, get_decoder
+from .exceptions import HTTPError, PaginationError, ParseRequestError, RequestError
+from .hooks import Hooks, RequestEvent, endpoint_template
+from .lazy import lazy_import
+from .pagination import Listing, PageCollector
+from .ratelimit import RetryMetrics, RetryPolicy, TokenBucket, parse_retry_after
+from .singleflight import SingleFlight
+from .streaming import StreamParser
+from .writes import PatchQueue
+
+if TYPE_CHECKING:
+    import httpx
+    from httpx import Response
+    from typing_extensions import Self
+else:
+    # httpx is only loaded when the first client is built
+    httpx = lazy_import("httpx")
 
 
 class HTTPMethod(Enum):
@@ -17,61 +35,93 @@ class HTTPMethod(Enum):
     HEAD = "HEAD"
 
 
-class HTTPClient:
+class BaseHTTPClient:
+    """Transport independent logic shared by the sync and async HTTP clients"""
+
     def __init__(
         self,
         url: str,
         token: str,
+        concurrency: int = 1,
+        cache: ResponseCache | None = None,
+        validators: ValidatorCache | None = None,
+        decoder: str | JSONDecoder | None = None,
+        retry: RetryPolicy | None = None,
+        rate_limiter: TokenBucket | None = None,
+        http2: bool = False,
+        timeout: float | httpx.Timeout | None = 5.0,
+        max_connections: int | None = 100,
+        max_keepalive_connections: int | None = 20,
+        keepalive_expiry: float | None = 5.0,
+        hooks: Hooks | None = None,
+        single_flight: bool = False,
     ) -> None:
-        self.client = httpx.Client(
-            base_url=url,
-            headers={
-                "Content-Type": "application/json",
-                "Accept": "application/json",
-                "Authorization": f"Token {token}",
-            },
-        )
-
-    def _call(
-        self,
-        endpoint: str,
-        method: HTTPMethod,
-        params: dict[str, Any] | None = None,
-        json: dict[str, Any] | None = None,
-    ) -> httpx.Response:
-        return self.client.request(method=method.value, url=endpoint, params=params, json=json)
-
-    def _request(
-        self,
-        endpoint: str,
-        method: HTTPMethod,
-        params: dict[str, Any] | None = None,
-        json: dict[str, Any] | None = None,
-    ) -> dict[str, Any] | None:
         """
-        Generate a request with the given information and by using token and base_url
-        Then returns the parsed response containing either the data or nothing
-
         Args:
-            endpoint (str): The endpoint to request
-            method (HTTPMethod): The HTTP method to use
-            params (dict[str, Any] | None, optional): The URL parameters to send with the request. Defaults to None.
-            json (dict[str, Any] | None, optional): The JSON data to send with the request. Defaults to None.
-
-        Raises:
-            RequestError: The httpx request could not be completed or ended with an unhandled error
+            url (str): The base URL of the CTFd API
+            token (str): The admin token used to authenticate
+            concurrency (int, optional): The maximum number of requests sent at the same time by bulk operations. Defaults to 1.
+            cache (ResponseCache | None, optional): The cache of the GET responses. Defaults to None.
+            validators (ValidatorCache | None, optional): The store of validators used to send conditional GET requests. Defaults to None.
+            decoder (str | JSONDecoder | None, optional): The JSON decoder or the name of its backend. Defaults to the fastest installed one.
+            retry (RetryPolicy | None, optional): The retry policy of failed requests. Defaults to None.
+            rate_limiter (TokenBucket | None, optional): The rate limiter to wait for before each request. Defaults to None.
+            http2 (bool, optional): Defines if HTTP/2 should be negotiated with the server. Defaults to False.
+            timeout (float | httpx.Timeout | None, optional): The timeout of the requests in seconds. Defaults to 5.0.
+            max_connections (int | None, optional): The maximum number of connections of the pool. Defaults to 100.
+            max_keepalive_connections (int | None, optional): The maximum number of idle connections kept alive. Defaults to 20.
+            keepalive_expiry (float | None, optional): The time in seconds an idle connection is kept alive. Defaults to 5.0.
+            hooks (Hooks | None, optional): The callbacks called around each request attempt. Defaults to None.
+            single_flight (bool, optional): Defines if concurrent identical GET requests and listings should share a single request and result. Defaults to False.
+        """
+        self.url = url
+        self.concurrency = concurrency
+        self.cache = cache
+        self.validators = validators
+        self.decode = get_decoder(decoder)
+        self.retry = retry
+        self.rate_limiter = rate_limiter
+        self.metrics = RetryMetrics()
+        self.http2 = http2
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.hooks = hooks
+        self.single_flight = single_flight
+        self._owns_client = True
+        self.headers = {
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+            "Authorization": f"Token {token}",
+        }
+
+    def _flight_key(self, endpoint: str, params: dict[str, Any] | None) -> str:
+        return ResponseCache.key(endpoint, params)
+
+    def _client_options(self) -> dict[str, Any]:
+        return {
+            "base_url": self.url,
+            "headers": self.headers,
+            "http2": self.http2,
+            "timeout": self.timeout,
+            "limits": httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+                keepalive_expiry=self.keepalive_expiry,
+            ),
+        }
+
+    def _target(self, endpoint: str, headers: dict[str, str] | None) -> tuple[str, dict[str, str] | None]:
+        """
+        Resolve the URL and headers of a request, a shared httpx client knowing neither the base URL nor the token
 
         Returns:
-            dict[str, Any] | None: The parsed response containing the data field if it exists
+            tuple[str, dict[str, str] | None]: The URL and the headers to give to the httpx client
         """
-        try:
-            return self._parse_ctfd_response(self._call(
-                endpoint, method, params, json
-            ))
-        except httpx.RequestError as request_exc:
-            raise RequestError(
-                f"An error occurred while requesting {request_exc.request.url!r}:\n{request_exc!r}"
-            )
+        if self._owns_client:
+            return endpoint, headers
+        return f"{self.url.rstrip('/')}/{endpoint.lstrip('/')}", self.headers | (headers or {})
 
     def _parse_ctfd_response(self, response: Response) -> dict[str, Any] | None:
         """
@@ -98,8 +148,8 @@ class HTTPClient:
 
         data: dict[str, Any] | None = None
         try:
-            data = response.json()
-        except (JSONDecodeError, TypeError) as decode_exc:
+            data = self.decode(response.content)
+        except (ValueError, TypeError) as decode_exc:
             raise ParseRequestError(f"The response could not be parsed:\n{decode_exc!r}")
 
         if not data:
@@ -122,46 +172,526 @@ class HTTPClient:
 
         raise RequestError("An unknown error occurred while processing the request")
 
+    def _hook_request(
+        self,
+        endpoint: str,
+        method: HTTPMethod,
+        params: dict[str, Any] | None,
+        attempt: int,
+    ) -> RequestEvent | None:
+        if self.hooks is None:
+            return None
+        event = RequestEvent(method.value, endpoint, endpoint_template(endpoint), params, attempt)
+        self.hooks.request(event)
+        return event
+
+    def _hook_response(self, event: RequestEvent | None, started: float, response: Response, size: int | None = None) -> None:
+        if event is None or self.hooks is None:
+            return
+        event.elapsed = time.perf_counter() - started
+        event.status_code = response.status_code
+        event.size = len(response.content) if size is None else size
+        self.hooks.response(event)
+
+    def _hook_error(self, event: RequestEvent | None, started: float, error: Exception) -> None:
+        if event is None or self.hooks is None:
+            return
+        event.elapsed = time.perf_counter() - started
+        event.error = error
+        self.hooks.error(event)
+
+    def _check_stream(self, endpoint: str, parser: StreamParser, response: Response) -> None:
+        """Raise the error of a streamed response once its body was parsed"""
+        parser.close()
+        if parser.fields.get("success", True):
+            return
+        if err := parser.fields.get("errors") or parser.fields.get("message"):
+            raise HTTPError(err, response.status_code)
+        raise RequestError(f"An unknown error occurred while streaming {endpoint}")
+
+    def _retry_delay(self, method: HTTPMethod, attempt: int, response: Response | None = None) -> float | None:
+        """
+        Decide if a request must be retried after a transport error (no response) or the given response
+        The rate limiter is also notified of the outcome so that it can adapt to the server
+
+        Args:
+            method (HTTPMethod): The HTTP method of the request
+            attempt (int): The number of the attempt that just ended, starting at 0
+            response (Response | None, optional): The response received if any. Defaults to None.
+
+        Returns:
+            float | None: The delay before the next attempt, None if the request must not be retried
+        """
+        retry_after: float | None = None
+        throttled = response is not None and response.status_code == 429
+        if response is not None:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if self.rate_limiter is not None:
+                if throttled:
+                    self.rate_limiter.on_throttled(retry_after)
+                elif response.status_code < 500:
+                    self.rate_limiter.on_success()
+
+        policy = self.retry
+        if policy is None or attempt >= policy.max_retries or method.value not in policy.methods:
+            return None
+        if response is not None and response.status_code not in policy.statuses:
+            return None
+
+        delay = policy.delay(attempt, retry_after)
+        self.metrics.record_retry(delay, throttled)
+        return delay
+
+    def _conditional_headers(
+        self,
+        endpoint: str,
+        method: HTTPMethod,
+        params: dict[str, Any] | None,
+    ) -> dict[str, str] | None:
+        if self.validators is None or method != HTTPMethod.GET:
+            return None
+        return self.validators.headers(endpoint, params)
+
+    def _parse_conditional_response(
+        self,
+        endpoint: str,
+        method: HTTPMethod,
+        params: dict[str, Any] | None,
+        response: Response,
+    ) -> dict[str, Any] | None:
+        """
+        Parse the response of a request that may have been sent with conditional headers
+        A 304 Not Modified reuses the payload parsed for the previous response, without any body to read or decode
+
+        Returns:
+            dict[str, Any] | None: The data field of the response if the request is successful
+        """
+        if self.validators is None or method != HTTPMethod.GET:
+            return self._parse_ctfd_response(response)
+
+        if response.status_code == 304 and (payload := self.validators.get(endpoint, params)) is not None:
+            return payload
+
+        data = self._parse_ctfd_response(response)
+        self.validators.set(
+            endpoint, data, response.headers.get("ETag"), response.headers.get("Last-Modified"), params
+        )
+        return data
+
+    def _cache_get(self, endpoint: str, params: dict[str, Any] | None = None) -> Any | None:
+        if self.cache is None:
+            return None
+        return self.cache.get(endpoint, params)
+
+    def _cache_set(self, endpoint: str, value: Any, params: dict[str, Any] | None = None) -> None:
+        if self.cache is not None:
+            self.cache.set(endpoint, value, params)
+
+    def _cache_invalidate(self, endpoint: str, json: dict[str, Any] | None = None) -> None:
+        if self.cache is not None:
+            self.cache.invalidate(endpoint, json)
+
     def _generate_cropped_dict(self, data: dict[str, Any], exclude_fields: list[str]) -> dict[str, Any]:
         if not exclude_fields:
             return data
         return {key: value for key, value in data.items() if key not in exclude_fields}
 
 
+class HTTPClient(BaseHTTPClient):
+    def __init__(
+        self,
+        url: str,
+        token: str,
+        transport: httpx.BaseTransport | None = None,
+        client: httpx.Client | None = None,
+        **options: Any,
+    ) -> None:
+        """
+        Args:
+            url (str): The base URL of the CTFd API
+            token (str): The admin token used to authenticate
+            transport (httpx.BaseTransport | None, optional): The transport of the httpx client (e.g. httpx.MockTransport). Defaults to None.
+            client (httpx.Client | None, optional): An httpx client shared with other clients, it is not closed with this one. Defaults to None.
+            options (Any): The options of BaseHTTPClient (concurrency, cache, retry, http2, timeout, ...)
+        """
+        super().__init__(url, token, **options)
+        self._client = client
+        self._transport = transport
+        self._client_lock = threading.Lock()
+        self._owns_client = client is None
+        self.flights = SingleFlight() if self.single_flight else None
+
+    @property
+    def client(self) -> httpx.Client:
+        """The httpx client, only built (and httpx loaded) when the first request is sent"""
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = httpx.Client(transport=self._transport, **self._client_options())
+        return self._client
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._owns_client and self._client is not None:
+            self._client.close()
+
+    def _call(
+        self,
+        endpoint: str,
+        method: HTTPMethod,
+        params: dict[str, Any] | None = None,
+        json: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        url, headers = self._target(endpoint, headers)
+        return self.client.request(method=method.value, url=url, params=params, json=json, headers=headers)
+
+    def _request(
+        self,
+        endpoint: str,
+        method: HTTPMethod,
+        params: dict[str, Any] | None = None,
+        json: dict[str, Any] | None = None,
+    ) -> dict[str, Any] | None:
+        """
+        Generate a request with the given information and by using token and base_url
+        Then returns the parsed response containing either the data or nothing
+
+        Args:
+            endpoint (str): The endpoint to request
+            method (HTTPMethod): The HTTP method to use
+            params (dict[str, Any] | None, optional): The URL parameters to send with the request. Defaults to None.
+            json (dict[str, Any] | None, optional): The JSON data to send with the request. Defaults to None.
+
+        The request is retried according to the retry policy and waits for the rate limiter if they are set
+        With single flight enabled, concurrent identical GET requests share the same request and result
+
+        Raises:
+            RequestError: The httpx request could not be completed or ended with an unhandled error
+
+        Returns:
+            dict[str, Any] | None: The parsed response containing the data field if it exists
+        """
+        if self.flights is not None and method == HTTPMethod.GET:
+            return self.flights.do(
+                self._flight_key(endpoint, params), lambda: self._send(endpoint, method, params, json)
+            )
+        return self._send(endpoint, method, params, json)
+
+    def _send(
+        self,
+        endpoint: str,
+        method: HTTPMethod,
+        params: dict[str, Any] | None = None,
+        json: dict[str, Any] | None = None,
+    ) -> dict[str, Any] | None:
+        self.metrics.record_request()
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                self.metrics.record_wait(self.rate_limiter.acquire())
+
+            event = self._hook_request(endpoint, method, params, attempt)
+            started = time.perf_counter()
+            try:
+                response = self._call(
+                    endpoint, method, params, json, headers=self._conditional_headers(endpoint, method, params)
+                )
+            except httpx.RequestError as request_exc:
+                self._hook_error(event, started, request_exc)
+                if (delay := self._retry_delay(method, attempt)) is None:
+                    raise RequestError(
+                        f"An error occurred while requesting {request_exc.request.url!r}:\n{request_exc!r}"
+                    )
+            else:
+                self._hook_response(event, started, response)
+                if (delay := self._retry_delay(method, attempt, response)) is None:
+                    return self._parse_conditional_response(endpoint, method, params, response)
+
+            time.sleep(delay)
+            attempt += 1
+
+    def get(self, endpoint: str, params: dict[str, Any] | None = None) -> dict[str, Any] | None:
+        """
+        Send a GET request bypassing the response cache, for the endpoints that have to stay fresh (conditional requests still apply)
+
+        Args:
+            endpoint (str): The endpoint to request
+            params (dict[str, Any] | None, optional): The URL parameters to send with the request. Defaults to None.
+
+        Returns:
+            dict[str, Any] | None: The parsed response, a listing being returned in the data field
+        """
+        return self._request(endpoint, HTTPMethod.GET, params=params)
+
     def get_item(self, endpoint: str, id: int) -> dict[str, Any] | None:
-        return self._request(f"{endpoint}/{id}", HTTPMethod.GET)
+        if (cached := self._cache_get(f"{endpoint}/{id}")) is not None:
+            return cached
 
-    def get_items(self, endpoint: str) -> list[dict[str, Any]] | None:
-        data = self._request(endpoint, HTTPMethod.GET)
+        data = self._request(f"{endpoint}/{id}", HTTPMethod.GET)
+        self._cache_set(f"{endpoint}/{id}", data)
+        return data
+
+    def get_page(self, endpoint: str, page: int, params: dict[str, Any] | None = None) -> dict[str, Any] | None:
+        """
+        Fetch a single page of a listing
+
+        Args:
+            endpoint (str): The endpoint of the listing
+            page (int): The page number
+            params (dict[str, Any] | None, optional): The query filters of the listing (e.g. field, q, per_page). Defaults to None.
+
+        Returns:
+            dict[str, Any] | None: The items of the page in the data field and the pagination in the meta field
+        """
+        return self._request(endpoint, HTTPMethod.GET, params={**(params or {}), "page": page})
+
+    def _get_page(self, endpoint: str, page: int, params: dict[str, Any] | None = None) -> list[dict[str, Any]]:
+        data = self._request(endpoint, HTTPMethod.GET, params={**(params or {}), "page": page})
         if not data:
+            return []
+        return data.get("data", [])
+
+    def _get_pages(
+        self,
+        endpoint: str,
+        pages: Sequence[int],
+        concurrency: int,
+        params: dict[str, Any] | None = None,
+    ) -> tuple[dict[int, dict[str, Any] | None], dict[int, Exception]]:
+        """
+        Fetch the given pages of a listing, at most `concurrency` of them at the same time
+
+        Args:
+            endpoint (str): The endpoint of the listing
+            pages (Sequence[int]): The page numbers to fetch
+            concurrency (int): The maximum number of pages requested at the same time
+            params (dict[str, Any] | None, optional): The query filters of the listing. Defaults to None.
+
+        Returns:
+            tuple[dict[int, dict[str, Any] | None], dict[int, Exception]]: The response of each fetched page (data and meta) and the error of each failed page
+        """
+        results: dict[int, dict[str, Any] | None] = {}
+        errors: dict[int, Exception] = {}
+
+        if concurrency <= 1 or len(pages) <= 1:
+            for page in pages:
+                try:
+                    results[page] = self.get_page(endpoint, page, params)
+                except Exception as e:
+                    errors[page] = e
+            return results, errors
+
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(pages))) as executor:
+            futures = {page: executor.submit(self.get_page, endpoint, page, params) for page in pages}
+            for page, future in futures.items():
+                try:
+                    results[page] = future.result()
+                except Exception as e:
+                    errors[page] = e
+        return results, errors
+
+    def get_items(
+        self,
+        endpoint: str,
+        concurrency: int | None = None,
+        params: dict[str, Any] | None = None,
+    ) -> list[dict[str, Any]] | None:
+        """
+        Fetch every page of a listing and return all of its items in page order
+
+        Args:
+            endpoint (str): The endpoint of the listing
+            concurrency (int | None, optional): The maximum number of pages requested at the same time. Defaults to the client concurrency.
+            params (dict[str, Any] | None, optional): The query filters sent with every page (e.g. field and q to search, per_page). Defaults to None.
+
+        Raises:
+            PaginationError: Some pages could not be fetched, the items of the other pages are kept in the error
+
+        Returns:
+            list[dict[str, Any]] | None: The items of every page of the listing
+        """
+        if self.flights is not None:
+            return self.flights.do(
+                self._flight_key(endpoint, {**(params or {}), "items": True}),
+                lambda: self._get_items(endpoint, concurrency, params),
+            )
+        return self._get_items(endpoint, concurrency, params)
+
+    def _get_items(
+        self,
+        endpoint: str,
+        concurrency: int | None = None,
+        params: dict[str, Any] | None = None,
+    ) -> list[dict[str, Any]] | None:
+        if (cached := self._cache_get(endpoint, params)) is not None:
+            return cached
+
+        listing = self.fetch_all(endpoint, concurrency, params)
+        if listing is None:
             return None
-        
-        res: list[dict[str, Any]] = data.get("data", [])
+        if listing.failed_pages:
+            raise PaginationError(
+                f"{len(listing.failed_pages)} page(s) of {endpoint} could not be fetched", listing.failed_pages, listing.items
+            )
+
+        self._cache_set(endpoint, listing.items, params)
+        return listing.items
+
+    def fetch_all(
+        self,
+        endpoint: str,
+        concurrency: int | None = None,
+        params: dict[str, Any] | None = None,
+        rounds: int = 2,
+    ) -> Listing | None:
+        """
+        Fetch every page of a listing as a consistent snapshot
+
+        After the pages are fetched concurrently, the failed ones are fetched again and, if some page reported
+        another page count or total than the first one (users registering during the listing), the first page is
+        fetched again and every page fetched against an outdated count is fetched again. The items are deduplicated by id.
+
+        Args:
+            endpoint (str): The endpoint of the listing
+            concurrency (int | None, optional): The maximum number of pages requested at the same time. Defaults to the client concurrency.
+            params (dict[str, Any] | None, optional): The query filters sent with every page. Defaults to None.
+            rounds (int, optional): The maximum number of additional rounds fetching the failed and outdated pages. Defaults to 2.
+
+        Returns:
+            Listing | None: The items of the listing along with the failed, refetched and duplicated pages and items
+        """
+        data = self._request(endpoint, HTTPMethod.GET, params=params)
+        if not data:
+            return None
+
+        collector = PageCollector(data)
+        concurrency = concurrency or self.concurrency
+        pages = collector.missing()
+        for step in range(rounds + 1):
+            if pages:
+                results, errors = self._get_pages(endpoint, pages, concurrency, params)
+                collector.update(results, errors)
+            if step == rounds:
+                break
+            if collector.drifted():
+                try:
+                    collector.rebase(self._request(endpoint, HTTPMethod.GET, params=params) or {})
+                except RequestError:
+                    break
+            if not (pages := collector.missing()):
+                break
+        return collector.result()
+
+    def iter_pages(self, endpoint: str, params: dict[str, Any] | None = None) -> Iterator[list[dict[str, Any]]]:
+        """
+        Yield the items of a listing page by page, the next page being prefetched while the current one is consumed
+
+        Args:
+            endpoint (str): The endpoint of the listing
+            params (dict[str, Any] | None, optional): The query filters sent with every page. Defaults to None.
+
+        Yields:
+            list[dict[str, Any]]: The items of each page of the listing, in page order
+        """
+        data = self._request(endpoint, HTTPMethod.GET, params=params)
+        if not data:
+            return
 
         try:
-            if data["meta"]["pagination"]["pages"] > 1:
-                for i in range(2, data["meta"]["pagination"]["pages"] + 1):
-                    try:
-                        new_rq = self._request(endpoint, HTTPMethod.GET, params={"page": i})
-                        if not new_rq:
-                            continue
-                    except Exception:
-                        continue
-
-                    res += new_rq.get("data", [])
+            pages: int = data["meta"]["pagination"]["pages"]
         except KeyError:
-            pass
+            pages = 1
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            next_page = executor.submit(self._get_page, endpoint, 2, params) if pages > 1 else None
+            yield data.get("data", [])
+
+            for page in range(2, pages + 1):
+                if next_page is None:
+                    break
+                items = next_page.result()
+                next_page = executor.submit(self._get_page, endpoint, page + 1, params) if page < pages else None
+                yield items
+
+    def iter_stream(self, endpoint: str, params: dict[str, Any] | None = None) -> Iterator[dict[str, Any]]:
+        """
+        Yield the items of a listing one by one while the pages are received, every page body being decoded
+        incrementally so that the memory held is per item instead of per page (useful with a large per_page)
+
+        The pages are requested one after the other and, the items being consumed while a page is received,
+        the requests are neither cached nor retried
+
+        Args:
+            endpoint (str): The endpoint of the listing
+            params (dict[str, Any] | None, optional): The query filters sent with every page. Defaults to None.
+
+        Raises:
+            RequestError: A page could not be received
+            ParseRequestError: A page body is not a valid CTFd response
 
-        return res
+        Yields:
+            dict[str, Any]: Each item of the listing, in page order
+        """
+        parser = StreamParser()
+        yield from self._stream(endpoint, params, parser)
+        for page in range(2, parser.pages + 1):
+            yield from self._stream(endpoint, {**(params or {}), "page": page}, StreamParser())
+
+    def _stream(self, endpoint: str, params: dict[str, Any] | None, parser: StreamParser) -> Iterator[dict[str, Any]]:
+        self.metrics.record_request()
+        if self.rate_limiter is not None:
+            self.metrics.record_wait(self.rate_limiter.acquire())
+
+        event = self._hook_request(endpoint, HTTPMethod.GET, params, 0)
+        started = time.perf_counter()
+        url, headers = self._target(endpoint, None)
+        try:
+            with self.client.stream(HTTPMethod.GET.value, url, params=params, headers=headers) as response:
+                for text in response.iter_text():
+                    yield from parser.feed(text)
+                self._hook_response(event, started, response, response.num_bytes_downloaded)
+                self._check_stream(endpoint, parser, response)
+        except httpx.RequestError as request_exc:
+            self._hook_error(event, started, request_exc)
+            raise RequestError(f"An error occurred while requesting {request_exc.request.url!r}:\n{request_exc!r}")
 
     def get_header(self, endpoint: str) -> dict[str, Any] | None:
         return self._request(endpoint, HTTPMethod.HEAD)
 
     def post_item(self, endpoint: str, json: dict[str, Any], exclude_fields: list[str] = []) -> dict[str, Any] | None:
-        return self._request(endpoint, HTTPMethod.POST, json=self._generate_cropped_dict(json, exclude_fields))
+        try:
+            return self._request(endpoint, HTTPMethod.POST, json=self._generate_cropped_dict(json, exclude_fields))
+        finally:
+            self._cache_invalidate(endpoint, json)
+
+    def patch_queue(self, max_pending: int = 100, max_delay: float | None = 0.5, concurrency: int | None = None) -> PatchQueue:
+        """
+        Build a write-behind queue merging the PATCH requests sent to the same entity, see PatchQueue
+
+        Args:
+            max_pending (int, optional): The number of pending entities triggering a flush. Defaults to 100.
+            max_delay (float | None, optional): The delay in seconds after which the pending operations are flushed. Defaults to 0.5.
+            concurrency (int | None, optional): The maximum number of requests sent at the same time by a flush. Defaults to the client concurrency.
+
+        Returns:
+            PatchQueue: The queue, to use as a context manager so that it is flushed on exit
+        """
+        return PatchQueue(self, max_pending, max_delay, concurrency)
 
     def patch_item(self, endpoint: str, id: int, json: dict[str, Any], exclude_fields: list[str] = []) -> dict[str, Any] | None:
-        return self._request(f"{endpoint}/{id}", HTTPMethod.PATCH, json=self._generate_cropped_dict(json, exclude_fields))
+        try:
+            return self._request(f"{endpoint}/{id}", HTTPMethod.PATCH, json=self._generate_cropped_dict(json, exclude_fields))
+        finally:
+            self._cache_invalidate(endpoint)
 
     def delete_item(self, endpoint: str, id: int) -> None:
-        self._request(f"{endpoint}/{id}", HTTPMethod.DELETE)
\ No newline at end of file
+        try:
+            self._request(f"{endpoint}/{id}", HTTPMethod.DELETE)
+        finally:
+            self._cache_invalidate(endpoint)
\ No newline at end of file
@@ -0,0 +1,34 @@
+"""
+Deferred imports of the heavy dependencies, so that importing ctfdpy stays cheap for short-lived scripts
+"""
+import importlib.util
+import sys
+from types import ModuleType
+
+
+def lazy_import(name: str) -> ModuleType:
+    """
+    Return the given module, its code being executed only on the first access to one of its attributes
+    A module already imported is returned as is
+
+    Args:
+        name (str): The absolute name of the module
+
+    Raises:
+        ImportError: The module is not installed
+
+    Returns:
+        ModuleType: The module, loaded on first use
+    """
+    if (module := sys.modules.get(name)) is not None:
+        return module
+
+    spec = importlib.util.find_spec(name)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"No module named {name!r}", name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
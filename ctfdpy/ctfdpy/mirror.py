@@ -0,0 +1,201 @@
+import json
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from .batch import run_batch
+from .exceptions import HTTPError
+from .models.data import TeamData, UserData
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+    from .ctfd import CTFDClient
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    id INTEGER PRIMARY KEY,
+    name TEXT,
+    email TEXT,
+    team_id INTEGER,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS users_name ON users (name);
+CREATE INDEX IF NOT EXISTS users_email ON users (email);
+CREATE INDEX IF NOT EXISTS users_team_id ON users (team_id);
+CREATE TABLE IF NOT EXISTS teams (
+    id INTEGER PRIMARY KEY,
+    name TEXT,
+    email TEXT,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS teams_name ON teams (name);
+CREATE INDEX IF NOT EXISTS teams_email ON teams (email);
+CREATE TABLE IF NOT EXISTS sync_state (
+    resource TEXT PRIMARY KEY,
+    per_page INTEGER NOT NULL,
+    synced_at REAL NOT NULL
+);
+"""
+
+# The indexed columns of each table, copied from the payload
+_COLUMNS: dict[str, tuple[str, ...]] = {
+    "users": ("id", "name", "email", "team_id"),
+    "teams": ("id", "name", "email"),
+}
+
+
+class Mirror:
+    """
+    Local SQLite copy of the users and teams of a CTFd instance, refreshed incrementally
+    Lookups by id, name, email or team are answered from the local indexes without any request
+    """
+    RESOURCES = ("users", "teams")
+
+    def __init__(self, client: "CTFDClient", path: str | Path = ":memory:") -> None:
+        """
+        Args:
+            client (CTFDClient): The client of the mirrored instance
+            path (str | Path, optional): The path of the SQLite database. Defaults to an in-memory database.
+        """
+        self.http = client.http
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "Self":
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.db.close()
+
+    def _check_resource(self, resource: str) -> None:
+        if resource not in self.RESOURCES:
+            raise ValueError(f"resource must be one of {', '.join(self.RESOURCES)}")
+
+    def _upsert(self, resource: str, entities: Iterable[dict[str, Any]]) -> int:
+        columns = _COLUMNS[resource]
+        rows: list[tuple[Any, ...]] = [
+            (*(entity.get(column) for column in columns), json.dumps(entity, default=str))
+            for entity in entities
+        ]
+        with self._lock, self.db:
+            self.db.executemany(
+                f"INSERT OR REPLACE INTO {resource} ({', '.join(columns)}, payload) VALUES ({', '.join('?' * (len(columns) + 1))})",
+                rows,
+            )
+        return len(rows)
+
+    def _delete(self, resource: str, ids: Iterable[int]) -> None:
+        with self._lock, self.db:
+            self.db.executemany(f"DELETE FROM {resource} WHERE id = ?", [(id,) for id in ids])
+
+    def _query(self, resource: str, where: str, *args: Any) -> list[dict[str, Any]]:
+        with self._lock:
+            rows = self.db.execute(f"SELECT payload FROM {resource} WHERE {where} ORDER BY id", args).fetchall()
+        return [json.loads(payload) for (payload,) in rows]
+
+    def _state(self, resource: str) -> tuple[int, int, int | None]:
+        """Return the number of mirrored entities, their highest id and the page size seen during the last sync"""
+        with self._lock:
+            count, high_water = self.db.execute(f"SELECT COUNT(*), COALESCE(MAX(id), 0) FROM {resource}").fetchone()
+            state = self.db.execute("SELECT per_page FROM sync_state WHERE resource = ?", (resource,)).fetchone()
+        return count, high_water, state[0] if state else None
+
+    def _fetch_page(self, resource: str, page: int) -> tuple[list[dict[str, Any]], int, int]:
+        data = self.http.get_page(resource, page) or {}
+        pagination = data.get("meta", {}).get("pagination", {})
+        items = data.get("data", [])
+        return items, pagination.get("pages", 1), pagination.get("per_page", len(items) or 1)
+
+    def sync(self, resource: str) -> int:
+        """
+        Fetch the entities created since the last sync: only the pages past the highest mirrored id are requested
+        The first page to read is estimated from the number of mirrored entities, then moved back while it
+        starts after the highest mirrored id (entities deleted on CTFd shift the following ones to earlier pages)
+        Changes and deletions of already mirrored entities are picked up by `refresh`
+
+        Args:
+            resource (str): "users" or "teams"
+
+        Returns:
+            int: The number of new entities mirrored
+        """
+        self._check_resource(resource)
+        count, high_water, per_page = self._state(resource)
+
+        page = max(1, -(-count // per_page)) if per_page and high_water else 1
+        items, pages, per_page = self._fetch_page(resource, page)
+        while page > 1 and (not items or items[0]["id"] > high_water):
+            page -= 1
+            items, pages, per_page = self._fetch_page(resource, page)
+
+        added = 0
+        while True:
+            added += self._upsert(resource, [item for item in items if item["id"] > high_water])
+            if page >= pages:
+                break
+            page += 1
+            items, pages, per_page = self._fetch_page(resource, page)
+
+        with self._lock, self.db:
+            self.db.execute(
+                "INSERT OR REPLACE INTO sync_state (resource, per_page, synced_at) VALUES (?, ?, ?)",
+                (resource, per_page, time.time()),
+            )
+        return added
+
+    def sync_all(self) -> dict[str, int]:
+        return {resource: self.sync(resource) for resource in self.RESOURCES}
+
+    def refresh(self, resource: str, *ids: int) -> int:
+        """
+        Re-fetch the given entities, known to have changed, and drop the ones deleted on CTFd
+        The entities are requested bypassing the response cache, which may still hold their previous version
+
+        Args:
+            resource (str): "users" or "teams"
+            ids (int): The ids of the entities to re-fetch
+
+        Returns:
+            int: The number of entities updated
+        """
+        self._check_resource(resource)
+
+        def fetch(id: int) -> dict[str, Any] | None:
+            try:
+                return self.http.get(f"{resource}/{id}")
+            except HTTPError as e:
+                if e.status_code == 404:
+                    return None
+                raise
+
+        entities, _ = run_batch(fetch, ids, self.http.concurrency)
+        self._delete(resource, [id for id, entity in zip(ids, entities) if entity is None])
+        return self._upsert(resource, [entity for entity in entities if entity is not None])
+
+    def get_user(self, id: int) -> UserData | None:
+        users = self._query("users", "id = ?", id)
+        return UserData.from_dict(users[0]) if users else None
+
+    def find_users(self, name: str | None = None, email: str | None = None, team_id: int | None = None) -> list[UserData]:
+        """Find the mirrored users matching every given criterion"""
+        criteria = {"name": name, "email": email, "team_id": team_id}
+        where = " AND ".join(f"{column} = ?" for column, value in criteria.items() if value is not None) or "1"
+        return [UserData.from_dict(user) for user in self._query("users", where, *(v for v in criteria.values() if v is not None))]
+
+    def get_team(self, id: int) -> TeamData | None:
+        teams = self._query("teams", "id = ?", id)
+        return TeamData.from_dict(teams[0]) if teams else None
+
+    def find_teams(self, name: str | None = None, email: str | None = None) -> list[TeamData]:
+        """Find the mirrored teams matching every given criterion"""
+        criteria = {"name": name, "email": email}
+        where = " AND ".join(f"{column} = ?" for column, value in criteria.items() if value is not None) or "1"
+        return [TeamData.from_dict(team) for team in self._query("teams", where, *(v for v in criteria.values() if v is not None))]
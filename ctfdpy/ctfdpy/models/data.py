@@ -1,7 +1,17 @@
-from dataclasses import dataclass, field
+from collections import namedtuple
+from collections.abc import Callable, Sequence
+from dataclasses import MISSING, dataclass, field
+from dataclasses import fields as dataclass_fields
 from datetime import datetime as dt
+from functools import cache
+from inspect import signature
+from typing import Any, TypeVar
 
-@dataclass
+from ..exceptions import ParseRequestError
+
+M = TypeVar("M")
+
+@dataclass(slots=True)
 class UserData:
     id: int = 0
     oauth_id: int = 0
@@ -24,16 +34,25 @@ class UserData:
     place: int = 0
     score: int = 0
 
+    @classmethod
+    def from_dict(cls, payload: dict[str, Any]) -> "UserData":
+        """Build the model from a CTFd payload, ignoring unknown fields and parsing dates"""
+        return model_decoder(cls)(payload)
 
-@dataclass
+
+@dataclass(slots=True)
 class TeamData:
+    """
+    The nested `members` and `captain` are kept as received and only decoded into UserData when read through
+    `get_members` and `get_captain`, no default captain being allocated for the teams that have none
+    """
     id: int = 0
     oauth_id: int = 0
     name: str = ""
     password: str = ""
     email: str = ""
     secret: str = ""
-    members: list[UserData] = field(default_factory=list)
+    members: list[Any] | None = None
     website: str = ""
     affiliation: str = ""
     country: str = ""
@@ -41,9 +60,210 @@ class TeamData:
     hidden: bool = True
     banned: bool = False
     captain_id: int = 0
-    captain: UserData = field(default_factory=UserData)
+    captain: UserData | dict[str, Any] | None = None
     field_entries: list = field(default_factory=list)
     fields: list = field(default_factory=list)
     created: dt | None = None
     place: int = 0
-    score: int = 0
\ No newline at end of file
+    score: int = 0
+
+    @classmethod
+    def from_dict(cls, payload: dict[str, Any]) -> "TeamData":
+        """Build the model from a CTFd payload, ignoring unknown fields and parsing dates"""
+        return model_decoder(cls)(payload)
+
+    def get_members(self) -> list[UserData | int]:
+        """
+        Returns:
+            list[UserData | int]: The members of the team, the payloads being decoded into UserData on the first read
+                and the member ids being kept as is
+        """
+        members = self.members
+        if members is None:
+            members = self.members = []
+        elif any(isinstance(member, dict) for member in members):
+            members = self.members = [UserData.from_dict(member) if isinstance(member, dict) else member for member in members]
+        return members
+
+    def get_captain(self) -> UserData | None:
+        """
+        Returns:
+            UserData | None: The captain of the team, its payload being decoded into UserData on the first read
+        """
+        captain = self.captain
+        if isinstance(captain, dict):
+            captain = self.captain = UserData.from_dict(captain)
+        return captain
+
+
+@dataclass(slots=True)
+class ChallengeData:
+    id: int = 0
+    name: str = ""
+    description: str = ""
+    connection_info: str | None = None
+    next_id: int | None = None
+    max_attempts: int = 0
+    value: int = 0
+    category: str = ""
+    type: str = ""
+    state: str = ""
+    requirements: dict | None = None
+    solves: int = 0
+    solved_by_me: bool = False
+    attempts: int = 0
+    files: list = field(default_factory=list)
+    tags: list = field(default_factory=list)
+    hints: list = field(default_factory=list)
+
+    @classmethod
+    def from_dict(cls, payload: dict[str, Any]) -> "ChallengeData":
+        """Build the model from a CTFd payload, ignoring unknown fields"""
+        return model_decoder(cls)(payload)
+
+
+@dataclass(slots=True)
+class SubmissionData:
+    id: int = 0
+    challenge_id: int = 0
+    user_id: int = 0
+    team_id: int | None = None
+    ip: str = ""
+    provided: str = ""
+    type: str = ""
+    date: dt | None = None
+    challenge: dict | None = None
+    user: dict | None = None
+    team: dict | None = None
+
+    @classmethod
+    def from_dict(cls, payload: dict[str, Any]) -> "SubmissionData":
+        """Build the model from a CTFd payload, ignoring unknown fields and parsing dates"""
+        return model_decoder(cls)(payload)
+
+
+@dataclass(slots=True)
+class ScoreboardEntry:
+    """A standing of the scoreboard, the account being a user or a team depending on the CTF mode"""
+    pos: int = 0
+    account_id: int = 0
+    account_url: str = ""
+    account_type: str = ""
+    oauth_id: int | None = None
+    name: str = ""
+    score: int = 0
+    bracket_id: int | None = None
+    bracket_name: str | None = None
+    members: list = field(default_factory=list)
+
+    @classmethod
+    def from_dict(cls, payload: dict[str, Any]) -> "ScoreboardEntry":
+        """Build the model from a CTFd payload, ignoring unknown fields"""
+        return model_decoder(cls)(payload)
+
+
+def parse_datetime(value: Any) -> dt | None:
+    """
+    Parse an ISO 8601 date of a CTFd payload
+
+    Args:
+        value (Any): The date received, None or an already parsed datetime being kept as is
+
+    Raises:
+        ParseRequestError: The value is not an ISO 8601 date
+
+    Returns:
+        dt | None: The parsed date
+    """
+    if value is None or isinstance(value, dt):
+        return value
+    try:
+        return dt.fromisoformat(value.replace("Z", "+00:00"))
+    except (AttributeError, ValueError):
+        raise ParseRequestError(f"Invalid date in the response: {value!r}") from None
+
+
+CONVERTERS: dict[str, Callable[[Any], Any]] = {
+    "created": parse_datetime,
+    "date": parse_datetime,
+}
+
+
+_DECODERS: dict[Callable[..., Any], Callable[[dict[str, Any]], Any]] = {}
+
+
+def model_decoder(model: Callable[..., M]) -> Callable[[dict[str, Any]], M]:
+    """
+    Precompile the mapping from a CTFd payload to the given model: the accepted fields are computed once
+    and the returned function keeps the known keys only, converting the ones that need it
+
+    Args:
+        model (Callable[..., M]): The model class
+
+    Returns:
+        Callable[[dict[str, Any]], M]: The function building a model from a payload
+    """
+    if (decode := _DECODERS.get(model)) is None:
+        decode = _DECODERS[model] = _compile_decoder(model)
+    return decode
+
+
+def _compile_decoder(model: Callable[..., M]) -> Callable[[dict[str, Any]], M]:
+    names = frozenset(signature(model).parameters)
+    converters = tuple((name, convert) for name, convert in CONVERTERS.items() if name in names)
+
+    def decode(payload: dict[str, Any]) -> M:
+        if payload.keys() <= names:
+            instance = model(**payload)
+        else:
+            instance = model(**{key: value for key, value in payload.items() if key in names})
+        for name, convert in converters:
+            setattr(instance, name, convert(getattr(instance, name)))
+        return instance
+
+    return decode
+
+
+def decode_models(model: Callable[..., M], payloads: list[dict[str, Any]]) -> list[M]:
+    """Build the models of a whole listing page in a single pass"""
+    decode = model_decoder(model)
+    return [decode(payload) for payload in payloads]
+
+
+@cache
+def projection(model: type, fields: tuple[str, ...]) -> type[Any]:
+    """
+    Build the namedtuple class holding only the given fields of a model, the missing ones defaulting like in the model
+
+    Args:
+        model (type): The model class
+        fields (tuple[str, ...]): The fields to keep, in row order
+
+    Raises:
+        ValueError: A field is not part of the model
+
+    Returns:
+        type[Any]: The namedtuple class of the rows, named after the model (e.g. UserDataRow)
+    """
+    if unknown := set(fields) - signature(model).parameters.keys():
+        raise ValueError(f"{model.__name__} has no field {', '.join(sorted(unknown))}")
+    defaults = {item.name: None if item.default is MISSING else item.default for item in dataclass_fields(model)}
+    return namedtuple(f"{model.__name__}Row", fields, defaults=[defaults.get(name) for name in fields])
+
+
+def project(model: type, payloads: list[dict[str, Any]], fields: Sequence[str]) -> list[tuple]:
+    """Build lightweight rows holding only the given fields of a listing page, converted like in the models"""
+    row = projection(model, tuple(fields))
+    defaults = tuple(row._field_defaults.items())
+    converters = tuple((index, CONVERTERS[name]) for index, name in enumerate(row._fields) if name in CONVERTERS)
+    if not converters:
+        return [row._make([payload.get(name, default) for name, default in defaults]) for payload in payloads]
+
+    rows = []
+    for payload in payloads:
+        values = [payload.get(name, default) for name, default in defaults]
+        for index, convert in converters:
+            values[index] = convert(values[index])
+        rows.append(row._make(values))
+    return rows
+
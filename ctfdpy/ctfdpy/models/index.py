@@ -0,0 +1,109 @@
+from collections.abc import Callable, Iterable
+from typing import Any, Generic, TypeVar
+
+from .data import TeamData, UserData
+
+M = TypeVar("M", bound=UserData | TeamData)
+
+
+def _invalidating(method: Callable[..., Any]) -> Callable[..., Any]:
+    def wrapper(self: "EntityIndex", *args: Any, **kwargs: Any) -> Any:
+        self._indexes.clear()
+        return method(self, *args, **kwargs)
+    wrapper.__name__ = method.__name__
+    wrapper.__doc__ = method.__doc__
+    return wrapper
+
+
+class EntityIndex(list[M], Generic[M]):
+    """
+    List of users or teams with hash indexes on id, name, email and team_id
+    The indexes are built on the first lookup and dropped whenever the list is modified
+    """
+
+    def __init__(self, entities: Iterable[M] = ()) -> None:
+        super().__init__(entities)
+        self._indexes: dict[str, dict[Any, Any]] = {}
+
+    append = _invalidating(list.append)
+    extend = _invalidating(list.extend)
+    insert = _invalidating(list.insert)
+    remove = _invalidating(list.remove)
+    pop = _invalidating(list.pop)
+    clear = _invalidating(list.clear)
+    __setitem__ = _invalidating(list.__setitem__)
+    __delitem__ = _invalidating(list.__delitem__)
+    __iadd__ = _invalidating(list.__iadd__)
+    __imul__ = _invalidating(list.__imul__)
+
+    def reindex(self) -> None:
+        """Drop the indexes, to call after modifying an entity in place"""
+        self._indexes.clear()
+
+    def _unique(self, field: str) -> dict[Any, M]:
+        if (index := self._indexes.get(field)) is None:
+            index = self._indexes[field] = {}
+            for entity in self:
+                index.setdefault(getattr(entity, field), entity)
+        return index
+
+    def _grouped(self, field: str) -> dict[Any, list[M]]:
+        key = f"{field}[]"
+        if (index := self._indexes.get(key)) is None:
+            index = self._indexes[key] = {}
+            for entity in self:
+                index.setdefault(getattr(entity, field), []).append(entity)
+        return index
+
+    def by_id(self, id: int) -> M | None:
+        return self._unique("id").get(id)
+
+    def by_name(self, name: str) -> M | None:
+        return self._unique("name").get(name)
+
+    def by_email(self, email: str) -> M | None:
+        return self._unique("email").get(email)
+
+    def by_team_id(self, team_id: int) -> list[M]:
+        """Return the users of the given team (only meaningful for users)"""
+        return self._grouped("team_id").get(team_id, [])
+
+
+def _member_id(member: UserData | dict[str, Any] | int) -> int:
+    """Read the id of a team member without decoding its payload"""
+    if isinstance(member, UserData):
+        return member.id
+    if isinstance(member, dict):
+        return member["id"]
+    return member
+
+
+class TeamIndex(EntityIndex[TeamData]):
+    """EntityIndex of teams with a reverse map from their members to the team"""
+
+    def _members(self) -> dict[int, TeamData]:
+        if (index := self._indexes.get("members")) is None:
+            index = self._indexes["members"] = {}
+            for team in self:
+                for member in team.members or []:
+                    index[_member_id(member)] = team
+        return index
+
+    def team_of(self, user_id: int) -> TeamData | None:
+        return self._members().get(user_id)
+
+    def members_of(self, team_id: int, users: EntityIndex[UserData]) -> list[UserData]:
+        """
+        Join a team with the given users
+
+        Args:
+            team_id (int): The id of the team
+            users (EntityIndex[UserData]): The users to look the members up in
+
+        Returns:
+            list[UserData]: The members of the team found in the users
+        """
+        if (team := self.by_id(team_id)) is None:
+            return []
+        members = (users.by_id(_member_id(member)) for member in team.members or [])
+        return [member for member in members if member is not None]
@@ -12,6 +12,8 @@ class UserInput:
     password: str
     affiliation: str = ""
     country: str | None = None
+    website: str = ""
+    bracket_id: int | None = None
 
 @dataclass
 class TeamInput:
@@ -20,4 +22,5 @@ class TeamInput:
     email: str = ""
     website: str = ""
     country: str | None = None
-    bracket_id: int | None = None
\ No newline at end of file
+    bracket_id: int | None = None
+    affiliation: str = ""
\ No newline at end of file
@@ -0,0 +1,113 @@
+"""
+Consistent listings of paginated CTFd endpoints: the pages that fail are fetched again, the items are deduplicated
+by id and the pages fetched while the listing changed size are fetched again against the new page count
+"""
+from dataclasses import dataclass, field
+from typing import Any
+
+
+def snapshot(response: dict[str, Any]) -> tuple[Any, Any] | None:
+    """Return the page count and total reported by a page, None if the page has no pagination"""
+    try:
+        pagination = response["meta"]["pagination"]
+    except (KeyError, TypeError):
+        return None
+    return pagination.get("pages"), pagination.get("total")
+
+
+@dataclass
+class Listing:
+    """
+    Result of a paginated listing
+
+    Attributes:
+        items (list[dict[str, Any]]): The items of every fetched page in page order, without duplicated ids
+        pages (int): The number of pages of the listing
+        failed_pages (dict[int, Exception]): The last error of each page that could not be fetched
+        refetched_pages (list[int]): The pages that were requested more than once
+        duplicates (int): The number of items dropped because their id was already listed
+        consistent (bool): Defines if every page was fetched against the same page count and total
+    """
+    items: list[dict[str, Any]]
+    pages: int
+    failed_pages: dict[int, Exception] = field(default_factory=dict)
+    refetched_pages: list[int] = field(default_factory=list)
+    duplicates: int = 0
+    consistent: bool = True
+
+    @property
+    def complete(self) -> bool:
+        return not self.failed_pages
+
+
+class PageCollector:
+    """
+    Keep the pages of a listing as they are fetched and tell which ones still have to be (re)fetched
+
+    The first page is the reference: every page reporting another page count or total was fetched while the listing
+    changed, so once the reference is refreshed with `rebase` those pages are returned again by `missing`
+    """
+
+    def __init__(self, first: dict[str, Any]) -> None:
+        self.responses: dict[int, dict[str, Any]] = {1: first}
+        self.errors: dict[int, Exception] = {}
+        self.attempts: dict[int, int] = {1: 1}
+        self.reference = snapshot(first)
+
+    @property
+    def pages(self) -> int:
+        if self.reference is None or not isinstance(self.reference[0], int):
+            return 1
+        return max(self.reference[0], 1)
+
+    def _stale(self, page: int) -> bool:
+        current = snapshot(self.responses[page])
+        return current is not None and current != self.reference
+
+    def update(self, results: dict[int, dict[str, Any] | None], errors: dict[int, Exception]) -> None:
+        for page, response in results.items():
+            self.responses[page] = response or {}
+            self.errors.pop(page, None)
+            self.attempts[page] = self.attempts.get(page, 0) + 1
+        for page, error in errors.items():
+            self.errors[page] = error
+            self.attempts[page] = self.attempts.get(page, 0) + 1
+
+    def drifted(self) -> bool:
+        """Defines if some page was fetched against another page count or total than the reference"""
+        return any(self._stale(page) for page in self.responses if page <= self.pages)
+
+    def rebase(self, first: dict[str, Any]) -> None:
+        """Use a freshly fetched first page as the new reference, dropping the pages past the new page count"""
+        self.update({1: first}, {})
+        self.reference = snapshot(first)
+        for page in [page for page in self.responses if page > self.pages]:
+            del self.responses[page]
+        for page in [page for page in self.errors if page > self.pages]:
+            del self.errors[page]
+
+    def missing(self) -> list[int]:
+        """Return the pages never fetched successfully or fetched against another page count or total"""
+        return [page for page in range(1, self.pages + 1) if page not in self.responses or self._stale(page)]
+
+    def result(self) -> Listing:
+        items: list[dict[str, Any]] = []
+        seen: set[Any] = set()
+        duplicates = 0
+        for page in range(1, self.pages + 1):
+            for item in (self.responses.get(page) or {}).get("data", []):
+                if (id := item.get("id")) is not None:
+                    if id in seen:
+                        duplicates += 1
+                        continue
+                    seen.add(id)
+                items.append(item)
+
+        return Listing(
+            items=items,
+            pages=self.pages,
+            failed_pages={page: error for page, error in self.errors.items() if page not in self.responses},
+            refetched_pages=sorted(page for page, attempts in self.attempts.items() if attempts > 1),
+            duplicates=duplicates,
+            consistent=not self.drifted(),
+        )
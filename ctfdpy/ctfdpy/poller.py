@@ -0,0 +1,151 @@
+"""
+Live scoreboard feed: the standings are fetched on an adaptive interval and only their changes are emitted
+"""
+import threading
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from .exceptions import HTTPError, RequestError
+from .models.data import ScoreboardEntry
+
+if TYPE_CHECKING:
+    from .scoreboard import Scoreboard
+
+
+@dataclass(frozen=True, slots=True)
+class ScoreChange:
+    """The change of position and score of an account between two scoreboard snapshots"""
+    account_id: int
+    name: str
+    old_pos: int | None
+    new_pos: int | None
+    old_score: int | None
+    new_score: int | None
+
+    @property
+    def joined(self) -> bool:
+        return self.old_pos is None
+
+    @property
+    def left(self) -> bool:
+        return self.new_pos is None
+
+    @property
+    def rank_delta(self) -> int:
+        """The number of places gained (negative when the account went down)"""
+        if self.old_pos is None or self.new_pos is None:
+            return 0
+        return self.old_pos - self.new_pos
+
+    @property
+    def score_delta(self) -> int:
+        return (self.new_score or 0) - (self.old_score or 0)
+
+
+def diff_standings(previous: dict[int, ScoreboardEntry], current: list[ScoreboardEntry]) -> list[ScoreChange]:
+    """
+    Compare two scoreboard snapshots
+
+    Args:
+        previous (dict[int, ScoreboardEntry]): The previous standings by account id
+        current (list[ScoreboardEntry]): The current standings
+
+    Returns:
+        list[ScoreChange]: The accounts whose position or score changed, that joined or that left the scoreboard,
+            ordered by new position with the accounts that left last
+    """
+    changes: list[ScoreChange] = []
+    for entry in current:
+        before = previous.get(entry.account_id)
+        if before is None:
+            changes.append(ScoreChange(entry.account_id, entry.name, None, entry.pos, None, entry.score))
+        elif before.pos != entry.pos or before.score != entry.score:
+            changes.append(ScoreChange(entry.account_id, entry.name, before.pos, entry.pos, before.score, entry.score))
+
+    remaining = {entry.account_id for entry in current}
+    for account_id, before in previous.items():
+        if account_id not in remaining:
+            changes.append(ScoreChange(account_id, before.name, before.pos, None, before.score, None))
+    return changes
+
+
+class AdaptiveInterval:
+    """
+    Delay between two polls: it is halved while the polled data changes and grows while it does not,
+    within [min_interval, max_interval]
+    """
+
+    def __init__(self, interval: float = 5.0, min_interval: float = 1.0, max_interval: float = 60.0, growth: float = 1.5) -> None:
+        if not 0 < min_interval <= max_interval:
+            raise ValueError("the intervals must verify 0 < min_interval <= max_interval")
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.growth = growth
+        self.current = min(max(interval, min_interval), max_interval)
+
+    def update(self, changed: bool) -> float:
+        self.current = max(self.current / 2, self.min_interval) if changed else min(self.current * self.growth, self.max_interval)
+        return self.current
+
+    def backoff(self) -> float:
+        """Double the delay after a failed poll"""
+        self.current = min(self.current * 2, self.max_interval)
+        return self.current
+
+
+class ScoreboardPoller:
+    def __init__(self, scoreboard: "Scoreboard", interval: float = 5.0, min_interval: float = 1.0, max_interval: float = 60.0) -> None:
+        """
+        Args:
+            scoreboard (Scoreboard): The scoreboard resource to poll
+            interval (float, optional): The initial delay in seconds between two fetches. Defaults to 5.0.
+            min_interval (float, optional): The shortest delay, used while the standings keep changing. Defaults to 1.0.
+            max_interval (float, optional): The longest delay, reached while the standings do not change. Defaults to 60.0.
+        """
+        self.scoreboard = scoreboard
+        self.interval = AdaptiveInterval(interval, min_interval, max_interval)
+        self.snapshot: dict[int, ScoreboardEntry] = {}
+        self.polls = 0
+
+    def poll(self) -> list[ScoreChange]:
+        """
+        Fetch the scoreboard once and diff it with the previous snapshot, the first poll reporting every account as joined
+
+        Raises:
+            RequestError: The scoreboard could not be fetched
+            HTTPError: The server answered with an error status
+
+        Returns:
+            list[ScoreChange]: The changes since the previous poll
+        """
+        entries = self.scoreboard.get_scoreboard() or []
+        changes = diff_standings(self.snapshot, entries)
+        self.snapshot = {entry.account_id: entry for entry in entries}
+        self.polls += 1
+        self.interval.update(bool(changes))
+        return changes
+
+    def changes(self, stop: threading.Event | None = None) -> Iterator[list[ScoreChange]]:
+        """
+        Poll the scoreboard until stopped, a failed fetch only delaying the next one
+
+        Args:
+            stop (threading.Event | None, optional): The event stopping the polling once set. Defaults to polling forever.
+
+        Yields:
+            list[ScoreChange]: The changes of each poll that changed something
+        """
+        stop = stop or threading.Event()
+        while not stop.is_set():
+            try:
+                if changes := self.poll():
+                    yield changes
+            except (RequestError, HTTPError):
+                self.interval.backoff()
+            stop.wait(self.interval.current)
+
+    def run(self, callback: Callable[[list[ScoreChange]], None], stop: threading.Event | None = None) -> None:
+        """Call the callback with the changes of each poll that changed something, until stopped"""
+        for changes in self.changes(stop):
+            callback(changes)
@@ -0,0 +1,140 @@
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+
+
+class TokenBucket:
+    """
+    Token bucket rate limiter, safe to share between threads, async tasks and clients
+    It adapts to the server: a 429 response halves the rate and pauses every caller for the Retry-After delay,
+    then each successful request raises the rate back towards its initial value
+    """
+
+    def __init__(self, rate: float, burst: int | None = None, min_rate: float | None = None) -> None:
+        """
+        Args:
+            rate (float): The maximum number of requests per second
+            burst (int | None, optional): The number of requests that can be sent at once after an idle period. Defaults to the rate.
+            min_rate (float | None, optional): The lowest rate the limiter can adapt to. Defaults to a tenth of the rate.
+        """
+        self.max_rate = rate
+        self.rate = rate
+        self.min_rate = min_rate or rate / 10
+        self.capacity = float(burst or max(1, int(rate)))
+        self.throttled_time = 0.0
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take a token, going into debt if none is left, and return how long the caller has to wait for it"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            wait = -self._tokens / self.rate
+            self.throttled_time += wait
+            return wait
+
+    def acquire(self) -> float:
+        """Block the current thread until a request can be sent and return the time waited"""
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self) -> float:
+        """Suspend the current task until a request can be sent and return the time waited"""
+        # asyncio is only needed by the async clients, the ones calling this method
+        import asyncio
+
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def on_throttled(self, retry_after: float | None = None) -> None:
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate / 2)
+            if retry_after:
+                self._tokens = min(self._tokens, 0.0) - retry_after * self.rate
+
+    def on_success(self) -> None:
+        if self.rate >= self.max_rate:
+            return
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.min_rate / 10)
+
+
+@dataclass
+class RetryPolicy:
+    """Retry policy with exponential backoff and jitter, only applied to idempotent methods by default"""
+    max_retries: int = 3
+    backoff_factor: float = 0.5
+    max_backoff: float = 30.0
+    jitter: float = 0.5
+    statuses: frozenset[int] = frozenset({429, 500, 502, 503, 504})
+    methods: frozenset[str] = frozenset({"GET", "HEAD", "DELETE"})
+
+    def delay(self, attempt: int, retry_after: float | None = None) -> float:
+        """
+        Compute the delay before the next attempt
+
+        Args:
+            attempt (int): The number of the attempt that just failed, starting at 0
+            retry_after (float | None, optional): The delay requested by the server. Defaults to None.
+
+        Returns:
+            float: The number of seconds to wait
+        """
+        if retry_after is not None:
+            return min(retry_after, self.max_backoff)
+        backoff = min(self.max_backoff, self.backoff_factor * 2 ** attempt)
+        return backoff * (1 - self.jitter * random.random())
+
+
+@dataclass
+class RetryMetrics:
+    """Counters of the requests, retries and throttling of an HTTP client"""
+    requests: int = 0
+    retries: int = 0
+    throttled: int = 0
+    throttled_time: float = 0.0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def record_request(self) -> None:
+        with self._lock:
+            self.requests += 1
+
+    def record_retry(self, delay: float, throttled: bool) -> None:
+        with self._lock:
+            self.retries += 1
+            if throttled:
+                self.throttled += 1
+                self.throttled_time += delay
+
+    def record_wait(self, waited: float) -> None:
+        if waited > 0:
+            with self._lock:
+                self.throttled_time += waited
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header given either in seconds or as an HTTP date"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    from email.utils import parsedate_to_datetime
+    try:
+        return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,77 @@
+from collections.abc import Sequence
+from dataclasses import MISSING, dataclass, field, fields
+from enum import Enum
+from typing import Any, Generic, TypeVar
+
+from .models.data import TeamData, UserData
+from .models.index import EntityIndex
+from .models.inputs import TeamInput, UserInput
+
+InputT = TypeVar("InputT", UserInput, TeamInput)
+M = TypeVar("M", UserData, TeamData)
+
+
+class Action(Enum):
+    CREATE = "create"
+    UPDATE = "update"
+    SKIP = "skip"
+
+
+@dataclass
+class Change(Generic[InputT, M]):
+    """What has to be sent to CTFd for one input of a provisioning job"""
+    action: Action
+    input: InputT
+    existing: M | None = None
+    fields: dict[str, Any] = field(default_factory=dict)
+    duplicate_of: int | None = None
+
+
+def optional_fields(input: UserInput | TeamInput) -> dict[str, Any]:
+    """Return the optional fields of an input (the ones with a default) that were given a value"""
+    return {
+        input_field.name: value
+        for input_field in fields(input)
+        if input_field.default is not MISSING and (value := getattr(input, input_field.name)) not in (None, "")
+    }
+
+
+def plan(inputs: Sequence[InputT], existing: EntityIndex[M]) -> list[Change[InputT, M]]:
+    """
+    Compute locally what a provisioning job has to do: create the inputs that match no existing entity by name
+    or email, update the ones whose optional fields differ and skip the others (inputs repeated in the job included)
+
+    Args:
+        inputs (Sequence[InputT]): The users or teams to provision
+        existing (EntityIndex[M]): The entities already on CTFd
+
+    Returns:
+        list[Change[InputT, M]]: The change of each input, in input order
+    """
+    changes: list[Change[InputT, M]] = []
+    planned: dict[str, int] = {}
+    for index, input in enumerate(inputs):
+        email = getattr(input, "email", "")
+        keys = [f"name:{input.name}"] + ([f"email:{email}"] if email else [])
+        if (first := next((planned[key] for key in keys if key in planned), None)) is not None:
+            changes.append(Change(Action.SKIP, input, duplicate_of=first))
+            continue
+        planned.update((key, index) for key in keys)
+
+        values = optional_fields(input)
+        entity = existing.by_name(input.name) or (existing.by_email(email) if email else None)
+        if entity is None:
+            changes.append(Change(Action.CREATE, input, fields=values))
+            continue
+
+        diff = {key: value for key, value in values.items() if getattr(entity, key, None) != value}
+        changes.append(Change(Action.UPDATE if diff else Action.SKIP, input, entity, diff))
+    return changes
+
+
+def resolve_duplicates(changes: list[Change], results: list[Any]) -> list[Any]:
+    """Give the repeated inputs of a job the result of their first occurrence"""
+    return [
+        results[change.duplicate_of] if change.duplicate_of is not None else result
+        for change, result in zip(changes, results)
+    ]
@@ -0,0 +1,39 @@
+from typing import TYPE_CHECKING
+
+from .http import HTTPClient
+from .models.data import ScoreboardEntry, decode_models
+
+if TYPE_CHECKING:
+    from .poller import ScoreboardPoller
+
+class Scoreboard:
+    def __init__(self, http: HTTPClient) -> None:
+        self.http = http
+
+
+    def get_scoreboard(self) -> list[ScoreboardEntry] | None:
+        """
+        Fetch the current standings, bypassing the response cache so that they are never stale
+
+        Returns:
+            list[ScoreboardEntry] | None: The standings ordered by position
+        """
+        scoreboard_data = self.http.get("scoreboard")
+        if scoreboard_data:
+            return decode_models(ScoreboardEntry, scoreboard_data.get("data", []))
+        return None
+
+    def poller(self, interval: float = 5.0, min_interval: float = 1.0, max_interval: float = 60.0) -> "ScoreboardPoller":
+        """
+        Build a poller emitting the rank and score changes of the scoreboard
+
+        Args:
+            interval (float, optional): The initial delay in seconds between two fetches. Defaults to 5.0.
+            min_interval (float, optional): The shortest delay, used while the standings keep changing. Defaults to 1.0.
+            max_interval (float, optional): The longest delay, reached while the standings do not change. Defaults to 60.0.
+
+        Returns:
+            ScoreboardPoller: The poller of this scoreboard
+        """
+        from .poller import ScoreboardPoller
+        return ScoreboardPoller(self, interval, min_interval, max_interval)
@@ -0,0 +1,68 @@
+import threading
+from collections.abc import Awaitable, Callable, Hashable
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from .lazy import lazy_import
+
+if TYPE_CHECKING:
+    import asyncio
+else:
+    # asyncio is only needed by the async clients
+    asyncio = lazy_import("asyncio")
+
+R = TypeVar("R")
+
+
+class SingleFlight:
+    """
+    Deduplicate concurrent identical calls between threads: the first caller of a key runs the call
+    and the callers arriving while it is in flight wait for its result instead of running it again
+    """
+
+    def __init__(self) -> None:
+        self.shared = 0
+        self._calls: dict[Hashable, Future[Any]] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, func: Callable[[], R]) -> R:
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if future is None:
+                future = self._calls[key] = Future()
+            else:
+                self.shared += 1
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = func()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+
+class AsyncSingleFlight:
+    """Deduplicate concurrent identical calls between the tasks of an event loop"""
+
+    def __init__(self) -> None:
+        self.shared = 0
+        self._calls: dict[Hashable, asyncio.Future[Any]] = {}
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[R]]) -> R:
+        task = self._calls.get(key)
+        if task is None:
+            task = self._calls[key] = asyncio.ensure_future(func())
+            task.add_done_callback(lambda _: self._calls.pop(key, None))
+        else:
+            self.shared += 1
+        # A cancelled caller must not cancel the call shared with the other ones
+        return await asyncio.shield(task)
@@ -0,0 +1,152 @@
+"""
+Incremental decoding of the CTFd responses: the items of the "data" array are decoded one by one as the body
+arrives, so that only the current item and the unconsumed part of the body are held in memory
+"""
+import json
+from typing import Any
+
+from .exceptions import ParseRequestError
+
+WHITESPACE = " \t\n\r"
+
+_decoder = json.JSONDecoder()
+
+
+class StreamParser:
+    """
+    Incremental parser of a CTFd response body, a JSON object fed chunk by chunk
+
+    The items of its top-level "data" array are returned by `feed` as soon as they are complete,
+    the other top-level fields (success, meta, errors, message) being kept whole in `fields`
+    """
+
+    def __init__(self) -> None:
+        self.fields: dict[str, Any] = {}
+        self._buffer = ""
+        self._pos = 0
+        self._state = "start"
+        self._key = ""
+
+    @property
+    def done(self) -> bool:
+        return self._state == "end"
+
+    def _next_char(self) -> str | None:
+        buffer, pos = self._buffer, self._pos
+        while pos < len(buffer) and buffer[pos] in WHITESPACE:
+            pos += 1
+        self._pos = pos
+        return buffer[pos] if pos < len(buffer) else None
+
+    def _check(self, char: str, expected: str) -> None:
+        if char not in expected:
+            raise ParseRequestError(f"The response could not be parsed:\nunexpected {char!r} instead of one of {expected!r}")
+
+    def _expect(self, char: str, expected: str) -> None:
+        self._check(char, expected)
+        self._pos += 1
+
+    def _value(self, delimiters: str) -> tuple[bool, Any]:
+        """
+        Decode the value at the current position once it is complete, which is only known for sure when the
+        delimiter following it has arrived (a number could otherwise be cut between two chunks)
+
+        Returns:
+            tuple[bool, Any]: If the value was complete and the value itself
+        """
+        try:
+            value, end = _decoder.raw_decode(self._buffer, self._pos)
+        except json.JSONDecodeError:
+            # Incomplete so far, an invalid document is reported by close once the body ended
+            return False, None
+        following = end
+        while following < len(self._buffer) and self._buffer[following] in WHITESPACE:
+            following += 1
+        if following == len(self._buffer):
+            return False, None
+        # The delimiter itself is consumed by the next state
+        self._check(self._buffer[following], delimiters)
+        self._pos = following
+        return True, value
+
+    def feed(self, chunk: str) -> list[Any]:
+        """
+        Parse the next chunk of the body
+
+        Args:
+            chunk (str): The next decoded text of the body
+
+        Raises:
+            ParseRequestError: The body is not a JSON object
+
+        Returns:
+            list[Any]: The items of the data array completed by this chunk
+        """
+        self._buffer = self._buffer[self._pos:] + chunk
+        self._pos = 0
+        items: list[Any] = []
+
+        while (char := self._next_char()) is not None:
+            state = self._state
+            if state == "start":
+                self._expect(char, "{")
+                self._state = "key"
+            elif state == "key":
+                if char == "}":
+                    self._pos += 1
+                    self._state = "end"
+                    continue
+                complete, self._key = self._value(":")
+                if not complete:
+                    break
+                self._state = "colon"
+            elif state == "colon":
+                self._expect(char, ":")
+                self._state = "value"
+            elif state == "value":
+                if self._key == "data" and char == "[":
+                    self._pos += 1
+                    self._state = "item"
+                    continue
+                complete, value = self._value(",}")
+                if not complete:
+                    break
+                self.fields[self._key] = value
+                self._state = "next"
+            elif state == "next":
+                self._expect(char, ",}")
+                self._state = "key" if char == "," else "end"
+            elif state == "item":
+                if char == "]":
+                    self._pos += 1
+                    self._state = "next"
+                    continue
+                complete, item = self._value(",]")
+                if not complete:
+                    break
+                items.append(item)
+                self._state = "item_next"
+            elif state == "item_next":
+                self._expect(char, ",]")
+                self._state = "item" if char == "," else "next"
+            else:
+                raise ParseRequestError("The response could not be parsed:\nunexpected data after the JSON document")
+        return items
+
+    def close(self) -> None:
+        """
+        Check that the whole document was parsed
+
+        Raises:
+            ParseRequestError: The body ended before the end of the JSON document
+        """
+        if self._state != "end":
+            raise ParseRequestError("The response could not be parsed:\nthe body ended before the end of the JSON document")
+
+    @property
+    def pages(self) -> int:
+        """The page count of the listing, read from meta.pagination"""
+        try:
+            return int(self.fields["meta"]["pagination"]["pages"])
+        except (KeyError, TypeError, ValueError):
+            return 1
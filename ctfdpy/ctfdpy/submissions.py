@@ -0,0 +1,48 @@
+from collections.abc import Iterator
+from typing import Any
+
+from .http import HTTPClient
+from .models.data import SubmissionData, decode_models
+
+
+class Submissions:
+    def __init__(self, http: HTTPClient) -> None:
+        self.http = http
+
+
+    def get_submission(self, id: int) -> SubmissionData | None:
+        submission_data = self.http.get_item("submissions", id)
+        if submission_data:
+            return SubmissionData.from_dict(submission_data)
+        return None
+
+    def get_submissions(self, **filters: Any) -> list[SubmissionData] | None:
+        """
+        Fetch every submission of CTFd
+
+        Args:
+            filters (Any): The CTFd query filters sent with every page (e.g. challenge_id=1, type="correct", team_id=2)
+
+        Returns:
+            list[SubmissionData] | None: The data of each submission
+        """
+        submissions_data = self.http.get_items("submissions", params=filters or None)
+        if submissions_data:
+            return decode_models(SubmissionData, submissions_data)
+        return None
+
+    def iter_submissions(self, **filters: Any) -> Iterator[SubmissionData]:
+        """
+        Iterate over every submission page by page, keeping at most two pages in memory
+
+        Args:
+            filters (Any): The CTFd query filters sent with every page
+
+        Yields:
+            SubmissionData: The data of each submission
+        """
+        for page in self.http.iter_pages("submissions", filters or None):
+            yield from decode_models(SubmissionData, page)
+
+    def delete_submission(self, id: int) -> None:
+        self.http.delete_item("submissions", id)
@@ -0,0 +1,269 @@
+import csv
+import json
+import os
+from collections.abc import Iterator
+from dataclasses import dataclass, field, fields
+from functools import partial
+from itertools import islice
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from .batch import run_batch
+from .exceptions import CreationError, CTFDPyError
+from .models.data import UserData
+from .models.index import EntityIndex
+from .models.inputs import TeamInput, UserInput
+from .reconcile import optional_fields
+
+if TYPE_CHECKING:
+    from .ctfd import CTFDClient
+
+
+def _format(path: Path, format: str | None) -> str:
+    format = format or path.suffix.lstrip(".").lower()
+    if format not in ("jsonl", "csv"):
+        raise ValueError(f"Unsupported format {format!r}, expected jsonl or csv")
+    return format
+
+
+def export_entities(
+    client: "CTFDClient",
+    resource: str,
+    path: str | Path,
+    format: str | None = None,
+    columns: list[str] | None = None,
+) -> int:
+    """
+    Stream a listing to a JSONL or CSV file page by page, without holding more than two pages in memory
+
+    Args:
+        client (CTFDClient): The client of the instance to export
+        resource (str): The listing to export ("users", "teams", ...)
+        path (str | Path): The destination file
+        format (str | None, optional): "jsonl" or "csv". Defaults to the extension of the path.
+        columns (list[str] | None, optional): The CSV columns. Defaults to the fields of the first record.
+
+    Returns:
+        int: The number of exported records
+    """
+    path = Path(path)
+    format = _format(path, format)
+    count = 0
+    with path.open("w", newline="") as file:
+        writer: csv.DictWriter | None = None
+        for page in client.http.iter_pages(resource):
+            if format == "jsonl":
+                file.writelines(json.dumps(record, default=str) + "\n" for record in page)
+            else:
+                for record in page:
+                    if writer is None:
+                        writer = csv.DictWriter(file, columns or list(record), extrasaction="ignore")
+                        writer.writeheader()
+                    writer.writerow({
+                        key: json.dumps(value) if isinstance(value, (list, dict)) else value
+                        for key, value in record.items()
+                    })
+            count += len(page)
+    return count
+
+
+def export_users(client: "CTFDClient", path: str | Path, format: str | None = None) -> int:
+    return export_entities(client, "users", path, format)
+
+
+def export_teams(client: "CTFDClient", path: str | Path, format: str | None = None) -> int:
+    return export_entities(client, "teams", path, format)
+
+
+def _read_records(path: Path, format: str) -> Iterator[str | dict[str, Any]]:
+    """Read the records of a file, the JSONL lines being decoded later so that a malformed line only fails its own record"""
+    with path.open(newline="") as file:
+        if format == "jsonl":
+            for line in file:
+                if line.strip():
+                    yield line
+        else:
+            for row in csv.DictReader(file):
+                yield {key: value for key, value in row.items() if value not in (None, "")}
+
+
+@dataclass
+class ImportReport:
+    """Outcome of an import: records created, records skipped because already imported by a previous run, and failures by record number"""
+    created: int = 0
+    skipped: int = 0
+    errors: dict[int, str] = field(default_factory=dict)
+
+
+class Checkpoint:
+    """
+    Progress of an import saved next to its source so that a crashed import resumes where it stopped
+
+    `pending` is the size of the chunk being provisioned: when the import stops in the middle of a chunk,
+    the records of that chunk may already exist on CTFd and are reconciled instead of created again on resume
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.done = 0
+        self.pending = 0
+        self.errors: dict[int, str] = {}
+        if path.exists():
+            state = json.loads(path.read_text())
+            self.done = state["done"]
+            self.pending = state.get("pending", 0)
+            self.errors = {int(index): error for index, error in state["errors"].items()}
+
+    def save(self) -> None:
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        tmp.write_text(json.dumps({"done": self.done, "pending": self.pending, "errors": self.errors}))
+        os.replace(tmp, self.path)
+
+
+def _build(model: type, record: str | dict[str, Any]) -> Any:
+    if isinstance(record, str):
+        record = json.loads(record)
+    if not isinstance(record, dict):
+        raise TypeError(f"Expected a JSON object, got {type(record).__name__}")
+    names = {f.name for f in fields(model)}
+    return model(**{key: value for key, value in record.items() if key in names})
+
+
+def _build_team(record: str | dict[str, Any]) -> tuple[TeamInput, list[UserInput]]:
+    if isinstance(record, str):
+        record = json.loads(record)
+    if not isinstance(record, dict):
+        raise TypeError(f"Expected a JSON object, got {type(record).__name__}")
+    return _build(TeamInput, record), [_build(UserInput, member) for member in _members(record)]
+
+
+def _members(record: dict[str, Any]) -> list[dict[str, Any]]:
+    members = record.get("members") or []
+    return json.loads(members) if isinstance(members, str) else members
+
+
+def _import(
+    client: "CTFDClient",
+    path: str | Path,
+    resource: str,
+    checkpoint: str | Path | None,
+    chunk_size: int,
+    concurrency: int | None,
+    format: str | None,
+) -> ImportReport:
+    path = Path(path)
+    format = _format(path, format)
+    progress = Checkpoint(Path(checkpoint) if checkpoint else path.with_name(path.name + ".checkpoint"))
+    report = ImportReport(skipped=progress.done)
+    concurrency = concurrency or client.http.concurrency
+
+    def create_user(user: UserInput, existing: EntityIndex[UserData]) -> list[Exception] | None:
+        """Create a user, returning the errors catched or None if it already exists"""
+        if existing.by_name(user.name) or existing.by_email(user.email):
+            return None
+        try:
+            if client.users.create_user(user.name, user.email, user.password, **optional_fields(user)) is None:
+                return [CreationError("No entity got returned", "user", user.name)]
+        except CTFDPyError as e:
+            return [e]
+        return []
+
+    build = (lambda record: _build(UserInput, record)) if resource == "users" else _build_team
+    records = islice(_read_records(path, format), progress.done, None)
+    while chunk := list(islice(records, chunk_size)):
+        # The records of a chunk interrupted by a crash may already exist and are reconciled instead of created again
+        reconcile = progress.pending > 0
+        progress.pending = len(chunk)
+        progress.save()
+
+        errors: dict[int, list[Exception]] = {}
+        inputs: dict[int, Any] = {}
+        for offset, record in enumerate(chunk):
+            try:
+                inputs[offset] = build(record)
+            except (TypeError, ValueError) as e:
+                errors[offset] = [e]
+
+        recovered: set[int] = set()
+        if resource == "users":
+            existing = (client.users.get_users() or EntityIndex()) if reconcile else EntityIndex()
+            results, _ = run_batch(partial(create_user, existing=existing), list(inputs.values()), concurrency)
+            for offset, result in zip(inputs, results):
+                if result is None:
+                    recovered.add(offset)
+                else:
+                    errors[offset] = result
+        else:
+            teams = client.create_full_teams(*inputs.values(), concurrency=concurrency, reconcile=reconcile)
+            errors.update(zip(inputs, (team_errors for _, team_errors in teams)))
+
+        for offset in range(len(chunk)):
+            if offset in recovered:
+                report.skipped += 1
+            elif errors[offset]:
+                progress.errors[progress.done + offset] = "; ".join(str(error) for error in errors[offset])
+            else:
+                report.created += 1
+        progress.done += len(chunk)
+        progress.pending = 0
+        progress.save()
+
+    report.errors = progress.errors
+    return report
+
+
+def import_users(
+    client: "CTFDClient",
+    path: str | Path,
+    checkpoint: str | Path | None = None,
+    chunk_size: int = 500,
+    concurrency: int | None = None,
+    format: str | None = None,
+) -> ImportReport:
+    """
+    Create the UserInput records of a JSONL or CSV file, reading and provisioning them concurrently chunk by chunk
+    The progress is checkpointed after each chunk, running the import again resumes after the last completed chunk
+    (the records of an interrupted chunk that were already created being skipped). A malformed record or one
+    missing a required field is reported in the errors like a failed creation
+
+    Args:
+        client (CTFDClient): The client of the destination instance
+        path (str | Path): The source file, one UserInput record per line/row
+        checkpoint (str | Path | None, optional): The checkpoint file. Defaults to the source path suffixed with .checkpoint.
+        chunk_size (int, optional): The number of records read and provisioned at once. Defaults to 500.
+        concurrency (int | None, optional): The maximum number of requests sent at the same time. Defaults to the client concurrency.
+        format (str | None, optional): "jsonl" or "csv". Defaults to the extension of the path.
+
+    Returns:
+        ImportReport: The number of created and skipped records and the errors by record number
+    """
+    return _import(client, path, "users", checkpoint, chunk_size, concurrency, format)
+
+
+def import_teams(
+    client: "CTFDClient",
+    path: str | Path,
+    checkpoint: str | Path | None = None,
+    chunk_size: int = 100,
+    concurrency: int | None = None,
+    format: str | None = None,
+) -> ImportReport:
+    """
+    Create the TeamInput records of a JSONL or CSV file along with their members (an optional "members"
+    list of UserInput records), reading and provisioning them concurrently chunk by chunk
+    The progress is checkpointed after each chunk, running the import again resumes after the last completed chunk
+    (the records of an interrupted chunk that were already created being skipped). A malformed record or one
+    missing a required field is reported in the errors like a failed creation
+
+    Args:
+        client (CTFDClient): The client of the destination instance
+        path (str | Path): The source file, one TeamInput record per line/row
+        checkpoint (str | Path | None, optional): The checkpoint file. Defaults to the source path suffixed with .checkpoint.
+        chunk_size (int, optional): The number of records read and provisioned at once. Defaults to 100.
+        concurrency (int | None, optional): The maximum number of requests sent at the same time. Defaults to the client concurrency.
+        format (str | None, optional): "jsonl" or "csv". Defaults to the extension of the path.
+
+    Returns:
+        ImportReport: The number of created and skipped records and the errors by record number
+    """
+    return _import(client, path, "teams", checkpoint, chunk_size, concurrency, format)
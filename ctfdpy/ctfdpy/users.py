@@ -1,9 +1,16 @@
-from .http import HTTPClient
+from collections.abc import Iterator, Sequence
+from concurrent.futures import Future
+from typing import Any, overload
 
+from .analytics import USER_FIELDS, Columns
+from .batch import run_batch
+from .http import HTTPClient
+from .models.data import UserData, decode_models, model_decoder, project
+from .models.index import EntityIndex
 from .models.inputs import UserInput
-from .models.data import UserData
+from .reconcile import Action, Change, optional_fields, plan, resolve_duplicates
+from .writes import PatchQueue
 
-from typing import Any
 
 class Users:
     def __init__(self, http: HTTPClient) -> None:
@@ -13,17 +20,105 @@ class Users:
     def get_user(self, id: int) -> UserData | None:
         user_data = self.http.get_item("users", id)
         if user_data:
-            return UserData(**user_data)
+            return UserData.from_dict(user_data)
         return None
 
-    def get_users(self) -> list[UserData] | None:
-        users_data = self.http.get_items("users")
+    def get_users(self, **filters: Any) -> EntityIndex[UserData] | None:
+        """
+        Fetch every user of CTFd, optionally filtered server side
+
+        Args:
+            filters (Any): The CTFd query filters sent with every page (e.g. field="name", q="admin", per_page=100)
+
+        Returns:
+            EntityIndex[UserData] | None: The indexed UserData of every user
+        """
+        users_data = self.http.get_items("users", params=filters or None)
+        if users_data:
+            return EntityIndex(decode_models(UserData, users_data))
+        return None
+
+    def get_users_projection(self, fields: Sequence[str], **filters: Any) -> list[tuple] | None:
+        """
+        Fetch some fields of every user of CTFd as lightweight namedtuple rows instead of UserData
+        (e.g. ("id", "name") for a dropdown)
+
+        Args:
+            fields (Sequence[str]): The fields to keep, in row order
+            filters (Any): The CTFd query filters sent with every page
+
+        Raises:
+            ValueError: A field is not part of UserData
+
+        Returns:
+            list[tuple] | None: The row of every user
+        """
+        users_data = self.http.get_items("users", params=filters or None)
         if users_data:
-            return [UserData(**user_data) for user_data in users_data]
+            return project(UserData, users_data, fields)
         return None
 
-    def create_user(self, name: str, email: str, password: str) -> UserData | None:
-        data: dict[str, Any] = {}
+    def iter_users(self, **filters: Any) -> Iterator[UserData]:
+        """
+        Iterate over every user page by page, keeping at most two pages in memory
+
+        Args:
+            filters (Any): The CTFd query filters sent with every page
+
+        Yields:
+            UserData: The data of each user
+        """
+        for page in self.http.iter_pages("users", filters or None):
+            yield from decode_models(UserData, page)
+
+    def iter_users_projection(self, fields: Sequence[str], **filters: Any) -> Iterator[tuple]:
+        """
+        Iterate over some fields of every user page by page, see get_users_projection
+
+        Args:
+            fields (Sequence[str]): The fields to keep, in row order
+            filters (Any): The CTFd query filters sent with every page
+
+        Yields:
+            tuple: The row of each user
+        """
+        for page in self.http.iter_pages("users", filters or None):
+            yield from project(UserData, page, fields)
+
+    def stream_users(self, **filters: Any) -> Iterator[UserData]:
+        """
+        Iterate over every user while the pages are received, holding a single user payload in memory at a time
+        instead of a whole page, for the listings fetched with a large per_page
+
+        Args:
+            filters (Any): The CTFd query filters sent with every page (e.g. per_page=10000)
+
+        Yields:
+            UserData: The data of each user
+        """
+        decode = model_decoder(UserData)
+        for item in self.http.iter_stream("users", filters or None):
+            yield decode(item)
+
+    def get_columns(self, fields: Sequence[str] = USER_FIELDS, backend: str | None = None, **filters: Any) -> Columns | None:
+        """
+        Fetch every user of CTFd as columns, without building any model, for aggregations over large events
+
+        Args:
+            fields (Sequence[str], optional): The fields to keep. Defaults to USER_FIELDS.
+            backend (str | None, optional): "numpy", "array" or None to use NumPy when it is installed. Defaults to None.
+            filters (Any): The CTFd query filters sent with every page
+
+        Returns:
+            Columns | None: One column per field, see Columns for the group-by and top-k helpers
+        """
+        users_data = self.http.get_items("users", params=filters or None)
+        if users_data:
+            return Columns.from_payloads(users_data, fields, backend)
+        return None
+
+    def create_user(self, name: str, email: str, password: str, **fields: Any) -> UserData | None:
+        data: dict[str, Any] = dict(fields)
         if not (name and email and password):
             raise ValueError("name, email and password must be provided and not empty")
         data["name"] = name
@@ -32,8 +127,71 @@ class Users:
 
         user_data = self.http.post_item("users", data)
         if user_data:
-            return UserData(**user_data)
+            return UserData.from_dict(user_data)
         return None
 
-    def create_batch_users(self, *users: UserInput) -> list[UserData | None]:
-        return [self.create_user(user.name, user.email, user.password) for user in users]
\ No newline at end of file
+    @overload
+    def update_user(self, id: int, queue: None = None, **fields: Any) -> UserData | None: ...
+
+    @overload
+    def update_user(self, id: int, queue: PatchQueue, **fields: Any) -> "Future[dict[str, Any] | None]": ...
+
+    def update_user(self, id: int, queue: PatchQueue | None = None, **fields: Any) -> "UserData | Future[dict[str, Any] | None] | None":
+        """
+        Update some fields of a user (e.g. hidden, banned, bracket_id)
+
+        Args:
+            id (int): The id of the user
+            queue (PatchQueue | None, optional): A write-behind queue merging this update with the other pending updates of the user. Defaults to None.
+            fields (Any): The fields to update
+
+        Returns:
+            UserData | Future[dict[str, Any] | None] | None: The updated user, or the future of the raw response when queued
+        """
+        if queue is not None:
+            return queue.patch("users", id, fields)
+        user_data = self.http.patch_item("users", id, fields)
+        if user_data:
+            return UserData.from_dict(user_data)
+        return None
+
+    def create_batch_users(
+        self,
+        *users: UserInput,
+        raise_errors: bool = True,
+        concurrency: int | None = None,
+        reconcile: bool = False,
+    ) -> tuple[list[UserData | None], list[Exception]]:
+        """
+        Create several users at once, at most `concurrency` of them at the same time
+
+        Args:
+            users (UserInput): The users to create
+            raise_errors (bool, optional): Defines if the first error should be raised, cancelling the pending users (If false will skip and returns them). Defaults to True.
+            concurrency (int | None, optional): The maximum number of requests sent at the same time. Defaults to the client concurrency.
+            reconcile (bool, optional): Defines if the existing users should be read first (one paginated listing) so that
+                only the missing users are created, the ones whose fields differ updated and the others skipped. Defaults to False.
+
+        Returns:
+            tuple[list[UserData | None], list[Exception]]: The data of each user in input order (None for failed ones) and the list
+                of all errors catched (only if raise_errors is set to False)
+        """
+        if not reconcile:
+            return run_batch(
+                lambda user: self.create_user(user.name, user.email, user.password, **optional_fields(user)),
+                users,
+                concurrency or self.http.concurrency,
+                raise_errors,
+            )
+
+        changes = plan(users, self.get_users() or EntityIndex())
+        results, errors = run_batch(self._apply, changes, concurrency or self.http.concurrency, raise_errors)
+        return resolve_duplicates(changes, results), errors
+
+    def _apply(self, change: Change[UserInput, UserData]) -> UserData | None:
+        if change.action is Action.CREATE:
+            return self.create_user(change.input.name, change.input.email, change.input.password, **change.fields)
+        if change.action is Action.UPDATE and change.existing is not None:
+            user_data = self.http.patch_item("users", change.existing.id, change.fields)
+            return UserData.from_dict(user_data) if user_data else None
+        return change.existing
@@ -0,0 +1,137 @@
+"""
+Write-behind queue coalescing the PATCH requests sent to the same entity
+"""
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Generic, Protocol, TypeVar
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+    from .http import HTTPClient
+
+
+class PatchFuture(Protocol):
+    """The result side of a future, shared by concurrent.futures.Future and asyncio.Future"""
+
+    def set_result(self, result: dict[str, Any] | None, /) -> None: ...
+
+    def set_exception(self, exception: BaseException, /) -> None: ...
+
+
+FutureT = TypeVar("FutureT", bound=PatchFuture)
+
+
+class PendingPatch(Generic[FutureT]):
+    """The merged fields of the pending PATCH operations on one entity and the futures of those operations"""
+
+    __slots__ = ("_future", "futures", "json")
+
+    def __init__(self, future: Callable[[], FutureT]) -> None:
+        """
+        Args:
+            future (Callable[[], FutureT]): The factory of the futures returned to the operations
+        """
+        self.json: dict[str, Any] = {}
+        self.futures: list[FutureT] = []
+        self._future = future
+
+    def add(self, json: dict[str, Any]) -> FutureT:
+        self.json |= json
+        future = self._future()
+        self.futures.append(future)
+        return future
+
+    def set_result(self, result: dict[str, Any] | None) -> None:
+        for future in self.futures:
+            future.set_result(result)
+
+    def set_exception(self, error: BaseException) -> None:
+        for future in self.futures:
+            future.set_exception(error)
+
+    def resolve(self, result: "Future[dict[str, Any] | None]") -> None:
+        """Settle the futures of the operations with the outcome of the merged request"""
+        if (error := result.exception()) is not None:
+            self.set_exception(error)
+        else:
+            self.set_result(result.result())
+
+
+class PatchQueue:
+    """
+    Queue the PATCH operations and send a single request per entity, the fields of the operations on the same
+    `endpoint/id` being merged (the last value of a field wins)
+
+    The queue is flushed once `max_pending` entities are pending, `max_delay` seconds after the first pending operation
+    and when leaving its context. Every operation returns a future resolved with the response of the merged request
+    """
+
+    def __init__(self, http: "HTTPClient", max_pending: int = 100, max_delay: float | None = 0.5, concurrency: int | None = None) -> None:
+        """
+        Args:
+            http (HTTPClient): The client sending the requests
+            max_pending (int, optional): The number of pending entities triggering a flush. Defaults to 100.
+            max_delay (float | None, optional): The delay in seconds after which the pending operations are flushed, None to only flush on size and exit. Defaults to 0.5.
+            concurrency (int | None, optional): The maximum number of requests sent at the same time by a flush. Defaults to the client concurrency.
+        """
+        self.http = http
+        self.max_pending = max_pending
+        self.max_delay = max_delay
+        self.concurrency = concurrency or http.concurrency
+        self.operations = 0
+        self.requests = 0
+        self._pending: dict[tuple[str, int], PendingPatch[Future[dict[str, Any] | None]]] = {}
+        self._lock = threading.Lock()
+        self._timer: threading.Timer | None = None
+
+    def __enter__(self) -> "Self":
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.flush()
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def patch(self, endpoint: str, id: int, json: dict[str, Any]) -> "Future[dict[str, Any] | None]":
+        """
+        Queue a PATCH of the given entity
+
+        Args:
+            endpoint (str): The endpoint of the resource (e.g. "teams")
+            id (int): The id of the entity
+            json (dict[str, Any]): The fields to update
+
+        Returns:
+            Future[dict[str, Any] | None]: The future of the response of the request sent for the entity
+        """
+        with self._lock:
+            if (pending := self._pending.get((endpoint, id))) is None:
+                pending = self._pending[endpoint, id] = PendingPatch(Future)
+            future = pending.add(json)
+            self.operations += 1
+            full = len(self._pending) >= self.max_pending
+            if not full and self._timer is None and self.max_delay is not None:
+                self._timer = threading.Timer(self.max_delay, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+        if full:
+            self.flush()
+        return future
+
+    def flush(self) -> None:
+        """Send the pending operations, one request per entity, and wait for their responses"""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            self.requests += len(pending)
+        if not pending:
+            return
+
+        with ThreadPoolExecutor(max_workers=max(min(self.concurrency, len(pending)), 1)) as executor:
+            for (endpoint, id), patch in pending.items():
+                executor.submit(self.http.patch_item, endpoint, id, patch.json).add_done_callback(patch.resolve)
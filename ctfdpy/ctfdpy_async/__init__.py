@@ -0,0 +1,2 @@
+from ..ctfdpy.models.inputs import *
+from .ctfd import AsyncCTFDClient
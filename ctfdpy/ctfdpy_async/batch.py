@@ -0,0 +1,48 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable
+from typing import TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+async def run_batch(
+    func: Callable[[T], Awaitable[R | None]],
+    items: Iterable[T],
+    concurrency: int = 1,
+    raise_errors: bool = True,
+) -> tuple[list[R | None], list[Exception]]:
+    """
+    Apply a coroutine function to every item with at most `concurrency` of them running at the same time
+
+    Args:
+        func (Callable[[T], Awaitable[R | None]]): The coroutine function to apply
+        items (Iterable[T]): The items to process
+        concurrency (int, optional): The maximum number of items processed at the same time. Defaults to 1.
+        raise_errors (bool, optional): Defines if the first error should be raised, cancelling the pending items (If false will skip and returns them). Defaults to True.
+
+    Returns:
+        tuple[list[R | None], list[Exception]]: The result of each item in input order (None for failed ones) and the list of all errors catched
+    """
+    semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+    async def run(item: T) -> R | None:
+        async with semaphore:
+            return await func(item)
+
+    tasks = [asyncio.ensure_future(run(item)) for item in items]
+    results: list[R | None] = []
+    errors: list[Exception] = []
+    try:
+        for task in tasks:
+            try:
+                results.append(await task)
+            except Exception as e:
+                if raise_errors:
+                    raise
+                results.append(None)
+                errors.append(e)
+    finally:
+        for task in tasks:
+            task.cancel()
+    return results, errors
@@ -0,0 +1,31 @@
+from typing import Any
+
+from ..ctfdpy.models.data import ChallengeData, decode_models
+from .http import AsyncHTTPClient
+
+
+class AsyncChallenges:
+    def __init__(self, http: AsyncHTTPClient) -> None:
+        self.http = http
+
+
+    async def get_challenge(self, id: int) -> ChallengeData | None:
+        challenge_data = await self.http.get_item("challenges", id)
+        if challenge_data:
+            return ChallengeData.from_dict(challenge_data)
+        return None
+
+    async def get_challenges(self, **filters: Any) -> list[ChallengeData] | None:
+        """
+        Fetch every challenge of CTFd
+
+        Args:
+            filters (Any): The CTFd query filters (e.g. category="web", type="dynamic", state="visible")
+
+        Returns:
+            list[ChallengeData] | None: The data of each challenge
+        """
+        challenges_data = await self.http.get_items("challenges", params=filters or None)
+        if challenges_data:
+            return decode_models(ChallengeData, challenges_data)
+        return None
@@ -0,0 +1,190 @@
+import asyncio
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from ..ctfdpy.exceptions import CreationError
+from ..ctfdpy.models.data import TeamData, UserData
+from ..ctfdpy.models.index import EntityIndex, TeamIndex
+from ..ctfdpy.models.inputs import TeamInput, UserInput
+from ..ctfdpy.reconcile import optional_fields
+from .challenges import AsyncChallenges
+from .http import AsyncHTTPClient
+from .scoreboard import AsyncScoreboard
+from .submissions import AsyncSubmissions
+from .teams import AsyncTeams
+from .users import AsyncUsers
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+
+class AsyncCTFDClient:
+    def __init__(self, url: str, token: str, **http_options: Any) -> None:
+        """
+        Args:
+            url (str): The base URL of the CTFd API
+            token (str): The admin token used to authenticate
+            http_options (Any): Additional options given to the AsyncHTTPClient (e.g. concurrency, http2, timeout, transport, client)
+        """
+        self.http = AsyncHTTPClient(url, token, **http_options)
+
+    @cached_property
+    def users(self) -> AsyncUsers:
+        return AsyncUsers(self.http)
+
+    @cached_property
+    def teams(self) -> AsyncTeams:
+        return AsyncTeams(self.http)
+
+    @cached_property
+    def challenges(self) -> AsyncChallenges:
+        return AsyncChallenges(self.http)
+
+    @cached_property
+    def submissions(self) -> AsyncSubmissions:
+        return AsyncSubmissions(self.http)
+
+    @cached_property
+    def scoreboard(self) -> AsyncScoreboard:
+        return AsyncScoreboard(self.http)
+
+    async def __aenter__(self) -> "Self":
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        await self.http.aclose()
+
+
+    async def _existing_entities(self) -> tuple[EntityIndex[UserData], TeamIndex]:
+        return await self.users.get_users() or EntityIndex(), await self.teams.get_teams() or TeamIndex()
+
+    async def _provision_full_team(
+        self,
+        name: str,
+        password: str,
+        members: list[UserInput],
+        raise_errors: bool,
+        semaphore: asyncio.Semaphore,
+        existing: tuple[EntityIndex[UserData], TeamIndex] | None = None,
+        fields: dict[str, Any] | None = None,
+    ) -> tuple[TeamData | None, list[Exception]]:
+        """
+        Create a team then provision all of its members concurrently, every request waiting for a slot of the given semaphore
+
+        With the `existing` users and teams, the team and the users already on CTFd are reused instead of created
+        and the members already in the team are skipped. The optional `fields` of the team are sent along its creation,
+        or as an update of the existing team when they differ from it
+
+        Returns:
+            tuple[TeamData | None, list[Exception]]: The final team data and the errors catched for its members
+        """
+        users, teams = existing or (EntityIndex(), TeamIndex())
+        if (team := teams.by_name(name)) is None:
+            async with semaphore:
+                team = await self.teams.create_team(name, password, **(fields or {}))
+        elif diff := {key: value for key, value in (fields or {}).items() if getattr(team, key, None) != value}:
+            async with semaphore:
+                team_data = await self.http.patch_item("teams", team.id, diff)
+            team = TeamData.from_dict(team_data) if team_data else None
+        if not team:
+            raise CreationError("No entity got returned", "team", name)
+
+        async def add_member(member: UserInput) -> None:
+            user = users.by_name(member.name) or users.by_email(member.email)
+            if user is not None and user.team_id == team.id:
+                return
+            if user is None:
+                async with semaphore:
+                    user = await self.users.create_user(member.name, member.email, member.password, **optional_fields(member))
+            if not user:
+                raise CreationError("No entity got returned", "user", member.name)
+            async with semaphore:
+                await self.teams.attach_member(team.id, user.id)
+
+        errors: list[Exception] = []
+        for result in await asyncio.gather(*(add_member(member) for member in members), return_exceptions=True):
+            if isinstance(result, Exception):
+                if raise_errors:
+                    raise result
+                errors.append(result)
+            elif isinstance(result, BaseException):
+                raise result
+
+        async with semaphore:
+            return await self.teams.get_team(team.id), errors
+
+
+    async def create_full_team(
+        self,
+        name: str,
+        password: str,
+        members: list[UserInput],
+        raise_errors: bool = False,
+        concurrency: int | None = None,
+        reconcile: bool = False,
+        **kwargs: Any
+    )-> tuple[TeamData | None, list[Exception]]:
+        """
+        Generate a complete team with the given parameters and its members already attached
+
+        Args:
+            name (str): The name of the team
+            password (str): The password of the team
+            members (UserInput): A tuple of the users to attach to the team
+            raise_errors (bool, optional): Defines if ctfdpy should raise errors (If false will skip and returns them). Defaults to False.
+            concurrency (int | None, optional): The maximum number of requests sent at the same time. Defaults to the client concurrency.
+            reconcile (bool, optional): Defines if the existing team and users should be reused, only the missing ones being created and attached. Defaults to False.
+            kwargs (Any): Additional fields of the team (e.g. email, website, country, bracket_id)
+
+        Raises:
+            CreationError: The team could not be created
+
+        Returns:
+            tuple[TeamData | None, list[Exception]]: The full data of the created team and the list of all errors catched during the process (only if raise_errors is set to False)
+        """
+        semaphore = asyncio.Semaphore(max(concurrency or self.http.concurrency, 1))
+        existing = await self._existing_entities() if reconcile else None
+        return await self._provision_full_team(name, password, members, raise_errors, semaphore, existing, kwargs)
+
+    async def create_full_teams(
+        self,
+        *teams: tuple[TeamInput, list[UserInput]],
+        raise_errors: bool = False,
+        concurrency: int | None = None,
+        reconcile: bool = False,
+    ) -> list[tuple[TeamData | None, list[Exception]]]:
+        """
+        Generate several complete teams at once, every request sharing the same concurrency limit
+
+        Args:
+            teams (tuple[TeamInput, list[UserInput]]): The teams to create along with their members
+            raise_errors (bool, optional): Defines if ctfdpy should raise errors (If false will skip and returns them). Defaults to False.
+            concurrency (int | None, optional): The maximum number of requests sent at the same time. Defaults to the client concurrency.
+            reconcile (bool, optional): Defines if the existing teams and users should be reused, only the missing ones being created and attached.
+                The users and teams are listed once for the whole job. Defaults to False.
+
+        Returns:
+            list[tuple[TeamData | None, list[Exception]]]: For each team in input order, its full data and the list of all errors catched during its creation
+        """
+        semaphore = asyncio.Semaphore(max(concurrency or self.http.concurrency, 1))
+        existing = await self._existing_entities() if reconcile else None
+        results: list[tuple[TeamData | None, list[Exception]]] = []
+        for result in await asyncio.gather(
+            *(
+                self._provision_full_team(team.name, team.password, members, raise_errors, semaphore, existing, optional_fields(team))
+                for team, members in teams
+            ),
+            return_exceptions=True,
+        ):
+            if isinstance(result, Exception):
+                if raise_errors:
+                    raise result
+                results.append((None, [result]))
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                results.append(result)
+        return results
@@ -0,0 +1,130 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable, Iterator
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from ..ctfdpy.fleet import FleetResult, check_defaults
+from ..ctfdpy.models.data import TeamData, UserData
+from ..ctfdpy.models.inputs import UserInput
+from .ctfd import AsyncCTFDClient
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+R = TypeVar("R")
+
+
+class AsyncFleet:
+    def __init__(self, instances: dict[str, tuple[str, str]] | None = None, concurrency: int | None = None, **http_options: Any) -> None:
+        """
+        Args:
+            instances (dict[str, tuple[str, str]] | None, optional): The URL and admin token of each instance, by name. Defaults to None.
+            concurrency (int | None, optional): The maximum number of instances operated at the same time. Defaults to all of them.
+            http_options (Any): The options given to the client of every instance (e.g. timeout, retry, concurrency),
+                the stateful ones (cache, validators, rate_limiter, client, transport) having to be given per instance with `add`
+
+        Raises:
+            ValueError: A stateful option was given as a fleet default
+        """
+        check_defaults(http_options)
+        self.concurrency = concurrency
+        self.http_options = http_options
+        self.clients: dict[str, AsyncCTFDClient] = {}
+        for name, (url, token) in (instances or {}).items():
+            self.add(name, url, token)
+
+    def add(self, name: str, url: str, token: str, **http_options: Any) -> AsyncCTFDClient:
+        """
+        Add an instance to the fleet
+
+        Args:
+            name (str): The name of the instance, used as the key of the results
+            url (str): The base URL of its CTFd API
+            token (str): Its admin token
+            http_options (Any): The options of its client, overriding the fleet defaults
+
+        Raises:
+            ValueError: An instance with the same name is already in the fleet
+
+        Returns:
+            AsyncCTFDClient: The client of the instance
+        """
+        if name in self.clients:
+            raise ValueError(f"The fleet already has an instance named {name!r}")
+        client = self.clients[name] = AsyncCTFDClient(url, token, **(self.http_options | http_options))
+        return client
+
+    async def remove(self, name: str) -> None:
+        await self.clients.pop(name).aclose()
+
+    def __getitem__(self, name: str) -> AsyncCTFDClient:
+        return self.clients[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.clients)
+
+    def __len__(self) -> int:
+        return len(self.clients)
+
+    async def __aenter__(self) -> "Self":
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        await asyncio.gather(*(client.aclose() for client in self.clients.values()))
+
+    async def run(self, operation: Callable[[AsyncCTFDClient], Awaitable[R]], names: Iterable[str] | None = None) -> FleetResult[R]:
+        """
+        Run an operation on every instance concurrently
+
+        Args:
+            operation (Callable[[AsyncCTFDClient], Awaitable[R]]): The coroutine function, called with the client of each instance
+            names (Iterable[str] | None, optional): The instances to run the operation on. Defaults to all of them.
+
+        Returns:
+            FleetResult[R]: The result or the error of each instance
+        """
+        clients = {name: self.clients[name] for name in (self.clients if names is None else names)}
+        semaphore = asyncio.Semaphore(max(self.concurrency or len(clients), 1))
+
+        async def run(client: AsyncCTFDClient) -> R:
+            async with semaphore:
+                return await operation(client)
+
+        result: FleetResult[R] = FleetResult()
+        for name, outcome in zip(clients, await asyncio.gather(*(run(client) for client in clients.values()), return_exceptions=True)):
+            if isinstance(outcome, Exception):
+                result.errors[name] = outcome
+            elif isinstance(outcome, BaseException):
+                raise outcome
+            else:
+                result.results[name] = outcome
+        return result
+
+    async def get_users(self, **filters: Any) -> FleetResult[Any]:
+        """Fetch the users of every instance, see AsyncUsers.get_users"""
+        return await self.run(lambda client: client.users.get_users(**filters))
+
+    async def create_full_team(self, name: str, password: str, members: list[UserInput], **kwargs: Any) -> FleetResult[tuple[TeamData | None, list[Exception]]]:
+        """Provision the same team on every instance, see AsyncCTFDClient.create_full_team"""
+        return await self.run(lambda client: client.create_full_team(name, password, members, **kwargs))
+
+    async def ban_user(self, name: str) -> FleetResult[UserData | None]:
+        """
+        Ban the user with the given name on every instance, the instances without such a user returning None
+
+        Args:
+            name (str): The name of the user
+
+        Returns:
+            FleetResult[UserData | None]: The banned user of each instance
+        """
+        async def ban(client: AsyncCTFDClient) -> UserData | None:
+            users = await client.users.get_users(field="name", q=name)
+            user = next((user for user in users or [] if user.name == name), None)
+            if user is None:
+                return None
+            return await client.users.update_user(user.id, banned=True)
+
+        return await self.run(ban)
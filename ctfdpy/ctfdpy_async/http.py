@@ -0,0 +1,423 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import AsyncIterator, Sequence
+from typing import TYPE_CHECKING, Any
+
+from ..ctfdpy.exceptions import PaginationError, RequestError
+from ..ctfdpy.http import BaseHTTPClient, HTTPMethod
+from ..ctfdpy.lazy import lazy_import
+from ..ctfdpy.pagination import Listing, PageCollector
+from ..ctfdpy.singleflight import AsyncSingleFlight
+from ..ctfdpy.streaming import StreamParser
+from .writes import AsyncPatchQueue
+
+if TYPE_CHECKING:
+    import httpx
+    from typing_extensions import Self
+else:
+    httpx = lazy_import("httpx")
+
+
+class AsyncHTTPClient(BaseHTTPClient):
+    def __init__(
+        self,
+        url: str,
+        token: str,
+        transport: httpx.AsyncBaseTransport | None = None,
+        client: httpx.AsyncClient | None = None,
+        **options: Any,
+    ) -> None:
+        """
+        Args:
+            url (str): The base URL of the CTFd API
+            token (str): The admin token used to authenticate
+            transport (httpx.AsyncBaseTransport | None, optional): The transport of the httpx client (e.g. httpx.MockTransport). Defaults to None.
+            client (httpx.AsyncClient | None, optional): An httpx client shared with other clients, it is not closed with this one. Defaults to None.
+            options (Any): The options of BaseHTTPClient (concurrency, cache, retry, timeout, ...), HTTP/2 being enabled by default
+        """
+        options.setdefault("http2", True)
+        super().__init__(url, token, **options)
+        self._client = client
+        self._transport = transport
+        self._owns_client = client is None
+        self.flights = AsyncSingleFlight() if self.single_flight else None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """The httpx client, only built (and httpx loaded) when the first request is sent"""
+        if self._client is None:
+            self._client = httpx.AsyncClient(transport=self._transport, **self._client_options())
+        return self._client
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        if self._owns_client and self._client is not None:
+            await self._client.aclose()
+
+    async def _call(
+        self,
+        endpoint: str,
+        method: HTTPMethod,
+        params: dict[str, Any] | None = None,
+        json: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        url, headers = self._target(endpoint, headers)
+        return await self.client.request(method=method.value, url=url, params=params, json=json, headers=headers)
+
+    async def _request(
+        self,
+        endpoint: str,
+        method: HTTPMethod,
+        params: dict[str, Any] | None = None,
+        json: dict[str, Any] | None = None,
+    ) -> dict[str, Any] | None:
+        """
+        Generate a request with the given information and by using token and base_url
+        Then returns the parsed response containing either the data or nothing
+
+        Args:
+            endpoint (str): The endpoint to request
+            method (HTTPMethod): The HTTP method to use
+            params (dict[str, Any] | None, optional): The URL parameters to send with the request. Defaults to None.
+            json (dict[str, Any] | None, optional): The JSON data to send with the request. Defaults to None.
+
+        The request is retried according to the retry policy and waits for the rate limiter if they are set
+        With single flight enabled, concurrent identical GET requests share the same request and result
+
+        Raises:
+            RequestError: The httpx request could not be completed or ended with an unhandled error
+
+        Returns:
+            dict[str, Any] | None: The parsed response containing the data field if it exists
+        """
+        if self.flights is not None and method == HTTPMethod.GET:
+            return await self.flights.do(
+                self._flight_key(endpoint, params), lambda: self._send(endpoint, method, params, json)
+            )
+        return await self._send(endpoint, method, params, json)
+
+    async def _send(
+        self,
+        endpoint: str,
+        method: HTTPMethod,
+        params: dict[str, Any] | None = None,
+        json: dict[str, Any] | None = None,
+    ) -> dict[str, Any] | None:
+        self.metrics.record_request()
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                self.metrics.record_wait(await self.rate_limiter.acquire_async())
+
+            event = self._hook_request(endpoint, method, params, attempt)
+            started = time.perf_counter()
+            try:
+                response = await self._call(
+                    endpoint, method, params, json, headers=self._conditional_headers(endpoint, method, params)
+                )
+            except httpx.RequestError as request_exc:
+                self._hook_error(event, started, request_exc)
+                if (delay := self._retry_delay(method, attempt)) is None:
+                    raise RequestError(
+                        f"An error occurred while requesting {request_exc.request.url!r}:\n{request_exc!r}"
+                    )
+            else:
+                self._hook_response(event, started, response)
+                if (delay := self._retry_delay(method, attempt, response)) is None:
+                    return self._parse_conditional_response(endpoint, method, params, response)
+
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def get(self, endpoint: str, params: dict[str, Any] | None = None) -> dict[str, Any] | None:
+        """
+        Send a GET request bypassing the response cache, for the endpoints that have to stay fresh (conditional requests still apply)
+
+        Args:
+            endpoint (str): The endpoint to request
+            params (dict[str, Any] | None, optional): The URL parameters to send with the request. Defaults to None.
+
+        Returns:
+            dict[str, Any] | None: The parsed response, a listing being returned in the data field
+        """
+        return await self._request(endpoint, HTTPMethod.GET, params=params)
+
+    async def get_item(self, endpoint: str, id: int) -> dict[str, Any] | None:
+        if (cached := self._cache_get(f"{endpoint}/{id}")) is not None:
+            return cached
+
+        data = await self._request(f"{endpoint}/{id}", HTTPMethod.GET)
+        self._cache_set(f"{endpoint}/{id}", data)
+        return data
+
+    async def get_page(self, endpoint: str, page: int, params: dict[str, Any] | None = None) -> dict[str, Any] | None:
+        """
+        Fetch a single page of a listing
+
+        Args:
+            endpoint (str): The endpoint of the listing
+            page (int): The page number
+            params (dict[str, Any] | None, optional): The query filters of the listing (e.g. field, q, per_page). Defaults to None.
+
+        Returns:
+            dict[str, Any] | None: The items of the page in the data field and the pagination in the meta field
+        """
+        return await self._request(endpoint, HTTPMethod.GET, params={**(params or {}), "page": page})
+
+    async def _get_page(self, endpoint: str, page: int, params: dict[str, Any] | None = None) -> list[dict[str, Any]]:
+        data = await self._request(endpoint, HTTPMethod.GET, params={**(params or {}), "page": page})
+        if not data:
+            return []
+        return data.get("data", [])
+
+    async def _get_pages(
+        self,
+        endpoint: str,
+        pages: Sequence[int],
+        concurrency: int,
+        params: dict[str, Any] | None = None,
+    ) -> tuple[dict[int, dict[str, Any] | None], dict[int, Exception]]:
+        """
+        Fetch the given pages of a listing, at most `concurrency` of them at the same time
+
+        Args:
+            endpoint (str): The endpoint of the listing
+            pages (Sequence[int]): The page numbers to fetch
+            concurrency (int): The maximum number of pages requested at the same time
+            params (dict[str, Any] | None, optional): The query filters of the listing. Defaults to None.
+
+        Returns:
+            tuple[dict[int, dict[str, Any] | None], dict[int, Exception]]: The response of each fetched page (data and meta) and the error of each failed page
+        """
+        semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+        async def get_page(page: int) -> dict[str, Any] | None:
+            async with semaphore:
+                return await self.get_page(endpoint, page, params)
+
+        responses = await asyncio.gather(*(get_page(page) for page in pages), return_exceptions=True)
+
+        results: dict[int, dict[str, Any] | None] = {}
+        errors: dict[int, Exception] = {}
+        for page, response in zip(pages, responses):
+            if isinstance(response, Exception):
+                errors[page] = response
+            elif isinstance(response, BaseException):
+                raise response
+            else:
+                results[page] = response
+        return results, errors
+
+    async def get_items(
+        self,
+        endpoint: str,
+        concurrency: int | None = None,
+        params: dict[str, Any] | None = None,
+    ) -> list[dict[str, Any]] | None:
+        """
+        Fetch every page of a listing and return all of its items in page order
+
+        Args:
+            endpoint (str): The endpoint of the listing
+            concurrency (int | None, optional): The maximum number of pages requested at the same time. Defaults to the client concurrency.
+            params (dict[str, Any] | None, optional): The query filters sent with every page (e.g. field and q to search, per_page). Defaults to None.
+
+        Raises:
+            PaginationError: Some pages could not be fetched, the items of the other pages are kept in the error
+
+        Returns:
+            list[dict[str, Any]] | None: The items of every page of the listing
+        """
+        if self.flights is not None:
+            return await self.flights.do(
+                self._flight_key(endpoint, {**(params or {}), "items": True}),
+                lambda: self._get_items(endpoint, concurrency, params),
+            )
+        return await self._get_items(endpoint, concurrency, params)
+
+    async def _get_items(
+        self,
+        endpoint: str,
+        concurrency: int | None = None,
+        params: dict[str, Any] | None = None,
+    ) -> list[dict[str, Any]] | None:
+        if (cached := self._cache_get(endpoint, params)) is not None:
+            return cached
+
+        listing = await self.fetch_all(endpoint, concurrency, params)
+        if listing is None:
+            return None
+        if listing.failed_pages:
+            raise PaginationError(
+                f"{len(listing.failed_pages)} page(s) of {endpoint} could not be fetched", listing.failed_pages, listing.items
+            )
+
+        self._cache_set(endpoint, listing.items, params)
+        return listing.items
+
+    async def fetch_all(
+        self,
+        endpoint: str,
+        concurrency: int | None = None,
+        params: dict[str, Any] | None = None,
+        rounds: int = 2,
+    ) -> Listing | None:
+        """
+        Fetch every page of a listing as a consistent snapshot
+
+        After the pages are fetched concurrently, the failed ones are fetched again and, if some page reported
+        another page count or total than the first one (users registering during the listing), the first page is
+        fetched again and every page fetched against an outdated count is fetched again. The items are deduplicated by id.
+
+        Args:
+            endpoint (str): The endpoint of the listing
+            concurrency (int | None, optional): The maximum number of pages requested at the same time. Defaults to the client concurrency.
+            params (dict[str, Any] | None, optional): The query filters sent with every page. Defaults to None.
+            rounds (int, optional): The maximum number of additional rounds fetching the failed and outdated pages. Defaults to 2.
+
+        Returns:
+            Listing | None: The items of the listing along with the failed, refetched and duplicated pages and items
+        """
+        data = await self._request(endpoint, HTTPMethod.GET, params=params)
+        if not data:
+            return None
+
+        collector = PageCollector(data)
+        concurrency = concurrency or self.concurrency
+        pages = collector.missing()
+        for step in range(rounds + 1):
+            if pages:
+                results, errors = await self._get_pages(endpoint, pages, concurrency, params)
+                collector.update(results, errors)
+            if step == rounds:
+                break
+            if collector.drifted():
+                try:
+                    collector.rebase(await self._request(endpoint, HTTPMethod.GET, params=params) or {})
+                except RequestError:
+                    break
+            if not (pages := collector.missing()):
+                break
+        return collector.result()
+
+    async def iter_pages(self, endpoint: str, params: dict[str, Any] | None = None) -> AsyncIterator[list[dict[str, Any]]]:
+        """
+        Yield the items of a listing page by page, the next page being prefetched while the current one is consumed
+
+        Args:
+            endpoint (str): The endpoint of the listing
+            params (dict[str, Any] | None, optional): The query filters sent with every page. Defaults to None.
+
+        Yields:
+            list[dict[str, Any]]: The items of each page of the listing, in page order
+        """
+        data = await self._request(endpoint, HTTPMethod.GET, params=params)
+        if not data:
+            return
+
+        try:
+            pages: int = data["meta"]["pagination"]["pages"]
+        except KeyError:
+            pages = 1
+
+        next_page = asyncio.create_task(self._get_page(endpoint, 2, params)) if pages > 1 else None
+        try:
+            yield data.get("data", [])
+
+            for page in range(2, pages + 1):
+                if next_page is None:
+                    break
+                items = await next_page
+                next_page = asyncio.create_task(self._get_page(endpoint, page + 1, params)) if page < pages else None
+                yield items
+        finally:
+            if next_page is not None and not next_page.done():
+                next_page.cancel()
+
+    async def iter_stream(self, endpoint: str, params: dict[str, Any] | None = None) -> AsyncIterator[dict[str, Any]]:
+        """
+        Yield the items of a listing one by one while the pages are received, every page body being decoded
+        incrementally so that the memory held is per item instead of per page (useful with a large per_page)
+
+        The pages are requested one after the other and, the items being consumed while a page is received,
+        the requests are neither cached nor retried
+
+        Args:
+            endpoint (str): The endpoint of the listing
+            params (dict[str, Any] | None, optional): The query filters sent with every page. Defaults to None.
+
+        Raises:
+            RequestError: A page could not be received
+            ParseRequestError: A page body is not a valid CTFd response
+
+        Yields:
+            dict[str, Any]: Each item of the listing, in page order
+        """
+        parser = StreamParser()
+        async for item in self._stream(endpoint, params, parser):
+            yield item
+        for page in range(2, parser.pages + 1):
+            async for item in self._stream(endpoint, {**(params or {}), "page": page}, StreamParser()):
+                yield item
+
+    async def _stream(self, endpoint: str, params: dict[str, Any] | None, parser: StreamParser) -> AsyncIterator[dict[str, Any]]:
+        self.metrics.record_request()
+        if self.rate_limiter is not None:
+            self.metrics.record_wait(await self.rate_limiter.acquire_async())
+
+        event = self._hook_request(endpoint, HTTPMethod.GET, params, 0)
+        started = time.perf_counter()
+        url, headers = self._target(endpoint, None)
+        try:
+            async with self.client.stream(HTTPMethod.GET.value, url, params=params, headers=headers) as response:
+                async for text in response.aiter_text():
+                    for item in parser.feed(text):
+                        yield item
+                self._hook_response(event, started, response, response.num_bytes_downloaded)
+                self._check_stream(endpoint, parser, response)
+        except httpx.RequestError as request_exc:
+            self._hook_error(event, started, request_exc)
+            raise RequestError(f"An error occurred while requesting {request_exc.request.url!r}:\n{request_exc!r}")
+
+    async def get_header(self, endpoint: str) -> dict[str, Any] | None:
+        return await self._request(endpoint, HTTPMethod.HEAD)
+
+    async def post_item(self, endpoint: str, json: dict[str, Any], exclude_fields: list[str] = []) -> dict[str, Any] | None:
+        try:
+            return await self._request(endpoint, HTTPMethod.POST, json=self._generate_cropped_dict(json, exclude_fields))
+        finally:
+            self._cache_invalidate(endpoint, json)
+
+    def patch_queue(self, max_pending: int = 100, max_delay: float | None = 0.5, concurrency: int | None = None) -> AsyncPatchQueue:
+        """
+        Build a write-behind queue merging the PATCH requests sent to the same entity, see AsyncPatchQueue
+
+        Args:
+            max_pending (int, optional): The number of pending entities triggering a flush. Defaults to 100.
+            max_delay (float | None, optional): The delay in seconds after which the pending operations are flushed. Defaults to 0.5.
+            concurrency (int | None, optional): The maximum number of requests sent at the same time by a flush. Defaults to the client concurrency.
+
+        Returns:
+            AsyncPatchQueue: The queue, to use as a context manager so that it is flushed on exit
+        """
+        return AsyncPatchQueue(self, max_pending, max_delay, concurrency)
+
+    async def patch_item(self, endpoint: str, id: int, json: dict[str, Any], exclude_fields: list[str] = []) -> dict[str, Any] | None:
+        try:
+            return await self._request(f"{endpoint}/{id}", HTTPMethod.PATCH, json=self._generate_cropped_dict(json, exclude_fields))
+        finally:
+            self._cache_invalidate(endpoint)
+
+    async def delete_item(self, endpoint: str, id: int) -> None:
+        try:
+            await self._request(f"{endpoint}/{id}", HTTPMethod.DELETE)
+        finally:
+            self._cache_invalidate(endpoint)
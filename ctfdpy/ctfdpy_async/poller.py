@@ -0,0 +1,70 @@
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import TYPE_CHECKING
+
+from ..ctfdpy.exceptions import HTTPError, RequestError
+from ..ctfdpy.models.data import ScoreboardEntry
+from ..ctfdpy.poller import AdaptiveInterval, ScoreChange, diff_standings
+
+if TYPE_CHECKING:
+    from .scoreboard import AsyncScoreboard
+
+
+class AsyncScoreboardPoller:
+    def __init__(self, scoreboard: "AsyncScoreboard", interval: float = 5.0, min_interval: float = 1.0, max_interval: float = 60.0) -> None:
+        """
+        Args:
+            scoreboard (AsyncScoreboard): The scoreboard resource to poll
+            interval (float, optional): The initial delay in seconds between two fetches. Defaults to 5.0.
+            min_interval (float, optional): The shortest delay, used while the standings keep changing. Defaults to 1.0.
+            max_interval (float, optional): The longest delay, reached while the standings do not change. Defaults to 60.0.
+        """
+        self.scoreboard = scoreboard
+        self.interval = AdaptiveInterval(interval, min_interval, max_interval)
+        self.snapshot: dict[int, ScoreboardEntry] = {}
+        self.polls = 0
+
+    async def poll(self) -> list[ScoreChange]:
+        """
+        Fetch the scoreboard once and diff it with the previous snapshot, the first poll reporting every account as joined
+
+        Raises:
+            RequestError: The scoreboard could not be fetched
+            HTTPError: The server answered with an error status
+
+        Returns:
+            list[ScoreChange]: The changes since the previous poll
+        """
+        entries = await self.scoreboard.get_scoreboard() or []
+        changes = diff_standings(self.snapshot, entries)
+        self.snapshot = {entry.account_id: entry for entry in entries}
+        self.polls += 1
+        self.interval.update(bool(changes))
+        return changes
+
+    async def changes(self, stop: asyncio.Event | None = None) -> AsyncIterator[list[ScoreChange]]:
+        """
+        Poll the scoreboard until stopped, a failed fetch only delaying the next one
+
+        Args:
+            stop (asyncio.Event | None, optional): The event stopping the polling once set. Defaults to polling forever.
+
+        Yields:
+            list[ScoreChange]: The changes of each poll that changed something
+        """
+        stop = stop or asyncio.Event()
+        while not stop.is_set():
+            try:
+                if changes := await self.poll():
+                    yield changes
+            except (RequestError, HTTPError):
+                self.interval.backoff()
+            try:
+                await asyncio.wait_for(stop.wait(), self.interval.current)
+            except asyncio.TimeoutError:
+                pass
+
+    async def run(self, callback: Callable[[list[ScoreChange]], Awaitable[None]], stop: asyncio.Event | None = None) -> None:
+        """Await the callback with the changes of each poll that changed something, until stopped"""
+        async for changes in self.changes(stop):
+            await callback(changes)
@@ -0,0 +1,49 @@
+from collections.abc import AsyncIterator
+from typing import Any
+
+from ..ctfdpy.models.data import SubmissionData, decode_models
+from .http import AsyncHTTPClient
+
+
+class AsyncSubmissions:
+    def __init__(self, http: AsyncHTTPClient) -> None:
+        self.http = http
+
+
+    async def get_submission(self, id: int) -> SubmissionData | None:
+        submission_data = await self.http.get_item("submissions", id)
+        if submission_data:
+            return SubmissionData.from_dict(submission_data)
+        return None
+
+    async def get_submissions(self, **filters: Any) -> list[SubmissionData] | None:
+        """
+        Fetch every submission of CTFd
+
+        Args:
+            filters (Any): The CTFd query filters sent with every page (e.g. challenge_id=1, type="correct", team_id=2)
+
+        Returns:
+            list[SubmissionData] | None: The data of each submission
+        """
+        submissions_data = await self.http.get_items("submissions", params=filters or None)
+        if submissions_data:
+            return decode_models(SubmissionData, submissions_data)
+        return None
+
+    async def iter_submissions(self, **filters: Any) -> AsyncIterator[SubmissionData]:
+        """
+        Iterate over every submission page by page, keeping at most two pages in memory
+
+        Args:
+            filters (Any): The CTFd query filters sent with every page
+
+        Yields:
+            SubmissionData: The data of each submission
+        """
+        async for page in self.http.iter_pages("submissions", filters or None):
+            for submission in decode_models(SubmissionData, page):
+                yield submission
+
+    async def delete_submission(self, id: int) -> None:
+        await self.http.delete_item("submissions", id)
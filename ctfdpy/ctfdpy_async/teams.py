@@ -0,0 +1,224 @@
+import asyncio
+from collections.abc import AsyncIterator, Sequence
+from typing import Any, overload
+
+from ..ctfdpy.analytics import TEAM_FIELDS, Columns
+from ..ctfdpy.models.data import TeamData, decode_models, model_decoder, project
+from ..ctfdpy.models.index import TeamIndex
+from ..ctfdpy.models.inputs import TeamInput
+from ..ctfdpy.reconcile import Action, Change, optional_fields, plan, resolve_duplicates
+from .batch import run_batch
+from .http import AsyncHTTPClient
+from .writes import AsyncPatchQueue
+
+
+class AsyncTeams:
+    def __init__(self, http: AsyncHTTPClient) -> None:
+        self.http = http
+
+
+    async def get_team(self, id: int) -> TeamData | None:
+        team_data = await self.http.get_item("teams", id)
+        if team_data:
+            return TeamData.from_dict(team_data)
+        return None
+
+    async def get_teams(self, **filters: Any) -> TeamIndex | None:
+        """
+        Fetch every team of CTFd, optionally filtered server side
+
+        Args:
+            filters (Any): The CTFd query filters sent with every page (e.g. field="name", q="admin", per_page=100)
+
+        Returns:
+            TeamIndex | None: The indexed TeamData of every team
+        """
+        teams_data = await self.http.get_items("teams", params=filters or None)
+        if teams_data:
+            return TeamIndex(decode_models(TeamData, teams_data))
+        return None
+
+    async def get_teams_projection(self, fields: Sequence[str], **filters: Any) -> list[tuple] | None:
+        """
+        Fetch some fields of every team of CTFd as lightweight namedtuple rows instead of TeamData
+        (e.g. ("id", "name") for a dropdown)
+
+        Args:
+            fields (Sequence[str]): The fields to keep, in row order
+            filters (Any): The CTFd query filters sent with every page
+
+        Raises:
+            ValueError: A field is not part of TeamData
+
+        Returns:
+            list[tuple] | None: The row of every team
+        """
+        teams_data = await self.http.get_items("teams", params=filters or None)
+        if teams_data:
+            return project(TeamData, teams_data, fields)
+        return None
+
+    async def iter_teams(self, **filters: Any) -> AsyncIterator[TeamData]:
+        """
+        Iterate over every team page by page, keeping at most two pages in memory
+
+        Args:
+            filters (Any): The CTFd query filters sent with every page
+
+        Yields:
+            TeamData: The data of each team
+        """
+        async for page in self.http.iter_pages("teams", filters or None):
+            for team in decode_models(TeamData, page):
+                yield team
+
+    async def iter_teams_projection(self, fields: Sequence[str], **filters: Any) -> AsyncIterator[tuple]:
+        """
+        Iterate over some fields of every team page by page, see get_teams_projection
+
+        Args:
+            fields (Sequence[str]): The fields to keep, in row order
+            filters (Any): The CTFd query filters sent with every page
+
+        Yields:
+            tuple: The row of each team
+        """
+        async for page in self.http.iter_pages("teams", filters or None):
+            for row in project(TeamData, page, fields):
+                yield row
+
+    async def stream_teams(self, **filters: Any) -> AsyncIterator[TeamData]:
+        """
+        Iterate over every team while the pages are received, holding a single team payload in memory at a time
+        instead of a whole page, for the listings fetched with a large per_page
+
+        Args:
+            filters (Any): The CTFd query filters sent with every page (e.g. per_page=10000)
+
+        Yields:
+            TeamData: The data of each team
+        """
+        decode = model_decoder(TeamData)
+        async for item in self.http.iter_stream("teams", filters or None):
+            yield decode(item)
+
+    async def get_columns(self, fields: Sequence[str] = TEAM_FIELDS, backend: str | None = None, **filters: Any) -> Columns | None:
+        """
+        Fetch every team of CTFd as columns, without building any model, for aggregations over large events
+
+        Args:
+            fields (Sequence[str], optional): The fields to keep. Defaults to TEAM_FIELDS.
+            backend (str | None, optional): "numpy", "array" or None to use NumPy when it is installed. Defaults to None.
+            filters (Any): The CTFd query filters sent with every page
+
+        Returns:
+            Columns | None: One column per field, see Columns for the group-by and top-k helpers
+        """
+        teams_data = await self.http.get_items("teams", params=filters or None)
+        if teams_data:
+            return Columns.from_payloads(teams_data, fields, backend)
+        return None
+
+    async def create_team(self, name: str, password: str, **fields: Any) -> TeamData | None:
+        data: dict[str, Any] = dict(fields)
+        if not (name and password):
+            raise ValueError("name and password must be provided and not empty")
+        data["name"] = name
+        data["password"] = password
+
+        team_data = await self.http.post_item("teams", data)
+        if team_data:
+            return TeamData.from_dict(team_data)
+        return None
+
+    @overload
+    async def update_team(self, id: int, queue: None = None, **fields: Any) -> TeamData | None: ...
+
+    @overload
+    async def update_team(self, id: int, queue: AsyncPatchQueue, **fields: Any) -> "asyncio.Future[dict[str, Any] | None]": ...
+
+    async def update_team(self, id: int, queue: AsyncPatchQueue | None = None, **fields: Any) -> "TeamData | asyncio.Future[dict[str, Any] | None] | None":
+        """
+        Update some fields of a team (e.g. hidden, banned, bracket_id)
+
+        Args:
+            id (int): The id of the team
+            queue (AsyncPatchQueue | None, optional): A write-behind queue merging this update with the other pending updates of the team. Defaults to None.
+            fields (Any): The fields to update
+
+        Returns:
+            TeamData | asyncio.Future[dict[str, Any] | None] | None: The updated team, or the future of the raw response when queued
+        """
+        if queue is not None:
+            return await queue.patch("teams", id, fields)
+        team_data = await self.http.patch_item("teams", id, fields)
+        if team_data:
+            return TeamData.from_dict(team_data)
+        return None
+
+    async def create_batch_teams(
+        self,
+        *teams: TeamInput,
+        raise_errors: bool = True,
+        concurrency: int | None = None,
+        reconcile: bool = False,
+    ) -> tuple[list[TeamData | None], list[Exception]]:
+        """
+        Create several teams at once, at most `concurrency` of them at the same time
+
+        Args:
+            teams (TeamInput): The teams to create
+            raise_errors (bool, optional): Defines if the first error should be raised, cancelling the pending teams (If false will skip and returns them). Defaults to True.
+            concurrency (int | None, optional): The maximum number of requests sent at the same time. Defaults to the client concurrency.
+            reconcile (bool, optional): Defines if the existing teams should be read first (one paginated listing) so that
+                only the missing teams are created, the ones whose fields differ updated and the others skipped. Defaults to False.
+
+        Returns:
+            tuple[list[TeamData | None], list[Exception]]: The data of each team in input order (None for failed ones) and the list
+                of all errors catched (only if raise_errors is set to False)
+        """
+        if not reconcile:
+            return await run_batch(
+                lambda team: self.create_team(team.name, team.password, **optional_fields(team)),
+                teams,
+                concurrency or self.http.concurrency,
+                raise_errors,
+            )
+
+        changes = plan(teams, await self.get_teams() or TeamIndex())
+        results, errors = await run_batch(self._apply, changes, concurrency or self.http.concurrency, raise_errors)
+        return resolve_duplicates(changes, results), errors
+
+    async def _apply(self, change: Change[TeamInput, TeamData]) -> TeamData | None:
+        if change.action is Action.CREATE:
+            return await self.create_team(change.input.name, change.input.password, **change.fields)
+        if change.action is Action.UPDATE and change.existing is not None:
+            team_data = await self.http.patch_item("teams", change.existing.id, change.fields)
+            return TeamData.from_dict(team_data) if team_data else None
+        return change.existing
+
+    async def attach_member(
+        self,
+        team_id: int,
+        user_id: int,
+        is_captain: bool = False,
+        queue: AsyncPatchQueue | None = None,
+    ) -> "asyncio.Future[dict[str, Any] | None] | None":
+        """
+        Add a user to a team, optionally as its captain
+
+        Args:
+            team_id (int): The id of the team
+            user_id (int): The id of the user
+            is_captain (bool, optional): Defines if the user should become the captain of the team. Defaults to False.
+            queue (AsyncPatchQueue | None, optional): A write-behind queue in which the captain assignment is merged with the other pending updates of the team. Defaults to None.
+
+        Returns:
+            asyncio.Future[dict[str, Any] | None] | None: The future of the captain assignment when queued
+        """
+        await self.http.post_item(f"teams/{team_id}/members", json={"user_id": user_id})
+        if is_captain:
+            if queue is not None:
+                return await queue.patch("teams", team_id, {"captain_id": user_id})
+            await self.http.patch_item("teams", team_id, json={"captain_id": user_id})
+        return None
@@ -0,0 +1,97 @@
+import asyncio
+from typing import TYPE_CHECKING, Any
+
+from ..ctfdpy.writes import PendingPatch
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+    from .http import AsyncHTTPClient
+
+
+class AsyncPatchQueue:
+    """
+    Queue the PATCH operations and send a single request per entity, the fields of the operations on the same
+    `endpoint/id` being merged (the last value of a field wins)
+
+    The queue is flushed once `max_pending` entities are pending, `max_delay` seconds after the first pending operation
+    and when leaving its context. Every operation returns a future resolved with the response of the merged request
+    """
+
+    def __init__(self, http: "AsyncHTTPClient", max_pending: int = 100, max_delay: float | None = 0.5, concurrency: int | None = None) -> None:
+        """
+        Args:
+            http (AsyncHTTPClient): The client sending the requests
+            max_pending (int, optional): The number of pending entities triggering a flush. Defaults to 100.
+            max_delay (float | None, optional): The delay in seconds after which the pending operations are flushed, None to only flush on size and exit. Defaults to 0.5.
+            concurrency (int | None, optional): The maximum number of requests sent at the same time by a flush. Defaults to the client concurrency.
+        """
+        self.http = http
+        self.max_pending = max_pending
+        self.max_delay = max_delay
+        self.concurrency = concurrency or http.concurrency
+        self.operations = 0
+        self.requests = 0
+        self._pending: dict[tuple[str, int], PendingPatch[asyncio.Future[dict[str, Any] | None]]] = {}
+        self._timer: asyncio.TimerHandle | None = None
+        self._flushes: set[asyncio.Task[None]] = set()
+
+    async def __aenter__(self) -> "Self":
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        await self.flush()
+        if self._flushes:
+            await asyncio.gather(*self._flushes)
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    async def patch(self, endpoint: str, id: int, json: dict[str, Any]) -> "asyncio.Future[dict[str, Any] | None]":
+        """
+        Queue a PATCH of the given entity
+
+        Args:
+            endpoint (str): The endpoint of the resource (e.g. "teams")
+            id (int): The id of the entity
+            json (dict[str, Any]): The fields to update
+
+        Returns:
+            asyncio.Future[dict[str, Any] | None]: The future of the response of the request sent for the entity
+        """
+        loop = asyncio.get_running_loop()
+        if (pending := self._pending.get((endpoint, id))) is None:
+            pending = self._pending[endpoint, id] = PendingPatch(loop.create_future)
+        future = pending.add(json)
+        self.operations += 1
+
+        if len(self._pending) >= self.max_pending:
+            await self.flush()
+        elif self._timer is None and self.max_delay is not None:
+            self._timer = loop.call_later(self.max_delay, self._flush_later)
+        return future
+
+    def _flush_later(self) -> None:
+        task = asyncio.ensure_future(self.flush())
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+
+    async def flush(self) -> None:
+        """Send the pending operations, one request per entity, and wait for their responses"""
+        pending, self._pending = self._pending, {}
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self.requests += len(pending)
+        semaphore = asyncio.Semaphore(max(self.concurrency, 1))
+
+        async def send(endpoint: str, id: int, patch: PendingPatch["asyncio.Future[dict[str, Any] | None]"]) -> None:
+            try:
+                async with semaphore:
+                    result = await self.http.patch_item(endpoint, id, patch.json)
+            except Exception as e:
+                patch.set_exception(e)
+            else:
+                patch.set_result(result)
+
+        await asyncio.gather(*(send(endpoint, id, patch) for (endpoint, id), patch in pending.items()))
@@ -0,0 +1,20 @@
+import asyncio
+import os
+
+from ctfdpy.ctfdpy_async import AsyncCTFDClient, UserInput
+
+
+async def main():
+    async with AsyncCTFDClient(os.environ["CTFD_URL"], os.environ["CTFD_TOKEN"], concurrency=10) as client:
+        team, errors = await client.create_full_team(
+            "async-team",
+            "password",
+            [UserInput(f"async-user-{i}", f"async-user-{i}@example.com", "password") for i in range(4)],
+        )
+        print(team, errors)
+
+        users, teams = await asyncio.gather(client.users.get_users(), client.teams.get_teams())
+        print(f"{len(users or [])} users and {len(teams or [])} teams")
+
+if __name__ == "__main__":
+    asyncio.run(main())
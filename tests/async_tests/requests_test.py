@@ -0,0 +1,138 @@
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import httpx
+
+from ctfdpy.ctfdpy.models.inputs import UserInput
+from ctfdpy.ctfdpy_async.ctfd import AsyncCTFDClient
+from ctfdpy.ctfdpy_async.fleet import AsyncFleet
+from ctfdpy.ctfdpy_async.http import AsyncHTTPClient
+
+
+def _paginated_response(page: int, pages: int) -> httpx.Response:
+    return httpx.Response(
+        200,
+        json={
+            "meta": {"pagination": {"page": page, "pages": pages, "per_page": 1, "total": pages}},
+            "success": "true",
+            "data": [{"id": page, "name": f"user{page}"}],
+        },
+        request=httpx.Request("GET", f"http://localhost/users?page={page}")
+    )
+
+@patch("ctfdpy.ctfdpy_async.http.AsyncHTTPClient._call", new_callable=AsyncMock)
+def test_get_item(mocker: AsyncMock):
+    http = AsyncHTTPClient("http://localhost", "token")
+
+    mocker.return_value = httpx.Response(
+        200,
+        json={"success": "true", "data": {"id": 1, "name": "user", "email": ""}},
+        request=httpx.Request("GET", "http://localhost/users/1")
+    )
+    response = asyncio.run(http.get_item("users", 1))
+
+    assert response == {"id": 1, "name": "user", "email": ""}
+
+@patch("ctfdpy.ctfdpy_async.http.AsyncHTTPClient._call", new_callable=AsyncMock)
+def test_get_items(mocker: AsyncMock):
+    http = AsyncHTTPClient("http://localhost", "token", concurrency=3)
+
+    mocker.side_effect = lambda endpoint, method, params=None, json=None, **_: _paginated_response(
+        (params or {}).get("page", 1), 5
+    )
+
+    response = asyncio.run(http.get_items("users"))
+    assert [item["id"] for item in response] == [1, 2, 3, 4, 5]
+
+@patch("ctfdpy.ctfdpy_async.http.AsyncHTTPClient._call", new_callable=AsyncMock)
+def test_create_full_team(mocker: AsyncMock):
+    client = AsyncCTFDClient("http://localhost", "token")
+
+    def call(endpoint, method, params=None, json=None, **_):
+        if endpoint == "teams":
+            data = {"id": 1, "name": json["name"]}
+        elif endpoint == "users":
+            data = {"id": 2, "name": json["name"], "email": json["email"]}
+        elif endpoint == "teams/1/members":
+            data = {"members": [2]}
+        else:
+            data = {"id": 1, "name": "team", "members": [2]}
+        return httpx.Response(200, json={"success": True, "data": data}, request=httpx.Request(method.value, f"http://localhost/{endpoint}"))
+    mocker.side_effect = call
+
+    team, errors = asyncio.run(client.create_full_team("team", "password", [UserInput("user", "user@ctfd.io", "password")]))
+    assert errors == []
+    assert team.id == 1
+    assert team.members == [2]
+
+@patch("ctfdpy.ctfdpy_async.http.AsyncHTTPClient._call", new_callable=AsyncMock)
+def test_iter_users(mocker: AsyncMock):
+    client = AsyncCTFDClient("http://localhost", "token")
+
+    mocker.side_effect = lambda endpoint, method, params=None, json=None, **_: _paginated_response(
+        (params or {}).get("page", 1), 3
+    )
+
+    async def collect() -> list[str]:
+        return [user.name async for user in client.users.iter_users()]
+
+    assert asyncio.run(collect()) == ["user1", "user2", "user3"]
+
+
+def test_async_scoreboard_poller():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"success": True, "data": [{"pos": 1, "account_id": 1, "name": "team", "score": 10}]})
+
+    async def poll():
+        async with AsyncCTFDClient("http://ctfd.local/api/v1", "token", transport=httpx.MockTransport(handler)) as client:
+            poller = client.scoreboard.poller()
+            return await poller.poll(), await poller.poll()
+
+    first, second = asyncio.run(poll())
+    assert [change.account_id for change in first] == [1] and first[0].joined
+    assert second == []
+
+
+def test_async_patch_queue():
+    patches: list[bytes] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        patches.append(request.content)
+        return httpx.Response(200, json={"success": True, "data": {"id": 1}})
+
+    async def update():
+        async with AsyncCTFDClient("http://ctfd.local/api/v1", "token", transport=httpx.MockTransport(handler)) as client:
+            async with client.http.patch_queue() as queue:
+                first = await client.teams.update_team(1, queue=queue, hidden=True)
+                second = await client.teams.update_team(1, queue=queue, banned=False)
+            return await first, await second
+
+    assert asyncio.run(update()) == ({"id": 1}, {"id": 1})
+    assert len(patches) == 1
+
+
+def test_async_fleet():
+    def transport(status: int) -> httpx.MockTransport:
+        return httpx.MockTransport(lambda request: httpx.Response(status, json={"success": status == 200, "data": [{"id": 1}], "message": "down"}))
+
+    async def run():
+        async with AsyncFleet() as fleet:
+            fleet.add("up", "http://up.local", "token", transport=transport(200))
+            fleet.add("down", "http://down.local", "token", transport=transport(500))
+            return await fleet.get_users()
+
+    result = asyncio.run(run())
+    assert [user.id for user in result.results["up"]] == [1]
+    assert list(result.errors) == ["down"]
+
+
+def test_async_stream_teams():
+    def handler(request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params.get("page", 1))
+        return httpx.Response(200, json={"success": True, "meta": {"pagination": {"page": page, "pages": 2}}, "data": [{"id": page}]})
+
+    async def stream() -> list[int]:
+        async with AsyncCTFDClient("http://ctfd.local/api/v1", "token", transport=httpx.MockTransport(handler)) as client:
+            return [team.id async for team in client.teams.stream_teams()]
+
+    assert asyncio.run(stream()) == [1, 2]
@@ -0,0 +1,25 @@
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import httpx
+
+from ctfdpy.ctfdpy.singleflight import AsyncSingleFlight
+from ctfdpy.ctfdpy_async.http import AsyncHTTPClient
+
+
+@patch("ctfdpy.ctfdpy_async.http.AsyncHTTPClient._call", new_callable=AsyncMock)
+def test_async_coalesced_get_items(mocker: AsyncMock):
+    http = AsyncHTTPClient("http://localhost", "token", single_flight=True)
+
+    async def call(endpoint, method, params=None, json=None, **_):
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"success": True, "data": [{"id": 1}]}, request=httpx.Request("GET", "http://localhost/users"))
+    mocker.side_effect = call
+
+    async def run() -> list:
+        return await asyncio.gather(*(http.get_items("users") for _ in range(10)))
+
+    results = asyncio.run(run())
+    assert results == [[{"id": 1}]] * 10
+    assert mocker.call_count == 1
+    assert isinstance(http.flights, AsyncSingleFlight)
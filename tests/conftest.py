@@ -0,0 +1,9 @@
+import pytest
+
+from benchmarks.mock_ctfd import MockCTFd
+
+
+@pytest.fixture
+def ctfd() -> MockCTFd:
+    """An empty in-memory CTFd, see benchmarks.mock_ctfd"""
+    return MockCTFd()
@@ -0,0 +1,39 @@
+import httpx
+import pytest
+
+from ctfdpy.ctfdpy.analytics import Columns, get_backend
+from ctfdpy.ctfdpy.ctfd import CTFDClient
+
+USERS = [
+    {"id": 1, "name": "alice", "score": 300, "country": "FR", "bracket_id": 1, "team_id": 1},
+    {"id": 2, "name": "bob", "score": 100, "country": "FR", "bracket_id": None, "team_id": 1},
+    {"id": 3, "name": "carol", "score": 500, "country": "DE", "bracket_id": 1, "team_id": 2},
+    {"id": 4, "name": "dave", "score": 0, "country": None, "team_id": None},
+]
+
+
+@pytest.mark.parametrize("backend", ["array", "numpy"])
+def test_columns(backend: str):
+    if backend == "numpy":
+        pytest.importorskip("numpy")
+    columns = Columns.from_payloads(USERS, backend=backend)
+
+    assert len(columns) == 4
+    assert list(columns["bracket_id"]) == [1, 0, 1, 0]
+    assert columns.count_by("country") == {"FR": 2, "DE": 1, "": 1}
+    assert columns.count_by("team_id") == {1: 2, 0: 1, 2: 1}
+    assert columns.sum_by("country") == {"FR": 400, "DE": 500, "": 0}
+    assert columns.mean_by("bracket_id") == {0: 50.0, 1: 400.0}
+    assert [row["name"] for row in columns.top_k(2).rows()] == ["carol", "alice"]
+    assert [count for _, _, count in columns.histogram(bins=5)] == [1, 1, 0, 1, 1]
+
+
+def test_get_columns():
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json={"success": True, "data": USERS}))
+    client = CTFDClient("http://ctfd.local/api/v1", "token", transport=transport)
+
+    columns = client.users.get_columns(("id", "score"), backend="array")
+    assert list(columns.columns) == ["id", "score"]
+    assert list(columns["score"]) == [300, 100, 500, 0]
+    with pytest.raises(ValueError):
+        get_backend("arrow")
@@ -0,0 +1,93 @@
+from unittest.mock import MagicMock, patch
+
+import httpx
+
+from ctfdpy.ctfdpy.cache import ResponseCache, ValidatorCache
+from ctfdpy.ctfdpy.http import HTTPClient
+
+
+def _response(method: str, endpoint: str, data: dict) -> httpx.Response:
+    return httpx.Response(200, json={"success": True, "data": data}, request=httpx.Request(method, f"http://localhost/{endpoint}"))
+
+
+def test_lru_eviction():
+    cache = ResponseCache(maxsize=2)
+    cache.set("users/1", {"id": 1})
+    cache.set("users/2", {"id": 2})
+    assert cache.get("users/1") == {"id": 1}
+
+    cache.set("users/3", {"id": 3})
+    assert cache.get("users/2") is None
+    assert cache.get("users/1") == {"id": 1}
+    assert cache.stats() == {"hits": 2, "misses": 1, "evictions": 1, "size": 2}
+
+
+@patch("ctfdpy.ctfdpy.cache.time.monotonic")
+def test_endpoint_ttls(monotonic: MagicMock):
+    cache = ResponseCache(ttl=10, ttls={"teams": 60, "users": 0})
+    monotonic.return_value = 0
+    cache.set("teams/1", {"id": 1})
+    cache.set("scoreboard", {"data": []})
+    cache.set("users/1", {"id": 1})
+
+    monotonic.return_value = 30
+    assert cache.get("teams/1") == {"id": 1}
+    assert cache.get("scoreboard") is None
+    assert cache.get("users/1") is None
+
+
+@patch("ctfdpy.ctfdpy.http.HTTPClient._call")
+def test_cached_get_item(mocker: MagicMock):
+    http = HTTPClient("http://localhost", "token", cache=ResponseCache())
+
+    mocker.side_effect = lambda endpoint, method, params=None, json=None, **_: _response(method.value, endpoint, {"id": 1, "name": "team"})
+
+    assert http.get_item("teams", 1) == {"id": 1, "name": "team"}
+    assert http.get_item("teams", 1) == {"id": 1, "name": "team"}
+    assert mocker.call_count == 1
+
+    http.post_item("teams/1/members", json={"user_id": 2})
+    assert http.get_item("teams", 1) == {"id": 1, "name": "team"}
+    assert mocker.call_count == 3
+    assert http.cache.stats()["hits"] == 1
+
+
+@patch("ctfdpy.ctfdpy.http.HTTPClient._call")
+def test_conditional_requests(mocker: MagicMock):
+    http = HTTPClient("http://localhost", "token", validators=ValidatorCache())
+    sent_headers: list[dict | None] = []
+
+    def call(endpoint, method, params=None, json=None, headers=None):
+        sent_headers.append(headers)
+        request = httpx.Request(method.value, f"http://localhost/{endpoint}")
+        if headers and headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304, request=request)
+        return httpx.Response(
+            200,
+            json={"success": True, "data": [{"id": 1}], "meta": {"pagination": {"pages": 1}}},
+            headers={"ETag": '"v1"', "Last-Modified": "Mon, 20 May 2024 10:00:00 GMT"},
+            request=request,
+        )
+    mocker.side_effect = call
+
+    first = http.get_items("users")
+    first.append({"id": 2})
+    second = http.get_items("users")
+
+    assert second == [{"id": 1}]
+    assert sent_headers == [None, {"If-None-Match": '"v1"', "If-Modified-Since": "Mon, 20 May 2024 10:00:00 GMT"}]
+    assert http.validators.stats() == {"revalidated": 1, "modified": 1, "size": 1}
+
+
+def test_membership_invalidates_user():
+    cache = ResponseCache()
+    cache.set("users/2", {"id": 2, "team_id": None})
+    cache.set("users/3", {"id": 3, "team_id": None})
+    cache.set("users", {"data": []}, {"page": 1})
+    cache.set("teams/1", {"id": 1})
+
+    cache.invalidate("teams/1/members", {"user_id": 2})
+    assert cache.get("users/2") is None
+    assert cache.get("users", {"page": 1}) is None
+    assert cache.get("teams/1") is None
+    assert cache.get("users/3") == {"id": 3, "team_id": None}
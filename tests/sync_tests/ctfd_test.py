@@ -0,0 +1,46 @@
+import pytest
+
+from benchmarks.mock_ctfd import MockCTFd
+from ctfdpy.ctfdpy.ctfd import CTFDClient
+from ctfdpy.ctfdpy.exceptions import HTTPError
+from ctfdpy.ctfdpy.models.inputs import TeamInput, UserInput
+
+
+def test_create_full_team(ctfd: MockCTFd):
+    client = CTFDClient("http://localhost", "token", concurrency=4, transport=ctfd.transport())
+
+    team, errors = client.create_full_team(
+        "team",
+        "password",
+        [UserInput(f"user{i}", f"user{i}@ctfd.io", "password") for i in range(4)],
+    )
+    assert errors == []
+    assert sorted(team.members) == [1, 2, 3, 4]
+
+
+def test_create_full_teams(ctfd: MockCTFd):
+    ctfd.create("users", {"name": "taken", "email": "taken@ctfd.io"})
+    client = CTFDClient("http://localhost", "token", transport=ctfd.transport())
+
+    results = client.create_full_teams(
+        (TeamInput("team1", "password"), [UserInput("user1", "user1@ctfd.io", "password")]),
+        (TeamInput("team2", "password"), [UserInput("taken", "taken@ctfd.io", "password"), UserInput("user2", "user2@ctfd.io", "password")]),
+        concurrency=3,
+    )
+    assert [team.name for team, _ in results] == ["team1", "team2"]
+    assert results[0][1] == []
+    assert len(results[1][0].members) == 1
+    assert [type(error) for error in results[1][1]] == [HTTPError]
+
+
+def test_create_batch_users(ctfd: MockCTFd):
+    ctfd.create("users", {"name": "taken", "email": "taken@ctfd.io"})
+    client = CTFDClient("http://localhost", "token", transport=ctfd.transport())
+    users = [UserInput(name, f"{name}@ctfd.io", "password") for name in ("user1", "taken", "user2")]
+
+    results, errors = client.users.create_batch_users(*users, raise_errors=False, concurrency=3)
+    assert [user and user.name for user in results] == ["user1", None, "user2"]
+    assert [type(error) for error in errors] == [HTTPError]
+
+    with pytest.raises(HTTPError):
+        client.users.create_batch_users(UserInput("taken", "taken@ctfd.io", "password"))
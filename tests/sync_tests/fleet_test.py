@@ -0,0 +1,56 @@
+import threading
+
+import httpx
+import pytest
+
+from benchmarks.mock_ctfd import MockCTFd
+from ctfdpy.ctfdpy.exceptions import HTTPError
+from ctfdpy.ctfdpy.fleet import Fleet
+from ctfdpy.ctfdpy.ratelimit import TokenBucket
+
+
+def _instance(*names: str, barrier: threading.Barrier | None = None) -> MockCTFd:
+    # The first request of each instance waits for the other instances, which fails if they are operated one by one
+    barriers = [barrier] if barrier is not None else []
+
+    def wait(request: httpx.Request, payload: dict) -> None:
+        if barriers:
+            barriers.pop().wait(timeout=1)
+
+    ctfd = MockCTFd(fault=wait)
+    for name in names:
+        ctfd.create("users", {"name": name})
+    return ctfd
+
+
+def _down(request: httpx.Request, payload: dict) -> httpx.Response:
+    return httpx.Response(500, json={"success": False, "message": "down"})
+
+
+def test_fleet_fan_out():
+    barrier = threading.Barrier(2)
+    with Fleet(timeout=1.0) as fleet:
+        fleet.add("ctf1", "http://ctf1.local/api/v1", "token1", transport=_instance("alice", barrier=barrier).transport())
+        fleet.add("ctf2", "http://ctf2.local/api/v1", "token2", transport=_instance("bob", "alice", barrier=barrier).transport())
+        fleet.add("down", "http://down.local/api/v1", "token3", transport=MockCTFd(fault=_down).transport())
+
+        result = fleet.run(lambda client: len(client.users.get_users()), names=["ctf1", "ctf2"])
+        assert result.results == {"ctf1": 1, "ctf2": 2} and result.ok
+
+        banned = fleet.ban_user("alice")
+        assert banned["ctf1"].id == 1 and banned["ctf2"].id == 2 and banned["ctf2"].banned
+        assert isinstance(banned.errors["down"], HTTPError)
+        with pytest.raises(HTTPError):
+            banned["down"]
+
+
+def test_fleet_isolation():
+    with pytest.raises(ValueError):
+        Fleet(rate_limiter=TokenBucket(10))
+    with pytest.raises(ValueError):
+        Fleet(transport=httpx.HTTPTransport())
+
+    fleet = Fleet({"ctf1": ("http://ctf1.local", "token"), "ctf2": ("http://ctf2.local", "token")}, concurrency=4)
+    assert fleet["ctf1"].http is not fleet["ctf2"].http
+    with pytest.raises(ValueError):
+        fleet.add("ctf1", "http://other.local", "token")
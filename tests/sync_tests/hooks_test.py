@@ -0,0 +1,48 @@
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+from ctfdpy.ctfdpy.exceptions import RequestError
+from ctfdpy.ctfdpy.hooks import Hooks, LatencyCollector, RequestEvent, endpoint_template
+from ctfdpy.ctfdpy.http import HTTPClient
+
+
+def test_endpoint_template():
+    assert endpoint_template("teams/12/members") == "teams/{id}/members"
+    assert endpoint_template("users/3") == "users/{id}"
+    assert endpoint_template("scoreboard/top/10") == "scoreboard/top/{id}"
+    assert endpoint_template("users") == "users"
+
+
+@patch("ctfdpy.ctfdpy.http.HTTPClient._call")
+def test_request_hooks(mocker: MagicMock):
+    hooks = Hooks()
+    collector = hooks.add(LatencyCollector())
+    started: list[RequestEvent] = []
+    failed: list[RequestEvent] = []
+    hooks.on_request.append(started.append)
+    hooks.on_error.append(failed.append)
+    http = HTTPClient("http://localhost", "token", hooks=hooks)
+
+    request = httpx.Request("GET", "http://localhost/users/1")
+    mocker.side_effect = [
+        httpx.Response(200, json={"success": True, "data": {"id": 1}}, request=request),
+        httpx.Response(200, json={"success": True, "data": {"id": 2}}, request=request),
+        httpx.ConnectError("refused", request=request),
+    ]
+    http.get_item("users", 1)
+    http.get_item("users", 2)
+    with pytest.raises(RequestError):
+        http.get_item("users", 3)
+
+    assert [event.endpoint for event in started] == ["users/1", "users/2", "users/3"]
+    assert failed == [started[2]]
+    assert isinstance(failed[0].error, httpx.ConnectError)
+
+    summary = collector.summary()["GET users/{id}"]
+    assert summary["count"] == 2
+    assert summary["errors"] == 1
+    assert summary["statuses"] == {200: 2}
+    assert summary["bytes"] > 0
+    assert 0 < summary["max"] <= summary["p95"]
@@ -0,0 +1,33 @@
+from ctfdpy.ctfdpy.models.data import TeamData, UserData
+from ctfdpy.ctfdpy.models.index import EntityIndex, TeamIndex
+
+
+def test_entity_index():
+    users = EntityIndex([UserData(id=i, name=f"user{i}", email=f"user{i}@ctfd.io", team_id=i % 2) for i in range(1, 5)])
+
+    assert users.by_id(3).name == "user3"
+    assert users.by_name("user2").id == 2
+    assert users.by_email("user4@ctfd.io").id == 4
+    assert [user.id for user in users.by_team_id(1)] == [1, 3]
+    assert users.by_id(5) is None
+
+    users.append(UserData(id=5, name="user5", team_id=1))
+    assert users.by_id(5).name == "user5"
+    assert [user.id for user in users.by_team_id(1)] == [1, 3, 5]
+
+    del users[0]
+    assert users.by_id(1) is None
+
+
+def test_team_index():
+    users = EntityIndex([UserData(id=i, name=f"user{i}") for i in range(1, 5)])
+    teams = TeamIndex([
+        TeamData(id=1, name="team1", members=[1, 2]),
+        TeamData(id=2, name="team2", members=[{"id": 3, "name": "user3"}, 4]),
+    ])
+
+    assert teams.team_of(3).name == "team2"
+    assert teams.team_of(5) is None
+    assert [user.name for user in teams.members_of(1, users)] == ["user1", "user2"]
+    assert [user.id for user in teams.members_of(2, users)] == [3, 4]
+    assert isinstance(teams, list)
@@ -0,0 +1,63 @@
+import httpx
+
+from benchmarks.mock_ctfd import MockCTFd
+from ctfdpy.ctfdpy.cache import ResponseCache
+from ctfdpy.ctfdpy.ctfd import CTFDClient
+from ctfdpy.ctfdpy.mirror import Mirror
+
+
+def test_incremental_sync():
+    pages: list[int] = []
+
+    def record_page(request: httpx.Request, _: dict) -> None:
+        if request.url.path == "/users":
+            pages.append(int(request.url.params.get("page", 1)))
+
+    ctfd = MockCTFd(per_page=10, fault=record_page)
+    for i in range(1, 26):
+        ctfd.create("users", {"id": i, "name": f"user{i}", "email": f"user{i}@ctfd.io", "team_id": i % 3})
+    client = CTFDClient("http://localhost", "token", transport=ctfd.transport())
+
+    with Mirror(client) as mirror:
+        assert mirror.sync("users") == 25
+        assert pages == [1, 2, 3]
+
+        for i in range(26, 33):
+            ctfd.create("users", {"id": i, "name": f"user{i}", "email": f"user{i}@ctfd.io", "team_id": 0})
+        for i in range(3, 11):
+            del ctfd.resources["users"][i]
+        pages.clear()
+        assert mirror.sync("users") == 7
+        assert pages == [3, 2, 3]
+
+        ctfd.resources["users"][12]["name"] = "renamed"
+        assert mirror.refresh("users", 3, 12) == 1
+        assert mirror.get_user(3) is None
+        assert mirror.find_users(name="renamed")[0].id == 12
+        assert mirror.find_users(email="user30@ctfd.io")[0].id == 30
+        assert [user.id for user in mirror.find_users(team_id=2)] == [2, 5, 8, 11, 14, 17, 20, 23]
+
+
+def test_sync_teams(ctfd: MockCTFd):
+    ctfd.create("teams", {"name": "team", "email": "team@ctfd.io"})
+    client = CTFDClient("http://localhost", "token", transport=ctfd.transport())
+
+    with Mirror(client) as mirror:
+        assert mirror.sync_all() == {"users": 0, "teams": 1}
+        assert mirror.find_teams(name="team")[0].email == "team@ctfd.io"
+        columns = [row[1] for row in mirror.db.execute("PRAGMA table_info(teams)")]
+        assert columns == ["id", "name", "email", "payload"]
+
+
+def test_refresh_bypasses_cache(ctfd: MockCTFd):
+    for i in range(1, 4):
+        ctfd.create("users", {"name": f"user{i}", "email": f"user{i}@ctfd.io"})
+    client = CTFDClient("http://localhost", "token", transport=ctfd.transport(), cache=ResponseCache())
+
+    with Mirror(client) as mirror:
+        mirror.sync("users")
+        assert client.http.get_item("users", 2)["name"] == "user2"
+
+        ctfd.resources["users"][2]["name"] = "renamed"
+        assert mirror.refresh("users", 2) == 1
+        assert mirror.get_user(2).name == "renamed"
@@ -0,0 +1,71 @@
+from dataclasses import asdict, fields
+from datetime import datetime, timezone
+from inspect import signature
+
+import pytest
+
+from ctfdpy.ctfdpy.decoder import get_decoder
+from ctfdpy.ctfdpy.exceptions import ParseRequestError
+from ctfdpy.ctfdpy.models.data import TeamData, UserData, decode_models, project
+
+
+def test_user_from_dict():
+    user = UserData.from_dict({"id": 1, "name": "user", "created": "2024-03-20T12:34:56Z", "new_ctfd_field": True})
+
+    assert user.id == 1
+    assert user.name == "user"
+    assert user.created == datetime(2024, 3, 20, 12, 34, 56, tzinfo=timezone.utc)
+
+    with pytest.raises(ParseRequestError):
+        UserData.from_dict({"id": 1, "created": "20/03/2024"})
+
+
+def test_team_nested_members():
+    payload = {"id": 1, "members": [{"id": 2, "name": "user", "unknown": 0}, 3], "captain": {"id": 2}}
+    team = TeamData.from_dict(payload)
+
+    assert team.members is payload["members"] and team.captain is payload["captain"]
+    members = team.get_members()
+    assert members[0] == UserData(id=2, name="user")
+    assert members[1] == 3
+    assert team.get_members() is members and team.members is members
+    assert team.get_captain().id == 2 and team.get_captain() is team.captain
+    assert TeamData().captain is None and TeamData().get_captain() is None
+    assert TeamData(members=None).get_members() == []
+    assert not hasattr(team, "__dict__")
+
+
+def test_team_dataclass_contract():
+    team = TeamData(id=1, members=[UserData(id=2)], captain=UserData(id=2))
+
+    assert [item.name for item in fields(TeamData)] == list(signature(TeamData).parameters)
+    assert asdict(team)["members"] == [asdict(UserData(id=2))]
+    assert asdict(team)["captain"]["id"] == 2
+    assert "members=[UserData(id=2" in repr(team)
+
+    decoded = TeamData.from_dict({"id": 1, "members": [{"id": 2}], "captain": {"id": 2}})
+    decoded.get_members(), decoded.get_captain()
+    assert team == decoded
+    assert team != TeamData(id=1, members=[UserData(id=3)], captain=UserData(id=2))
+
+
+def test_decode_models():
+    users = decode_models(UserData, [{"id": i, "extra": i} for i in range(3)])
+    assert [user.id for user in users] == [0, 1, 2]
+
+
+def test_project():
+    rows = project(UserData, [{"id": 1, "name": "user", "created": "2024-03-20T12:34:56Z", "extra": 0}, {"id": 2}], ("id", "name", "created"))
+
+    assert rows[0] == (1, "user", datetime(2024, 3, 20, 12, 34, 56, tzinfo=timezone.utc))
+    assert rows[1].name == ""
+    assert type(rows[0]).__name__ == "UserDataRow"
+    with pytest.raises(ValueError):
+        project(UserData, [], ("id", "unknown"))
+
+
+def test_get_decoder():
+    assert get_decoder("json")(b'{"a": 1}') == {"a": 1}
+    assert get_decoder()(b'{"a": 1}') == {"a": 1}
+    with pytest.raises(ValueError):
+        get_decoder("yaml")
@@ -0,0 +1,34 @@
+import httpx
+
+from ctfdpy.ctfdpy.pagination import PageCollector
+
+
+def _page(page: int, ids: list[int], pages: int, total: int) -> dict:
+    return {"data": [{"id": id} for id in ids], "meta": {"pagination": {"page": page, "pages": pages, "total": total}}}
+
+
+def test_page_collector():
+    collector = PageCollector(_page(1, [1, 2], 3, 6))
+    assert collector.missing() == [2, 3]
+
+    collector.update({2: _page(2, [2, 3], 3, 6)}, {3: httpx.ConnectError("connection lost")})
+    assert not collector.drifted()
+    assert collector.missing() == [3]
+    assert list(collector.result().failed_pages) == [3]
+
+    collector.update({3: _page(3, [4, 5], 3, 6)}, {})
+    listing = collector.result()
+    assert [item["id"] for item in listing.items] == [1, 2, 3, 4, 5]
+    assert listing.duplicates == 1
+    assert listing.refetched_pages == [3]
+    assert listing.complete and listing.consistent
+
+
+def test_page_collector_rebase():
+    collector = PageCollector(_page(1, [1, 2], 2, 4))
+    collector.update({2: _page(2, [4], 2, 3)}, {})
+    assert collector.drifted()
+
+    collector.rebase(_page(1, [1, 2], 2, 3))
+    assert collector.missing() == []
+    assert collector.result().consistent
@@ -0,0 +1,73 @@
+import threading
+
+import httpx
+
+from ctfdpy.ctfdpy.ctfd import CTFDClient
+from ctfdpy.ctfdpy.models.data import ScoreboardEntry
+from ctfdpy.ctfdpy.poller import AdaptiveInterval, diff_standings
+
+
+def _standings(*scores: tuple[int, int]) -> list[dict]:
+    return [
+        {"pos": pos, "account_id": id, "account_type": "team", "name": f"team{id}", "score": score, "members": []}
+        for pos, (id, score) in enumerate(scores, 1)
+    ]
+
+
+def test_diff_standings():
+    previous = {entry.account_id: entry for entry in map(ScoreboardEntry.from_dict, _standings((1, 300), (2, 200), (3, 100)))}
+    current = [ScoreboardEntry.from_dict(entry) for entry in _standings((2, 400), (1, 300), (4, 50))]
+
+    changes = diff_standings(previous, current)
+    assert [(change.account_id, change.rank_delta, change.score_delta) for change in changes] == [(2, 1, 200), (1, -1, 0), (4, 0, 50), (3, 0, -100)]
+    assert changes[2].joined and changes[3].left
+    assert diff_standings({entry.account_id: entry for entry in current}, current) == []
+
+
+def test_adaptive_interval():
+    interval = AdaptiveInterval(4.0, 1.0, 9.0)
+    assert interval.update(True) == 2.0
+    assert interval.update(True) == 1.0
+    assert interval.update(True) == 1.0
+    assert interval.update(False) == 1.5
+    assert interval.backoff() == 3.0
+    assert AdaptiveInterval(100.0, 1.0, 9.0).current == 9.0
+
+
+def test_scoreboard_poller():
+    snapshots = [_standings((1, 100)), _standings((1, 100)), _standings((2, 200), (1, 100))]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        data = snapshots.pop(0) if len(snapshots) > 1 else snapshots[0]
+        return httpx.Response(200, json={"success": True, "data": data})
+
+    client = CTFDClient("http://ctfd.local/api/v1", "token", transport=httpx.MockTransport(handler))
+    poller = client.scoreboard.poller(interval=0.001, min_interval=0.001, max_interval=0.001)
+    stop = threading.Event()
+    received = []
+
+    def on_changes(changes):
+        received.append([(change.account_id, change.new_pos) for change in changes])
+        if len(received) == 2:
+            stop.set()
+
+    poller.run(on_changes, stop)
+    assert received == [[(1, 1)], [(2, 1), (1, 2)]]
+    assert poller.polls == 3
+
+
+def test_scoreboard_poller_backoff():
+    responses = [httpx.Response(500, json={"success": False, "message": "Internal Server Error"}), httpx.Response(200, json={"success": True, "data": _standings((1, 100))})]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return responses.pop(0)
+
+    client = CTFDClient("http://ctfd.local/api/v1", "token", transport=httpx.MockTransport(handler))
+    poller = client.scoreboard.poller(interval=0.001, min_interval=0.001, max_interval=0.004)
+    stop = threading.Event()
+
+    for changes in poller.changes(stop):
+        assert [(change.account_id, change.new_pos) for change in changes] == [(1, 1)]
+        stop.set()
+    assert poller.polls == 1
+    assert responses == []
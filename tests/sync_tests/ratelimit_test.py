@@ -0,0 +1,71 @@
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+from ctfdpy.ctfdpy.exceptions import HTTPError
+from ctfdpy.ctfdpy.http import HTTPClient
+from ctfdpy.ctfdpy.ratelimit import RetryPolicy, TokenBucket, parse_retry_after
+
+
+def _response(status_code: int, headers: dict | None = None) -> httpx.Response:
+    json = {"success": True, "data": {"id": 1}} if status_code == 200 else {"message": "Too many requests"}
+    return httpx.Response(status_code, json=json, headers=headers, request=httpx.Request("GET", "http://localhost/users/1"))
+
+
+@patch("ctfdpy.ctfdpy.http.time.sleep")
+@patch("ctfdpy.ctfdpy.http.HTTPClient._call")
+def test_retry_after(mocker: MagicMock, sleep: MagicMock):
+    http = HTTPClient("http://localhost", "token", retry=RetryPolicy())
+    mocker.side_effect = [_response(429, {"Retry-After": "2"}), _response(503), _response(200)]
+
+    assert http.get_item("users", 1) == {"id": 1}
+    assert sleep.call_args_list[0].args == (2.0,)
+    assert 0.5 <= sleep.call_args_list[1].args[0] <= 1.0
+    assert (http.metrics.requests, http.metrics.retries, http.metrics.throttled, http.metrics.throttled_time) == (1, 2, 1, 2.0)
+
+
+@patch("ctfdpy.ctfdpy.http.time.sleep")
+@patch("ctfdpy.ctfdpy.http.HTTPClient._call")
+def test_retry_exhausted_and_non_idempotent(mocker: MagicMock, sleep: MagicMock):
+    http = HTTPClient("http://localhost", "token", retry=RetryPolicy(max_retries=2))
+    mocker.return_value = _response(429)
+
+    with pytest.raises(HTTPError):
+        http.get_item("users", 1)
+    assert mocker.call_count == 3
+
+    mocker.reset_mock()
+    with pytest.raises(HTTPError):
+        http.post_item("users", json={"name": "user"})
+    assert mocker.call_count == 1
+
+
+@patch("ctfdpy.ctfdpy.http.time.sleep")
+@patch("ctfdpy.ctfdpy.http.HTTPClient._call")
+def test_retry_transport_error(mocker: MagicMock, sleep: MagicMock):
+    http = HTTPClient("http://localhost", "token", retry=RetryPolicy())
+    mocker.side_effect = [httpx.ConnectError("refused", request=httpx.Request("GET", "http://localhost/users/1")), _response(200)]
+
+    assert http.get_item("users", 1) == {"id": 1}
+    assert http.metrics.retries == 1
+
+
+@patch("ctfdpy.ctfdpy.ratelimit.time.monotonic")
+def test_token_bucket(monotonic: MagicMock):
+    monotonic.return_value = 0.0
+    bucket = TokenBucket(rate=10, burst=2)
+
+    assert bucket._reserve() == 0
+    assert bucket._reserve() == 0
+    assert bucket._reserve() == pytest.approx(0.1)
+
+    bucket.on_throttled(retry_after=1)
+    assert bucket.rate == 5
+    assert bucket._reserve() == pytest.approx(1.4)
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None
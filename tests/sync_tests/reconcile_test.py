@@ -0,0 +1,72 @@
+from benchmarks.mock_ctfd import MockCTFd
+from ctfdpy.ctfdpy.ctfd import CTFDClient
+from ctfdpy.ctfdpy.models.data import UserData
+from ctfdpy.ctfdpy.models.index import EntityIndex
+from ctfdpy.ctfdpy.models.inputs import TeamInput, UserInput
+from ctfdpy.ctfdpy.reconcile import Action, plan
+
+
+def test_plan():
+    existing = EntityIndex([
+        UserData(id=1, name="alice", email="alice@ctfd.io", affiliation="A"),
+        UserData(id=2, name="bob", email="bob@ctfd.io"),
+    ])
+    changes = plan([
+        UserInput("alice", "alice@ctfd.io", "password", affiliation="A"),
+        UserInput("robert", "bob@ctfd.io", "password", affiliation="B"),
+        UserInput("carol", "carol@ctfd.io", "password"),
+        UserInput("carol", "carol@ctfd.io", "password"),
+    ], existing)
+
+    assert [change.action for change in changes] == [Action.SKIP, Action.UPDATE, Action.CREATE, Action.SKIP]
+    assert changes[1].existing.id == 2 and changes[1].fields == {"affiliation": "B"}
+    assert changes[3].duplicate_of == 2
+
+
+def test_reconcile_batch_users(ctfd: MockCTFd):
+    client = CTFDClient("http://ctfd.local", "token", transport=ctfd.transport())
+    users = [UserInput(f"user{i}", f"user{i}@ctfd.io", "password", affiliation="A") for i in range(3)]
+    client.users.create_batch_users(*users)
+
+    ctfd.log.clear()
+    results, errors = client.users.create_batch_users(
+        *users, UserInput("user1", "user1@ctfd.io", "password", affiliation="B"), UserInput("user3", "user3@ctfd.io", "password"),
+        reconcile=True,
+    )
+
+    assert [user.id for user in results] == [1, 2, 3, 2, 4] and errors == []
+    assert ctfd.writes() == [("POST", "users")]
+
+
+def test_reconcile_full_teams(ctfd: MockCTFd):
+    client = CTFDClient("http://ctfd.local", "token", transport=ctfd.transport())
+    members = [UserInput(f"user{i}", f"user{i}@ctfd.io", "password") for i in range(2)]
+    client.create_full_team("team", "password", members)
+
+    ctfd.log.clear()
+    results = client.create_full_teams(
+        (TeamInput("team", "password"), members + [UserInput("user2", "user2@ctfd.io", "password")]),
+        reconcile=True,
+    )
+
+    team, errors = results[0]
+    assert errors == []
+    assert sorted(team.members) == [1, 2, 3]
+    assert ctfd.writes() == [("POST", "users"), ("POST", "teams/1/members")]
+
+
+def test_reconcile_team_fields(ctfd: MockCTFd):
+    client = CTFDClient("http://ctfd.local", "token", transport=ctfd.transport())
+    members = [UserInput("user", "user@ctfd.io", "password")]
+    team = TeamInput("team", "password", website="https://team.io", bracket_id=2)
+    client.create_full_teams((team, members), reconcile=True)
+    assert ctfd.resources["teams"][1]["website"] == "https://team.io"
+
+    ctfd.log.clear()
+    client.create_full_teams((team, members), reconcile=True)
+    assert ctfd.writes() == []
+
+    team.website = "https://new.team.io"
+    (result, errors), = client.create_full_teams((team, members), reconcile=True)
+    assert errors == [] and result.website == "https://new.team.io"
+    assert ctfd.writes() == [("PATCH", "teams/1")]
@@ -3,7 +3,8 @@ import pytest
 from unittest.mock import MagicMock, patch
 
 from ctfdpy.ctfdpy.http import HTTPClient, HTTPMethod
-from ctfdpy.ctfdpy.exceptions import HTTPError
+from ctfdpy.ctfdpy.exceptions import HTTPError, PaginationError
+from ctfdpy.ctfdpy.users import Users
 
 @patch("ctfdpy.ctfdpy.http.HTTPClient._call")
 def test_request_call(mocker: MagicMock):
@@ -163,4 +164,130 @@ def test_patch_item(mocker: MagicMock):
 
     response = http.post_item("users", json={"name": "user", "email": "aze.rty@gmail.com"})
 
-    assert response == {"id": 1, "name": "user", "email": "aze.rty@gmail.com"}
\ No newline at end of file
+    assert response == {"id": 1, "name": "user", "email": "aze.rty@gmail.com"}
+
+def _paginated_response(page: int, pages: int) -> httpx.Response:
+    return httpx.Response(
+        200,
+        json={
+            "meta": {"pagination": {"page": page, "pages": pages, "per_page": 1, "total": pages}},
+            "success": "true",
+            "data": [{"id": page, "name": f"user{page}"}],
+        },
+        request=httpx.Request("GET", f"http://localhost/users?page={page}")
+    )
+
+@patch("ctfdpy.ctfdpy.http.HTTPClient._call")
+def test_get_items_concurrent(mocker: MagicMock):
+    http = HTTPClient("http://localhost", "token", concurrency=4)
+
+    mocker.side_effect = lambda endpoint, method, params=None, json=None, **_: _paginated_response(
+        (params or {}).get("page", 1), 6
+    )
+
+    response = http.get_items("users")
+    assert [item["id"] for item in response] == [1, 2, 3, 4, 5, 6]
+    assert mocker.call_count == 6
+
+@patch("ctfdpy.ctfdpy.http.HTTPClient._call")
+def test_get_items_failed_pages(mocker: MagicMock):
+    http = HTTPClient("http://localhost", "token")
+
+    def call(endpoint, method, params=None, json=None, **_):
+        page = (params or {}).get("page", 1)
+        if page == 3:
+            raise httpx.ConnectError("connection lost", request=httpx.Request("GET", "http://localhost/users"))
+        return _paginated_response(page, 4)
+    mocker.side_effect = call
+
+    try:
+        http.get_items("users", concurrency=2)
+    except PaginationError as e:
+        assert list(e.failed_pages) == [3]
+        assert [item["id"] for item in e.items] == [1, 2, 4]
+    else:
+        pytest.fail("PaginationError not raised")
+
+@patch("ctfdpy.ctfdpy.http.HTTPClient._call")
+def test_get_items_params(mocker: MagicMock):
+    http = HTTPClient("http://localhost", "token")
+    seen: list[dict] = []
+
+    def call(endpoint, method, params=None, json=None, **_):
+        seen.append(dict(params or {}))
+        return _paginated_response((params or {}).get("page", 1), 2)
+    mocker.side_effect = call
+
+    users = Users(http).get_users_projection(("id", "name"), field="name", q="user")
+    assert seen == [{"field": "name", "q": "user"}, {"field": "name", "q": "user", "page": 2}]
+    assert users == [(1, "user1"), (2, "user2")]
+    assert users[1].name == "user2"
+    assert list(Users(http).iter_users_projection(("name",))) == [("user1",), ("user2",)]
+
+@patch("ctfdpy.ctfdpy.http.HTTPClient._call")
+def test_fetch_all_drift(mocker: MagicMock):
+    http = HTTPClient("http://localhost", "token")
+    users = [{"id": id} for id in (4, 3, 2, 1)]
+
+    def call(endpoint, method, params=None, json=None, **_):
+        page = (params or {}).get("page", 1)
+        data = users[(page - 1) * 2:page * 2]
+        pages, total = -(-len(users) // 2), len(users)
+        if len(users) == 4:
+            users.insert(0, {"id": 5})
+        return httpx.Response(
+            200,
+            json={"success": True, "data": data, "meta": {"pagination": {"page": page, "pages": pages, "total": total}}},
+            request=httpx.Request("GET", "http://localhost/users"),
+        )
+    mocker.side_effect = call
+
+    listing = http.fetch_all("users")
+    assert [item["id"] for item in listing.items] == [5, 4, 3, 2, 1]
+    assert listing.pages == 3
+    assert listing.refetched_pages == [1]
+    assert listing.consistent and listing.complete
+
+@patch("ctfdpy.ctfdpy.http.HTTPClient._call")
+def test_iter_pages(mocker: MagicMock):
+    http = HTTPClient("http://localhost", "token")
+
+    mocker.side_effect = lambda endpoint, method, params=None, json=None, **_: _paginated_response(
+        (params or {}).get("page", 1), 3
+    )
+
+    pages = http.iter_pages("users")
+    assert next(pages) == [{"id": 1, "name": "user1"}]
+    assert [page[0]["id"] for page in pages] == [2, 3]
+    assert mocker.call_count == 3
+
+def test_transport_and_shared_client():
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json={"success": True, "data": {"id": 1}})
+
+    with HTTPClient("http://ctfd.local/api/v1", "token", transport=httpx.MockTransport(handler), timeout=1.0) as http:
+        assert http.get_item("users", 1) == {"id": 1}
+        assert http.client.timeout == httpx.Timeout(1.0)
+
+    shared = httpx.Client(transport=httpx.MockTransport(handler))
+    with HTTPClient("http://other.local/api/v1", "other", client=shared) as http:
+        assert http.get_item("teams", 2) == {"id": 1}
+    assert not shared.is_closed
+
+    assert str(seen[0].url) == "http://ctfd.local/api/v1/users/1"
+    assert str(seen[1].url) == "http://other.local/api/v1/teams/2"
+    assert seen[1].headers["Authorization"] == "Token other"
+
+def test_lazy_client():
+    http = HTTPClient("http://ctfd.local/api/v1", "token", transport=httpx.MockTransport(
+        lambda request: httpx.Response(200, json={"success": True, "data": {"id": 1}})
+    ))
+    assert http._client is None
+
+    assert http.get_item("users", 1) == {"id": 1}
+    assert http._client is http.client
+    http.close()
+    assert http.client.is_closed
@@ -0,0 +1,63 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+from ctfdpy.ctfdpy.http import HTTPClient
+from ctfdpy.ctfdpy.singleflight import SingleFlight
+
+
+def test_single_flight_shares_result_and_errors():
+    flights = SingleFlight()
+    calls = 0
+    release = threading.Event()
+
+    def slow() -> int:
+        nonlocal calls
+        calls += 1
+        release.wait(1)
+        return calls
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(flights.do, "key", slow) for _ in range(4)]
+        time.sleep(0.05)
+        release.set()
+        assert [future.result() for future in futures] == [1, 1, 1, 1]
+    assert flights.shared == 3
+
+    release.clear()
+
+    def fail() -> None:
+        release.wait(1)
+        raise ValueError("boom")
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(flights.do, "key", fail) for _ in range(4)]
+        time.sleep(0.05)
+        release.set()
+        errors = []
+        for future in futures:
+            with pytest.raises(ValueError, match="boom"):
+                future.result()
+            errors.append(future.exception())
+    assert all(error is errors[0] for error in errors)
+    assert flights.shared == 6
+    assert flights.do("key", lambda: 2) == 2
+
+
+@patch("ctfdpy.ctfdpy.http.HTTPClient._call")
+def test_coalesced_get_item(mocker: MagicMock):
+    http = HTTPClient("http://localhost", "token", single_flight=True)
+
+    def call(endpoint, method, params=None, json=None, **_):
+        time.sleep(0.05)
+        return httpx.Response(200, json={"success": True, "data": {"id": 1}}, request=httpx.Request("GET", f"http://localhost/{endpoint}"))
+    mocker.side_effect = call
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda _: http.get_item("teams", 1), range(8)))
+    assert all(result is results[0] for result in results)
+    assert mocker.call_count == 1
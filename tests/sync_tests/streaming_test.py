@@ -0,0 +1,60 @@
+import json
+
+import httpx
+import pytest
+
+from ctfdpy.ctfdpy.ctfd import CTFDClient
+from ctfdpy.ctfdpy.exceptions import HTTPError, ParseRequestError
+from ctfdpy.ctfdpy.streaming import StreamParser
+
+
+def _body(page: int, pages: int) -> str:
+    users = [{"id": id, "name": f"user {id}", "score": 1.5e3, "fields": [{"value": "a,]}"}]} for id in range(page * 10, page * 10 + 10)]
+    # meta after data, as CTFd serializes it
+    return json.dumps({"success": True, "data": users, "meta": {"pagination": {"page": page, "pages": pages}}})
+
+
+@pytest.mark.parametrize("size", [1, 3, 7, 100, 10**6])
+def test_stream_parser_chunks(size: int):
+    body = _body(1, 4)
+    parser = StreamParser()
+    items = []
+    for start in range(0, len(body), size):
+        items += parser.feed(body[start:start + size])
+    parser.close()
+    assert items == json.loads(body)["data"]
+    assert parser.pages == 4
+    assert parser.fields["success"] is True
+
+
+def test_stream_parser_invalid():
+    parser = StreamParser()
+    parser.feed('{"success": true, "data": [1, 2')
+    with pytest.raises(ParseRequestError):
+        parser.close()
+    with pytest.raises(ParseRequestError):
+        StreamParser().feed('{"data": [1; 2]}')
+
+
+def test_stream_users():
+    requested = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params.get("page", 1))
+        requested.append((page, request.url.params.get("per_page")))
+        return httpx.Response(200, text=_body(page, 3))
+
+    with CTFDClient("http://ctfd.local/api/v1", "token", transport=httpx.MockTransport(handler)) as client:
+        users = list(client.users.stream_users(per_page=10))
+    assert [user.id for user in users] == list(range(10, 40))
+    assert users[0].name == "user 10"
+    assert requested == [(1, "10"), (2, "10"), (3, "10")]
+
+
+def test_stream_error():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(403, json={"success": False, "message": "Forbidden"})
+
+    client = CTFDClient("http://ctfd.local/api/v1", "token", transport=httpx.MockTransport(handler))
+    with client, pytest.raises(HTTPError):
+        list(client.users.stream_users())
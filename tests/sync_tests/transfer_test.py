@@ -0,0 +1,146 @@
+import csv
+import json
+from pathlib import Path
+
+import httpx
+import pytest
+
+from benchmarks.mock_ctfd import MockCTFd
+from ctfdpy.ctfdpy.ctfd import CTFDClient
+from ctfdpy.ctfdpy.transfer import export_teams, export_users, import_teams, import_users
+
+
+def _write_users(path: Path, names: range) -> None:
+    path.write_text("".join(
+        json.dumps({"name": f"user{i}", "email": f"user{i}@ctfd.io", "password": "password"}) + "\n" for i in names
+    ))
+
+
+def _posted(ctfd: MockCTFd, resource: str) -> list[dict]:
+    return [payload for method, path, payload in ctfd.log if (method, path) == ("POST", resource)]
+
+
+def test_export_users(tmp_path: Path):
+    ctfd = MockCTFd(per_page=2)
+    for i in range(1, 6):
+        ctfd.create("users", {"id": i, "name": f"user{i}", "email": f"user{i}@ctfd.io", "fields": [1]})
+    client = CTFDClient("http://localhost", "token", transport=ctfd.transport())
+
+    assert export_users(client, tmp_path / "users.jsonl") == 5
+    assert [json.loads(line)["id"] for line in (tmp_path / "users.jsonl").read_text().splitlines()] == [1, 2, 3, 4, 5]
+
+    assert export_users(client, tmp_path / "users.csv") == 5
+    rows = list(csv.DictReader((tmp_path / "users.csv").open()))
+    assert rows[0] == {"id": "1", "name": "user1", "email": "user1@ctfd.io", "fields": "[1]"}
+
+
+def test_resumable_import_users(tmp_path: Path):
+    def fail(request: httpx.Request, payload: dict) -> None:
+        if payload.get("name") == "user5":
+            raise httpx.ConnectError("connection lost", request=request)
+
+    source = tmp_path / "users.jsonl"
+    _write_users(source, range(10))
+    ctfd = MockCTFd(fault=fail)
+    client = CTFDClient("http://localhost", "token", transport=ctfd.transport(), concurrency=2)
+
+    report = import_users(client, source, chunk_size=4)
+    assert (report.created, report.skipped, list(report.errors)) == (9, 0, [5])
+    assert json.loads((tmp_path / "users.jsonl.checkpoint").read_text())["done"] == 10
+
+    _write_users(source, range(11))
+    report = import_users(client, source, chunk_size=4)
+    assert (report.created, report.skipped, list(report.errors)) == (1, 10, [5])
+    assert len(ctfd.resources["users"]) == 10
+
+
+def test_import_crash_resume(tmp_path: Path):
+    crashes = ["user6"]
+
+    def crash(request: httpx.Request, payload: dict) -> None:
+        # The process stops in the middle of the second chunk, after user4 and user5 were created
+        if payload.get("name") in crashes:
+            crashes.remove(payload["name"])
+            raise KeyboardInterrupt
+
+    source = tmp_path / "users.jsonl"
+    _write_users(source, range(10))
+    ctfd = MockCTFd(fault=crash)
+    client = CTFDClient("http://localhost", "token", transport=ctfd.transport())
+
+    with pytest.raises(KeyboardInterrupt):
+        import_users(client, source, chunk_size=4)
+    state = json.loads((tmp_path / "users.jsonl.checkpoint").read_text())
+    assert (state["done"], state["pending"]) == (4, 4)
+
+    report = import_users(client, source, chunk_size=4)
+    assert (report.created, report.skipped, report.errors) == (4, 6, {})
+    assert [user["name"] for user in _posted(ctfd, "users")] == [f"user{i}" for i in [0, 1, 2, 3, 4, 5, 6, 6, 7, 8, 9]]
+    assert sorted(user["name"] for user in ctfd.resources["users"].values()) == sorted(f"user{i}" for i in range(10))
+
+
+def test_import_malformed_records(tmp_path: Path, ctfd: MockCTFd):
+    source = tmp_path / "users.jsonl"
+    source.write_text("\n".join([
+        json.dumps({"name": "user0", "email": "user0@ctfd.io", "password": "password"}),
+        json.dumps({"name": "user1", "email": "user1@ctfd.io"}),
+        "{not json",
+        "[1, 2]",
+        json.dumps({"name": "user4", "email": "user4@ctfd.io", "password": "password", "unknown": 0}),
+    ]) + "\n")
+    client = CTFDClient("http://localhost", "token", transport=ctfd.transport())
+
+    report = import_users(client, source, chunk_size=10)
+    assert (report.created, list(report.errors)) == (2, [1, 2, 3])
+    assert "password" in report.errors[1]
+    assert json.loads((tmp_path / "users.jsonl.checkpoint").read_text())["done"] == 5
+
+    report = import_users(client, source, chunk_size=10)
+    assert (report.created, report.skipped, list(report.errors)) == (0, 5, [1, 2, 3])
+
+
+def test_import_teams_csv(tmp_path: Path, ctfd: MockCTFd):
+    source = tmp_path / "teams.csv"
+    with source.open("w", newline="") as file:
+        writer = csv.DictWriter(file, ["name", "password", "members"])
+        writer.writeheader()
+        writer.writerow({"name": "team1", "password": "password", "members": json.dumps([
+            {"name": "user1", "email": "user1@ctfd.io", "password": "password"},
+            {"name": "user2", "email": "user2@ctfd.io", "password": "password"},
+        ])})
+        writer.writerow({"name": "team2", "password": "password"})
+    client = CTFDClient("http://localhost", "token", transport=ctfd.transport())
+
+    report = import_teams(client, source)
+    assert (report.created, report.errors) == (2, {})
+    assert ctfd.resources["teams"][1]["members"] == [1, 2]
+
+
+def test_round_trip(tmp_path: Path, ctfd: MockCTFd):
+    source = MockCTFd()
+    source.create("users", {
+        "name": "alice", "email": "alice@ctfd.io", "affiliation": "University", "country": "FR",
+        "website": "https://alice.io", "bracket_id": 2, "score": 100, "team_id": 1,
+    })
+    source.create("teams", {
+        "name": "team", "email": "team@ctfd.io", "affiliation": "University", "country": "FR",
+        "website": "https://team.io", "bracket_id": 3, "score": 100,
+    })
+    export_users(CTFDClient("http://localhost", "token", transport=source.transport()), tmp_path / "users.jsonl")
+    export_teams(CTFDClient("http://localhost", "token", transport=source.transport()), tmp_path / "teams.jsonl")
+    # CTFd never exports passwords, they are set before importing
+    for name in ("users.jsonl", "teams.jsonl"):
+        records = [json.loads(line) | {"password": "password"} for line in (tmp_path / name).read_text().splitlines()]
+        (tmp_path / name).write_text("".join(json.dumps(record) + "\n" for record in records))
+
+    client = CTFDClient("http://localhost", "token", transport=ctfd.transport())
+    assert import_users(client, tmp_path / "users.jsonl").created == 1
+    assert import_teams(client, tmp_path / "teams.jsonl").created == 1
+    assert _posted(ctfd, "users") == [{
+        "name": "alice", "email": "alice@ctfd.io", "password": "password", "affiliation": "University",
+        "country": "FR", "website": "https://alice.io", "bracket_id": 2,
+    }]
+    assert _posted(ctfd, "teams") == [{
+        "name": "team", "password": "password", "email": "team@ctfd.io", "website": "https://team.io",
+        "country": "FR", "bracket_id": 3, "affiliation": "University",
+    }]
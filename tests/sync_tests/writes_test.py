@@ -0,0 +1,55 @@
+import time
+
+import httpx
+import pytest
+
+from benchmarks.mock_ctfd import BASE_URL, MockCTFd
+from ctfdpy.ctfdpy.ctfd import CTFDClient
+from ctfdpy.ctfdpy.exceptions import HTTPError
+
+
+def _reject_bracket(request: httpx.Request, payload: dict) -> httpx.Response | None:
+    if request.method == "PATCH" and payload.get("bracket_id") == -1:
+        return httpx.Response(400, json={"success": False, "errors": {"bracket_id": ["invalid"]}})
+    return None
+
+
+def _patches(ctfd: MockCTFd) -> list[tuple[str, dict]]:
+    return [(path, payload) for method, path, payload in ctfd.log if method == "PATCH"]
+
+
+def test_patch_queue_coalesces():
+    ctfd = MockCTFd(users=3, teams=1)
+    client = CTFDClient(BASE_URL, "token", transport=ctfd.transport(), concurrency=4)
+
+    with client.http.patch_queue(max_delay=None) as queue:
+        captain = client.teams.attach_member(1, 1, is_captain=True, queue=queue)
+        hidden = client.teams.update_team(1, queue=queue, hidden=True)
+        banned = [client.users.update_user(id, queue=queue, banned=True) for id in range(1, 4)]
+        assert len(queue) == 4 and _patches(ctfd) == []
+
+    assert sorted(_patches(ctfd)) == [
+        ("teams/1", {"captain_id": 1, "hidden": True}),
+        ("users/1", {"banned": True}),
+        ("users/2", {"banned": True}),
+        ("users/3", {"banned": True}),
+    ]
+    assert captain is not None and captain.result() is hidden.result()
+    assert [future.result()["id"] for future in banned] == [1, 2, 3]
+    assert (queue.operations, queue.requests) == (5, 4)
+
+
+def test_patch_queue_flush_triggers():
+    ctfd = MockCTFd(users=3, fault=_reject_bracket)
+    client = CTFDClient(BASE_URL, "token", transport=ctfd.transport())
+
+    queue = client.http.patch_queue(max_pending=2, max_delay=0.01)
+    queue.patch("users", 1, {"hidden": True})
+    queue.patch("users", 2, {"hidden": True})
+    assert len(_patches(ctfd)) == 2
+
+    failed = queue.patch("users", 3, {"bracket_id": -1})
+    with pytest.raises(HTTPError):
+        failed.result(timeout=1)
+    time.sleep(0.01)
+    assert len(queue) == 0 and len(_patches(ctfd)) == 3